@@ -4,21 +4,32 @@ PDF 자동 이메일 발송 프로그램 (GUI 버전 - 내장 설정)
 """
 
 import copy
+import io
+from email.generator import BytesGenerator
+from email.utils import getaddresses
 from email.mime.application import MIMEApplication
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 import socket
 import smtplib
-from datetime import datetime
+import ssl
+from datetime import datetime, timedelta
 import re
 import json
 import webbrowser
 import logging
 from pathlib import Path
 import time
+import heapq
+import itertools
+import random
 import os
 import sys
 import threading
+import multiprocessing
+import queue
+from collections import ChainMap, deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait as wait_futures, FIRST_COMPLETED
 from tkinter import ttk, scrolledtext, messagebox, filedialog
 import tkinter as tk
 import ctypes
@@ -88,18 +99,43 @@ class ConfigManager:
                 'smtp_server': 'smtp.gmail.com',
                 'smtp_port': 587,
                 'sender_email': '',
-                'sender_password': ''
+                'sender_password': '',
+                # 추가 발신 계정 (일일 한도 분산용)
+                # [{'smtp_server': ..., 'smtp_port': ..., 'sender_email': ..., 'sender_password': ..., 'enabled': True}]
+                'accounts': []
             },
             'pattern': r'^([가-힣A-Za-z0-9\s]+?)(?:___|\.pdf$)',
             'auto_select_timeout': 10,
             'auto_send_timeout': 10,
-            'email_send_timeout': 180,  # 이메일 발송 최대 대기 시간 (초)
+            'message_deadline_base': 60,  # 메일 1건 기본 제한 시간 (초, 여기에 크기에 따른 업로드 시간이 더해짐)
+            'message_deadline_min_rate': 50,  # 업로드 속도를 아직 모를 때 가정하는 속도 (KB/s)
+            'retry_max_attempts': 3,  # 회사별 최대 발송 시도 횟수 (첫 시도 포함)
+            'retry_backoff_base': 2,  # 첫 재시도 대기 시간 (초, 실패할 때마다 2배)
+            'retry_backoff_max': 60,  # 재시도 대기 시간 상한 (초)
+            'connection_trust_window': 30,  # 이 시간(초) 안에 사용한 연결은 확인(NOOP) 없이 재사용
+            'max_concurrency': 4,  # 최대 동시 발송 수 (서버 응답에 따라 1부터 자동 조절)
+            'queue_order': 'original',  # 발송 순서 (QUEUE_ORDERS의 키)
+            'log_max_lines': 5000,  # 화면에 남길 최대 로그 줄 수 (넘으면 오래된 줄부터 한꺼번에 삭제)
+            'log_history_days': 30,  # 로그 기록 파일 보관 일수 (전체 로그는 logs 폴더에 날짜별로 저장)
+            'run_log_max_mb': 10,  # 발송 기록(JSONL) 파일 하나의 최대 크기 (MB, 넘으면 다음 파일로)
+            'render_timestamp': '',  # 양식 날짜/시간 변수 고정 시각 ('YYYY-MM-DD HH:MM', 비우면 발송 시작 시각)
+            'circuit_failure_threshold': 3,  # 연결 실패가 연속 몇 번이면 서버 발송을 멈출지
+            'circuit_probe_interval': 15,  # 멈춘 뒤 시험 발송까지 대기 시간 (초, 실패할 때마다 2배)
+            'circuit_give_up_after': 600,  # 서버 장애가 이 시간(초) 넘게 이어지면 남은 발송을 실패 처리
             'debug_mode': False,
+            'log_level_scan': '',  # PDF 분석 로그 레벨 (DEBUG/INFO/WARNING/ERROR, 비우면 디버그 모드를 따름)
+            'log_level_smtp': '',  # SMTP 연결·발송 로그 레벨 (비우면 디버그 모드를 따름)
+            'log_level_fs': '',  # 파일 이동·폴더 로그 레벨 (비우면 디버그 모드를 따름)
             'create_folders': False,
             'pdf_folder': str(Path.cwd()),
             'completed_folder': str(Path.cwd()),
-            'companies': {},  # {회사명: {'emails': [], 'template': 'A'}}
+            # {회사명: {'emails': [], 'template': 'A', 'account': 발신 계정 고정(선택),
+            #          'priority': 발송 우선순위(선택, 클수록 먼저), 'deadline': 'HH:MM' 마감 시각(선택),
+            #          'variables': {변수명: '값'} 회사 변수(선택, 커스텀 변수보다 우선)}}
+            'companies': {},
             'custom_variables': {},  # {변수명: '값'} 예: {'이름': '홍길동', '담당자1': '김철수'}
+            'rate_limits': {},  # 발송 한도 변경 {서비스명: {항목: 값}} 예: {'Gmail': {'recipients_per_day': 2000}}
+            'rejected_emails': {},  # 서버가 영구 거부(5xx)한 주소 {주소: {'code': 550, 'message': '...', 'date': 'YYYY-MM-DD'}}
             'email_templates': {
                 '공식 보고서': {
                     'subject': '[{회사명}] {날짜} 업무 보고',
@@ -223,6 +259,2118 @@ class ConfigManager:
         self.config = self.load_config()
 
 
+# 이메일 서비스별 SMTP 서버/포트
+EMAIL_SERVICES = {
+    "Gmail (TLS)": ("smtp.gmail.com", 587),
+    "Gmail (SSL)": ("smtp.gmail.com", 465),
+    "Naver": ("smtp.naver.com", 587),
+    "Daum": ("smtp.daum.net", 465),
+    "Outlook": ("smtp-mail.outlook.com", 587),
+}
+
+# 이메일 서비스별 발송 한도 프로필 (0: 제한 없음)
+# - messages_per_minute: 분당 메시지 수
+# - burst: 연속으로 바로 보낼 수 있는 메시지 수
+# - recipients_per_day: 일일 수신자 수
+# - bytes_per_hour: 시간당 전송량 (바이트)
+# - max_connections: 계정당 동시 SMTP 연결 수
+PROVIDER_QUOTA_PROFILES = {
+    'Gmail': {'messages_per_minute': 20, 'burst': 3,
+              'recipients_per_day': 500, 'bytes_per_hour': 1024 * 1024 * 1024,
+              'max_connections': 3},
+    'Naver': {'messages_per_minute': 10, 'burst': 2,
+              'recipients_per_day': 500, 'bytes_per_hour': 300 * 1024 * 1024,
+              'max_connections': 2},
+    'Daum': {'messages_per_minute': 10, 'burst': 2,
+             'recipients_per_day': 500, 'bytes_per_hour': 300 * 1024 * 1024,
+             'max_connections': 2},
+    'Outlook': {'messages_per_minute': 30, 'burst': 3,
+                'recipients_per_day': 300, 'bytes_per_hour': 500 * 1024 * 1024,
+                'max_connections': 3},
+    '직접 입력': {'messages_per_minute': 30, 'burst': 5,
+              'recipients_per_day': 0, 'bytes_per_hour': 0,
+              'max_connections': 4},
+}
+
+
+def detect_email_service_name(server, port):
+    """서버/포트로 이메일 서비스 이름 감지 (목록에 없으면 '직접 입력')"""
+    try:
+        port = int(port)
+    except (TypeError, ValueError):
+        return "직접 입력"
+
+    for service, (service_server, service_port) in EMAIL_SERVICES.items():
+        if server == service_server and port == service_port:
+            return service
+    return "직접 입력"
+
+
+def get_quota_profile(server, port, overrides=None):
+    """서버/포트에 해당하는 발송 한도 프로필 반환
+
+    overrides: 설정의 'rate_limits' ({서비스명 또는 제공자명: {항목: 값}})
+    """
+    service = detect_email_service_name(server, port)
+    provider = service.split(' (')[0]  # "Gmail (TLS)" → "Gmail"
+    profile = dict(PROVIDER_QUOTA_PROFILES.get(
+        provider, PROVIDER_QUOTA_PROFILES['직접 입력']))
+
+    overrides = overrides or {}
+    for key in (provider, service):
+        if isinstance(overrides.get(key), dict):
+            profile.update(overrides[key])
+
+    profile['provider'] = provider
+    return profile
+
+
+class TokenBucket:
+    """토큰 버킷 (최대 capacity개까지 모아두고 초당 refill_rate개씩 채움)"""
+
+    def __init__(self, capacity, refill_rate):
+        self.capacity = float(capacity)
+        self.refill_rate = float(refill_rate)
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+
+    def _refill(self, now):
+        elapsed = now - self.updated
+        if elapsed > 0:
+            self.tokens = min(self.capacity,
+                              self.tokens + elapsed * self.refill_rate)
+            self.updated = now
+
+    def wait_time(self, amount, now=None):
+        """amount만큼 사용할 수 있을 때까지 남은 시간(초)"""
+        now = time.monotonic() if now is None else now
+        self._refill(now)
+        # 버킷보다 큰 요청은 버킷이 가득 찼을 때 허용 (영원히 대기 방지)
+        amount = min(float(amount), self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.refill_rate
+
+    def consume(self, amount, now=None):
+        now = time.monotonic() if now is None else now
+        self._refill(now)
+        self.tokens -= min(float(amount), self.capacity)
+
+
+class SendQuotaStore:
+    """계정별 일일 발송량 기록 (프로그램 재시작 후에도 유지)"""
+
+    def __init__(self, state_file):
+        self.state_file = Path(state_file)
+        self.lock = threading.Lock()
+        self.state = self._load()
+
+    def _load(self):
+        try:
+            if self.state_file.exists():
+                with open(self.state_file, 'r', encoding='utf-8') as f:
+                    state = json.load(f)
+                if isinstance(state, dict):
+                    return state
+        except Exception as e:
+            logging.error(f"발송량 기록 로드 오류: {e}")
+        return {}
+
+    def _save(self):
+        try:
+            with open(self.state_file, 'w', encoding='utf-8') as f:
+                json.dump(self.state, f, indent=2, ensure_ascii=False)
+        except Exception as e:
+            logging.error(f"발송량 기록 저장 오류: {e}")
+
+    def _today_entry(self, account_key):
+        """오늘 날짜의 계정 기록 (날짜가 바뀌었으면 초기화)"""
+        today = datetime.now().strftime('%Y-%m-%d')
+        entry = self.state.get(account_key)
+        if not isinstance(entry, dict) or entry.get('date') != today:
+            entry = {'date': today, 'messages': 0, 'recipients': 0, 'bytes': 0}
+            self.state[account_key] = entry
+        return entry
+
+    def get_today(self, account_key):
+        """오늘 사용량 반환"""
+        with self.lock:
+            return dict(self._today_entry(account_key))
+
+    def add(self, account_key, recipients, nbytes):
+        """발송량 추가 후 파일에 저장"""
+        with self.lock:
+            entry = self._today_entry(account_key)
+            entry['messages'] += 1
+            entry['recipients'] += recipients
+            entry['bytes'] += nbytes
+            self._save()
+
+
+class SendRateLimiter:
+    """계정별 발송 속도 제한 (분당 메시지, 일일 수신자, 시간당 전송량)"""
+
+    def __init__(self, account_key, profile, quota_store):
+        self.account_key = account_key
+        self.profile = profile
+        self.quota_store = quota_store
+        self.lock = threading.Lock()
+        self.reserved = 0  # 발송 중이라 아직 기록되지 않은 수신자 수 (동시 발송이 한도를 넘지 않도록)
+
+        per_minute = profile.get('messages_per_minute', 0)
+        self.message_bucket = TokenBucket(
+            max(1, profile.get('burst', 1)), per_minute / 60.0) if per_minute > 0 else None
+
+        per_hour = profile.get('bytes_per_hour', 0)
+        self.byte_bucket = TokenBucket(
+            per_hour, per_hour / 3600.0) if per_hour > 0 else None
+
+    def remaining_recipients_today(self):
+        """오늘 남은 수신자 수 (제한 없으면 None, 발송 중인 수신자도 뺌)"""
+        with self.lock:
+            return self._remaining_recipients()
+
+    def _remaining_recipients(self):
+        # lock 안에서 호출
+        daily_limit = self.profile.get('recipients_per_day', 0)
+        if daily_limit <= 0:
+            return None
+        used = self.quota_store.get_today(self.account_key)['recipients']
+        return max(0, daily_limit - used - self.reserved)
+
+    def reserve(self, recipients, nbytes):
+        """발송 가능할 때까지 남은 시간(초). 일일 한도를 넘으면 None
+
+        0을 반환하면 수신자 수만큼 한도를 미리 차지합니다.
+        발송이 끝나면 record_sent로 기록한 뒤 release로 돌려줘야 합니다.
+        """
+        with self.lock:
+            # 한도 확인과 차지를 한 번에 해서 동시에 발송하는 작업들이 함께 통과하지 않도록
+            remaining = self._remaining_recipients()
+            if remaining is not None and recipients > remaining:
+                return None
+
+            now = time.monotonic()
+            wait = 0.0
+            if self.message_bucket:
+                wait = max(wait, self.message_bucket.wait_time(1, now))
+            if self.byte_bucket:
+                wait = max(wait, self.byte_bucket.wait_time(nbytes, now))
+            if wait <= 0:
+                if self.message_bucket:
+                    self.message_bucket.consume(1, now)
+                if self.byte_bucket:
+                    self.byte_bucket.consume(nbytes, now)
+                self.reserved += recipients
+            return wait
+
+    def release(self, recipients):
+        """reserve로 차지한 한도 반환 (발송 결과와 관계없이, record_sent 뒤에 호출)"""
+        with self.lock:
+            self.reserved = max(0, self.reserved - recipients)
+
+    def wait_estimate(self, nbytes):
+        """지금 발송하려면 기다려야 하는 시간(초) - 토큰은 사용하지 않음"""
+        with self.lock:
+            now = time.monotonic()
+            wait = 0.0
+            if self.message_bucket:
+                wait = max(wait, self.message_bucket.wait_time(1, now))
+            if self.byte_bucket:
+                wait = max(wait, self.byte_bucket.wait_time(nbytes, now))
+            return wait
+
+    def acquire(self, recipients, nbytes, log_func=None, stop_event=None):
+        """발송 가능할 때까지 대기 (일일 한도 초과 또는 중단 시 False)
+
+        True를 반환하면 recipients만큼 한도를 차지한 상태입니다 (release로 반환).
+        """
+        logged = False
+        while True:
+            wait = self.reserve(recipients, nbytes)
+            if wait is None:
+                return False
+            if wait <= 0:
+                return True
+            if log_func and not logged and wait >= 1:
+                log_func(f"   ⏳ 발송 속도 제한: {wait:.1f}초 대기", 'INFO')
+                logged = True
+            if stop_event is not None:
+                if stop_event.wait(min(wait, 1.0)):
+                    return False
+            else:
+                time.sleep(min(wait, 1.0))
+
+    def record_sent(self, recipients, nbytes):
+        """발송 완료된 수신자 수와 전송량 기록"""
+        self.quota_store.add(self.account_key, recipients, nbytes)
+
+
+def estimate_message_size(body, pdf_paths):
+    """첨부 파일(base64 인코딩)을 포함한 메시지 크기 추정 (바이트)"""
+    attachment_size = sum(pdf_path.stat().st_size for pdf_path in pdf_paths)
+    # base64는 4/3배, 76자마다 줄바꿈 추가
+    return int(attachment_size * 4 / 3 * 78 / 76) + len(body.encode('utf-8')) + 2048
+
+
+DEADLINE_SLACK = 3  # 예상 업로드 시간의 몇 배까지 기다릴지
+
+
+def message_deadline(nbytes, upload_rate=None, base=60, min_rate=50 * 1024):
+    """메일 1건의 제한 시간 (초)
+
+    기본 시간(연결·응답 대기) + 예상 업로드 시간 x DEADLINE_SLACK.
+    upload_rate는 이번 발송에서 측정한 업로드 속도(bytes/s)이고, 아직 없으면 min_rate를 사용합니다.
+    """
+    rate = upload_rate or min_rate
+    return base + DEADLINE_SLACK * nbytes / max(rate, 1)
+
+
+class RetryScheduler:
+    """발송 작업 대기열 (실패한 작업은 지수 백오프 + 지터 후 다시 실행)
+
+    재시도를 기다리는 동안 다른 회사의 작업은 계속 발송됩니다.
+    실행 가능한 작업이 여러 개면 order_key(작업)가 작은 것부터 꺼냅니다 (없으면 넣은 순서).
+    """
+
+    def __init__(self, max_attempts=3, backoff_base=2.0, backoff_max=60.0, order_key=None):
+        self.max_attempts = max(1, int(max_attempts))
+        self.backoff_base = max(0.0, float(backoff_base))
+        self.backoff_max = max(0.0, float(backoff_max))
+        self.order_key = order_key
+        self.heap = []   # 대기 중: (실행 가능 시각, 순번, 작업)
+        self.ready = []  # 실행 가능: (순서 키, 순번, 작업)
+        self.counter = itertools.count()
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        with self.lock:
+            return len(self.heap) + len(self.ready)
+
+    def _promote(self):
+        """실행 가능해진 작업을 순서 키 힙으로 옮김 (lock 안에서 호출)"""
+        now = time.monotonic()
+        while self.heap and self.heap[0][0] <= now:
+            _, seq, job = heapq.heappop(self.heap)
+            key = self.order_key(job) if self.order_key else ()
+            heapq.heappush(self.ready, (key, seq, job))
+
+    def push(self, job, delay=0.0):
+        """작업 추가 (delay초 후 실행 가능)"""
+        with self.lock:
+            heapq.heappush(
+                self.heap, (time.monotonic() + delay, next(self.counter), job))
+
+    def backoff_delay(self, attempt):
+        """attempt번째 실패 후 대기 시간 (지수 증가, 상한 적용, 지터 포함)"""
+        delay = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+        # 동시에 실패한 작업이 한꺼번에 재시도하지 않도록 절반~전체 범위에서 무작위 선택
+        return random.uniform(delay / 2, delay)
+
+    def reschedule(self, job):
+        """실패한 작업을 다시 대기열에 넣음. 최대 시도 횟수에 도달했으면 None 반환"""
+        if job['attempt'] >= self.max_attempts:
+            return None
+        delay = self.backoff_delay(job['attempt'])
+        self.push(job, delay)
+        return delay
+
+    def pop_ready(self):
+        """지금 실행 가능한 작업 중 순서가 가장 앞선 것 꺼내기 (없으면 None)"""
+        with self.lock:
+            self._promote()
+            if self.ready:
+                return heapq.heappop(self.ready)[2]
+            return None
+
+    def next_ready_in(self):
+        """다음 작업이 실행 가능해질 때까지 남은 시간(초). 대기열이 비었으면 None"""
+        with self.lock:
+            if self.ready:
+                return 0.0
+            if not self.heap:
+                return None
+            return max(0.0, self.heap[0][0] - time.monotonic())
+
+    def pending_jobs(self):
+        """대기 중인 작업 목록 (발송될 순서대로 - 실행 가능한 작업 먼저)"""
+        with self.lock:
+            self._promote()
+            return [job for _, _, job in sorted(self.ready)] + \
+                   [job for _, _, job in sorted(self.heap)]
+
+    def drain(self):
+        """대기 중인 작업을 모두 꺼냄 (발송 중지 시)"""
+        with self.lock:
+            jobs = [job for _, _, job in sorted(self.ready)] + \
+                   [job for _, _, job in sorted(self.heap)]
+            self.heap = []
+            self.ready = []
+            return jobs
+
+
+# 발송 순서 정책 {키: 표시 이름}
+QUEUE_ORDERS = {
+    'original': "PDF 분석 순서",
+    'smallest_first': "용량 작은 회사 먼저",
+    'largest_first': "용량 큰 회사 먼저",
+    'priority': "회사별 우선순위 (클수록 먼저)",
+    'deadline': "마감 시각 빠른 회사 먼저",
+}
+
+
+def parse_deadline(text, now=None):
+    """'HH:MM' 마감 시각을 오늘 날짜의 datetime으로 변환 (비었거나 형식이 틀리면 None)"""
+    if not text:
+        return None
+    try:
+        parsed = datetime.strptime(str(text).strip(), '%H:%M')
+    except ValueError:
+        return None
+    now = now or datetime.now()
+    return now.replace(hour=parsed.hour, minute=parsed.minute, second=0, microsecond=0)
+
+
+def queue_order_key(order, job, company_info):
+    """발송 순서 정책에 따른 작업의 정렬 키 (작을수록 먼저, 같으면 PDF 분석 순서)"""
+    index = job['index']
+    if order == 'smallest_first':
+        return (job['message_size'], index)
+    if order == 'largest_first':
+        return (-job['message_size'], index)
+    if order == 'priority':
+        try:
+            priority = int(company_info.get('priority', 0) or 0)
+        except (TypeError, ValueError):
+            priority = 0
+        return (-priority, index)
+    if order == 'deadline':
+        deadline = parse_deadline(company_info.get('deadline'))
+        return (deadline.timestamp() if deadline else float('inf'), index)
+    return (index,)
+
+
+ETA_DEFAULT_RATE = 200 * 1024   # 업로드 속도를 아직 모를 때 가정하는 속도 (bytes/s)
+ETA_DEFAULT_OVERHEAD = 3.0      # 업로드 외 메일 1건당 시간 (연결·명령 응답, 초)
+
+
+def estimate_schedule(jobs, concurrency, upload_rate=None, overhead=None, busy=()):
+    """대기열 순서대로 동시 발송 슬롯에 작업을 배정해서 예상 완료 시간 계산
+
+    busy: 이미 발송 중인 작업들의 남은 예상 시간(초) - 해당 슬롯은 그만큼 늦게 비어 있음
+    Returns: ([(작업, 지금부터 완료까지 예상 초)], 전체 남은 예상 초)
+    """
+    rate = upload_rate or ETA_DEFAULT_RATE
+    overhead = ETA_DEFAULT_OVERHEAD if overhead is None else overhead
+    slots = sorted(busy)
+    slots += [0.0] * (max(1, concurrency) - len(slots))
+    schedule = []
+    for job in jobs:
+        slot = min(range(len(slots)), key=slots.__getitem__)
+        slots[slot] += overhead + job['message_size'] / rate
+        schedule.append((job, slots[slot]))
+    return schedule, max(slots)
+
+
+def format_duration(seconds):
+    """남은 시간 표시 (예: '약 3분 20초')"""
+    seconds = int(round(seconds))
+    if seconds < 60:
+        return f"약 {seconds}초"
+    minutes, seconds = divmod(seconds, 60)
+    if minutes < 60:
+        return f"약 {minutes}분 {seconds}초" if seconds else f"약 {minutes}분"
+    hours, minutes = divmod(minutes, 60)
+    return f"약 {hours}시간 {minutes}분"
+
+
+class SendCancelledError(Exception):
+    """사용자가 발송을 중지함 (메일 업로드 도중 포함)"""
+
+
+class SendJobControl:
+    """발송 작업 제어 (일시정지·재개·중지)
+
+    GUI 스레드에서 pause/resume/cancel을 호출하고, 발송 스레드는 메일 사이마다 상태를 확인합니다.
+    일시정지는 진행 중인 메일을 끝까지 보낸 뒤 적용되고,
+    중지는 업로드 중인 메일도 멈춥니다 (cancel_event를 넘겨받은 곳에서 확인).
+    """
+
+    def __init__(self):
+        self.cancel_event = threading.Event()
+        self.resume_event = threading.Event()
+        self.resume_event.set()
+
+    @property
+    def cancelled(self):
+        return self.cancel_event.is_set()
+
+    @property
+    def paused(self):
+        return not self.resume_event.is_set() and not self.cancelled
+
+    def pause(self):
+        self.resume_event.clear()
+
+    def resume(self):
+        self.resume_event.set()
+
+    def cancel(self):
+        self.cancel_event.set()
+        self.resume_event.set()  # 일시정지 중이어도 바로 멈추도록
+
+
+PROGRESS_FRAME_MS = 200       # 발송 진행 표시 갱신 주기
+PROGRESS_RATE_WINDOW = 5.0    # 업로드 속도를 계산하는 최근 구간 (초)
+
+
+class SendProgress:
+    """발송 진행 카운터 (화면의 발송 진행 표시용)
+
+    발송 스레드들은 잠금 안에서 숫자만 바꾸고, 화면은 PROGRESS_FRAME_MS마다
+    snapshot()으로 한 번에 복사해서 그립니다. 로그 줄을 고쳐 쓰지 않으므로
+    다른 로그와 섞이지 않고, 업로드가 빨라도 화면 갱신 횟수는 일정합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.total = 0          # 전체 메일 수
+        self.total_bytes = 0    # 전체 메일 크기 (예상)
+        self.sent = 0           # 발송 완료한 메일 수
+        self.failed = 0         # 최종 실패한 메일 수
+        self.done_bytes = 0     # 끝난 메일의 크기 합
+        self.uploaded = 0       # 실제로 올린 바이트 (재시도 포함, 속도 계산용)
+        self.active = {}        # {작업 키: {'company', 'sent', 'size', 'started'}}
+        self.started = time.monotonic()
+        self.finished = None    # 발송이 끝난 시각
+        self.eta = None         # (남은 예상 시간(초), 계산한 시각)
+
+    def begin(self, total, total_bytes):
+        """발송할 메일 수와 전체 크기 설정 (대기열을 만든 뒤)"""
+        with self._lock:
+            self.total = total
+            self.total_bytes = total_bytes
+
+    def start_message(self, key, company, size):
+        """메일 업로드 시작"""
+        with self._lock:
+            self.active[key] = {'company': company, 'sent': 0, 'size': size,
+                                'started': time.monotonic()}
+
+    def update(self, key, sent, size):
+        """업로드 진행 (send_message_timed의 progress 콜백, sent는 지금까지 보낸 바이트)"""
+        with self._lock:
+            entry = self.active.get(key)
+            if entry is None:
+                return
+            self.uploaded += sent - entry['sent']
+            entry['sent'] = sent
+            entry['size'] = size
+
+    def end_message(self, key):
+        """발송 시도가 끝남 (결과와 관계없이 진행 중 목록에서 제거)"""
+        with self._lock:
+            self.active.pop(key, None)
+
+    def complete(self, size, success):
+        """메일의 최종 결과 반영 (다시 보낼 메일은 호출하지 않음)"""
+        with self._lock:
+            if success:
+                self.sent += 1
+            else:
+                self.failed += 1
+            self.done_bytes += size
+
+    def set_eta(self, seconds):
+        """남은 예상 시간 갱신 (화면에서는 다음 갱신까지 줄어드는 값으로 표시)"""
+        with self._lock:
+            self.eta = (seconds, time.monotonic())
+
+    def finish(self):
+        with self._lock:
+            self.finished = time.monotonic()
+            self.eta = None
+
+    def snapshot(self):
+        """현재 값의 복사본 (화면 갱신 때 한 번만 호출)"""
+        with self._lock:
+            now = time.monotonic()
+            eta = None
+            if self.eta is not None:
+                eta = max(0.0, self.eta[0] - (now - self.eta[1]))
+            active = sorted((dict(entry) for entry in self.active.values()),
+                            key=lambda entry: entry['started'])
+            return {'total': self.total, 'total_bytes': self.total_bytes,
+                    'sent': self.sent, 'failed': self.failed,
+                    'done_bytes': self.done_bytes, 'uploaded': self.uploaded,
+                    'active': active, 'eta': eta, 'now': now,
+                    'elapsed': (self.finished or now) - self.started,
+                    'finished': self.finished is not None}
+
+
+def get_sender_accounts(config_manager):
+    """발신 계정 목록 (기본 계정 + 사용 중인 추가 계정, 중복 주소 제외)"""
+    accounts = [{
+        'smtp_server': config_manager.get('email.smtp_server'),
+        'smtp_port': config_manager.get('email.smtp_port'),
+        'sender_email': config_manager.get('email.sender_email'),
+        'sender_password': config_manager.get('email.sender_password'),
+        'primary': True
+    }]
+    seen = {accounts[0]['sender_email']}
+    for account in config_manager.get('email.accounts', []) or []:
+        sender_email = account.get('sender_email', '')
+        if not account.get('enabled', True) or not sender_email or sender_email in seen:
+            continue
+        seen.add(sender_email)
+        accounts.append({
+            'smtp_server': account.get('smtp_server', ''),
+            'smtp_port': account.get('smtp_port', 587),
+            'sender_email': sender_email,
+            'sender_password': account.get('sender_password', ''),
+            'primary': False
+        })
+    return accounts
+
+
+class SenderAccountPool:
+    """발신 계정 묶음 (남은 일일 한도와 최근 전송 시간을 보고 계정 선택)
+
+    계정마다 SMTP 연결을 따로 가지고 있으며, 동시에 발송할 때는
+    계정별 최대 연결 수(max_connections)까지 연결을 늘려 사용합니다.
+    """
+
+    LATENCY_WEIGHT = 0.3  # 전송 시간 이동 평균에서 새 측정값의 비중
+
+    def __init__(self):
+        self.accounts = []
+        self.lock = threading.Lock()
+
+    def add(self, settings, rate_limiter, connection=None):
+        """계정 추가 (connection: 처음부터 쓸 수 있는 연결 상태, 없으면 필요할 때 만듦)"""
+        account = dict(settings)
+        account.update({
+            'key': settings['sender_email'],
+            'rate_limiter': rate_limiter,
+            'idle_connections': [connection] if connection is not None else [],
+            'all_connections': [connection] if connection is not None else [],
+            'sessions': 0,  # 사용 중인 연결 수
+            'max_sessions': max(1, rate_limiter.profile.get('max_connections', 1)),
+            'latency': None,  # 메시지 1건 평균 전송 시간 (초)
+            'sent': 0         # 이번 발송에서 보낸 메시지 수
+        })
+        self.accounts.append(account)
+        return account
+
+    def get(self, key):
+        """발신 주소로 계정 찾기"""
+        for account in self.accounts:
+            if account['key'] == key:
+                return account
+        return None
+
+    def _score(self, account, recipients, nbytes):
+        """선택 점수 (작을수록 우선). 일일 한도가 부족하면 None"""
+        limiter = account['rate_limiter']
+        remaining = limiter.remaining_recipients_today()
+        if remaining is not None and remaining < recipients:
+            return None
+        daily_limit = limiter.profile.get('recipients_per_day', 0)
+        quota_ratio = 1.0 if remaining is None else remaining / daily_limit
+        # 아직 전송 시간이 측정되지 않은 계정은 먼저 써 봄
+        latency = account['latency'] or 0.0
+        wait = limiter.wait_estimate(nbytes)
+        return ((latency + wait) / max(quota_ratio, 0.01), -quota_ratio)
+
+    def candidates(self, pinned=None):
+        """발송에 쓸 수 있는 계정 목록 (pinned가 있으면 그 계정만)"""
+        if pinned:
+            account = self.get(pinned)
+            return [account] if account else []
+        return list(self.accounts)
+
+    def select(self, recipients, nbytes, pinned=None):
+        """발송에 사용할 계정 선택 (pinned가 있으면 그 계정만)
+
+        Returns:
+            tuple: (계정, 상태) - 상태는 'ok', 'busy'(한도는 남았지만 연결이 모두 사용 중),
+                   'blocked'(서버 차단기가 열려 있음), 'exhausted'(남은 한도가 있는 계정 없음) 중 하나
+        """
+        with self.lock:
+            best, best_score, busy, blocked = None, None, False, False
+            for account in self.candidates(pinned):
+                score = self._score(account, recipients, nbytes)
+                if score is None:
+                    continue
+                breaker = account.get('breaker')
+                if breaker is not None and not breaker.available():
+                    blocked = True
+                    continue
+                if account['sessions'] >= account['max_sessions']:
+                    busy = True
+                    continue
+                if best_score is None or score < best_score:
+                    best, best_score = account, score
+            if best is not None:
+                return best, 'ok'
+            if busy:
+                return None, 'busy'
+            return None, ('blocked' if blocked else 'exhausted')
+
+    def blocked_breakers(self, recipients, nbytes, pinned=None):
+        """select()가 'blocked'를 돌려준 원인이 된 차단기 목록
+
+        한도가 남은 계정 중 차단기가 열려 있는 것만 모읍니다.
+        (한도가 바닥난 계정의 닫힌 차단기까지 섞이면 장애 시간이 0으로 보여 포기 시점이 오지 않음)
+        """
+        with self.lock:
+            breakers = []
+            for account in self.candidates(pinned):
+                breaker = account.get('breaker')
+                if breaker is None or breaker.available():
+                    continue
+                if self._score(account, recipients, nbytes) is None:
+                    continue
+                if breaker not in breakers:
+                    breakers.append(breaker)
+            return breakers
+
+    def has_free_session(self):
+        """연결 수에 여유가 있는 계정이 하나라도 있는지 (대기열에서 작업을 꺼내기 전에 확인)"""
+        with self.lock:
+            return any(account['sessions'] < account['max_sessions'] for account in self.accounts)
+
+    def checkout(self, account):
+        """계정의 쉬고 있는 연결을 꺼냄 (없으면 새 연결 상태를 만듦)"""
+        with self.lock:
+            account['sessions'] += 1
+            if account['idle_connections']:
+                return account['idle_connections'].pop()
+            connection = {'server_conn': None, 'connected': False, 'last_activity': None}
+            account['all_connections'].append(connection)
+            return connection
+
+    def checkin(self, account, connection):
+        """다 쓴 연결을 돌려놓음"""
+        with self.lock:
+            account['sessions'] -= 1
+            account['idle_connections'].append(connection)
+
+    def close_connections(self, keep=None):
+        """keep을 제외한 모든 연결 종료"""
+        with self.lock:
+            for account in self.accounts:
+                for connection in account['all_connections']:
+                    if connection is keep or not connection['server_conn']:
+                        continue
+                    try:
+                        connection['server_conn'].quit()
+                    except Exception:
+                        pass
+                    connection['server_conn'] = None
+                    connection['connected'] = False
+
+    def record_result(self, account, duration):
+        """발송 1건의 전송 시간 반영"""
+        with self.lock:
+            account['sent'] += 1
+            if account['latency'] is None:
+                account['latency'] = duration
+            else:
+                account['latency'] += self.LATENCY_WEIGHT * (duration - account['latency'])
+
+
+class CircuitBreaker:
+    """SMTP 서버 차단기 (서버 장애 때 연결 대기로 시간을 낭비하지 않도록)
+
+    연결 수준 오류가 연속으로 failure_threshold번 나면 열림(open) 상태가 되어 그 서버로의 발송을 멈추고,
+    대기 시간이 지나면 한 건만 시험 발송(half-open)해서 성공하면 다시 닫힘(closed) 상태로 돌아갑니다.
+    시험 발송이 실패할 때마다 대기 시간은 2배씩 늘어납니다 (probe_max까지).
+    """
+
+    CLOSED, OPEN, HALF_OPEN = 'closed', 'open', 'half_open'
+
+    def __init__(self, name, failure_threshold=3, probe_interval=15.0, probe_max=300.0):
+        self.name = name
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.probe_base = max(1.0, float(probe_interval))
+        self.probe_max = max(self.probe_base, float(probe_max))
+        self.state = self.CLOSED
+        self.failures = 0           # 연속 연결 실패 횟수
+        self.probe_interval = self.probe_base
+        self.next_probe = 0.0       # 시험 발송 가능 시각 (monotonic)
+        self.opened_at = None       # 장애가 시작된 시각 (monotonic)
+        self.lock = threading.Lock()
+
+    def available(self):
+        """지금 발송을 시작해도 되는지 (열린 상태라도 시험 발송 시각이 되었으면 True)"""
+        with self.lock:
+            if self.state == self.CLOSED:
+                return True
+            return self.state == self.OPEN and time.monotonic() >= self.next_probe
+
+    def start_call(self):
+        """발송 시작 알림. 이번 발송이 시험 발송이면 True"""
+        with self.lock:
+            if self.state == self.OPEN:
+                self.state = self.HALF_OPEN
+                return True
+            return False
+
+    def retry_in(self):
+        """다시 발송을 시도할 수 있을 때까지 남은 시간(초)"""
+        with self.lock:
+            if self.state == self.CLOSED:
+                return 0.0
+            if self.state == self.HALF_OPEN:
+                return 1.0  # 시험 발송 결과를 기다리는 중
+            return max(0.0, self.next_probe - time.monotonic())
+
+    def outage_duration(self):
+        """장애가 이어진 시간(초). 정상이면 0"""
+        with self.lock:
+            return 0.0 if self.opened_at is None else time.monotonic() - self.opened_at
+
+    def record_success(self):
+        """서버가 응답함 (발송 성공 또는 응답 코드 오류). 다시 닫혔으면 True"""
+        with self.lock:
+            recovered = self.state != self.CLOSED
+            self.state = self.CLOSED
+            self.failures = 0
+            self.probe_interval = self.probe_base
+            self.opened_at = None
+            return recovered
+
+    def record_failure(self):
+        """연결 수준 실패. 이번 실패로 열렸으면 True"""
+        with self.lock:
+            self.failures += 1
+            now = time.monotonic()
+            if self.state == self.HALF_OPEN:
+                # 시험 발송 실패 - 더 오래 기다림
+                self.probe_interval = min(self.probe_max, self.probe_interval * 2)
+            elif self.state == self.CLOSED and self.failures >= self.failure_threshold:
+                self.opened_at = now
+            else:
+                return False
+            self.state = self.OPEN
+            self.next_probe = now + self.probe_interval
+            return True
+
+    def cancel_probe(self):
+        """시험 발송이 서버에 닿지 못하고 끝났을 때 (발송 한도 초과 등) 다시 열림 상태로"""
+        with self.lock:
+            if self.state == self.HALF_OPEN:
+                self.state = self.OPEN
+                self.next_probe = time.monotonic()
+
+
+class ConcurrencyController:
+    """동시 발송 수 자동 조절 (AIMD)
+
+    발송이 정상이고 전송 시간이 평소 수준이면 동시 발송 수를 천천히 늘리고(+1/현재값),
+    서버가 잠시 후 다시 시도하라고 응답하거나(421/451 등) 연결이 끊기면 절반으로 줄입니다.
+    """
+
+    THROTTLE_CODES = (421, 450, 451, 452, 454)  # 서버 과부하/속도 제한 응답
+    LATENCY_TOLERANCE = 2.0  # 전송 시간이 지금까지 최저 수준의 몇 배를 넘으면 늘리지 않음
+    DECREASE_COOLDOWN = 2.0  # 함께 보내던 발송들이 한꺼번에 실패해도 한 번만 줄이도록 (초)
+
+    def __init__(self, max_limit=4, initial=1):
+        self.max_limit = max(1, int(max_limit))
+        self.limit = float(min(max(1, initial), self.max_limit))
+        self.latency_avg = None    # MB당 전송 시간 이동 평균
+        self.latency_floor = None  # 이동 평균의 최저값
+        self.last_decrease = 0.0
+        self.lock = threading.Lock()
+
+    @property
+    def current(self):
+        """지금 허용하는 동시 발송 수"""
+        return int(self.limit)
+
+    def is_throttled(self, result):
+        """서버가 속도를 늦추라는 신호를 보냈는지 확인 (연결 끊김 포함)"""
+        if result['status'] == 'transient' and (
+                result.get('code') is None or result['code'] in self.THROTTLE_CODES):
+            return True
+        return any(code in self.THROTTLE_CODES
+                   for code, _ in result.get('transient_refused', {}).values())
+
+    def record(self, result, nbytes):
+        """발송 결과 반영. 동시 발송 수가 바뀌었으면 True 반환"""
+        with self.lock:
+            before = self.current
+            if self.is_throttled(result):
+                now = time.monotonic()
+                if now - self.last_decrease >= self.DECREASE_COOLDOWN:
+                    self.limit = max(1.0, self.limit / 2)
+                    self.last_decrease = now
+            elif result['status'] in ('sent', 'partial'):
+                latency = result.get('duration', 0.0) / max(nbytes / (1024 * 1024), 0.1)
+                if self.latency_avg is None:
+                    self.latency_avg = latency
+                else:
+                    self.latency_avg += 0.3 * (latency - self.latency_avg)
+                if self.latency_floor is None or self.latency_avg < self.latency_floor:
+                    self.latency_floor = self.latency_avg
+                if self.latency_avg <= self.latency_floor * self.LATENCY_TOLERANCE:
+                    self.limit = min(float(self.max_limit), self.limit + 1.0 / self.limit)
+            return self.current != before
+
+
+# SMTP 단계별 소요 시간 측정 항목 (순서대로 표시)
+SMTP_PHASES = {
+    'resolve': "DNS 조회",
+    'connect': "TCP 연결",
+    'greeting': "서버 인사(220)",
+    'ehlo': "EHLO",
+    'tls': "TLS",
+    'auth': "인증(AUTH)",
+    'mail_rcpt': "MAIL/RCPT",
+    'data': "DATA 업로드",
+    'final': "최종 응답",
+}
+
+
+def percentile(values, p):
+    """백분위수 (p: 0~100, 값 사이는 선형 보간)"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * p / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+class PhaseTimings:
+    """발송 1회 동안의 SMTP 단계별 소요 시간 모음 (p50/p95 계산용)
+
+    add()에는 연결·발송 1건의 측정값 {'resolve': 초, ..., 'data_bytes': 업로드 바이트}를 넘깁니다.
+    """
+
+    RATE_MIN_BYTES = 256 * 1024  # 업로드 속도를 계산할 최소 메일 크기
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.samples = {phase: [] for phase in SMTP_PHASES}
+        self.data_rates = []  # DATA 업로드 속도 (bytes/s)
+
+    def add(self, timings):
+        if not timings:
+            return
+        with self.lock:
+            for phase, seconds in timings.items():
+                if phase in self.samples:
+                    self.samples[phase].append(seconds)
+            # 작은 메일은 소켓 버퍼에 바로 들어가서 속도가 부풀려지므로 제외
+            if timings.get('data') and timings.get('data_bytes', 0) >= self.RATE_MIN_BYTES:
+                self.data_rates.append(timings['data_bytes'] / timings['data'])
+
+    def summary(self):
+        """[(단계 이름, 측정 횟수, p50 초, p95 초)] - 측정값이 없는 단계는 제외"""
+        with self.lock:
+            return [(label, len(self.samples[phase]),
+                     percentile(self.samples[phase], 50), percentile(self.samples[phase], 95))
+                    for phase, label in SMTP_PHASES.items() if self.samples[phase]]
+
+    def p50(self, phase):
+        """단계의 중앙값 (초, 측정값이 없으면 None)"""
+        with self.lock:
+            return percentile(self.samples[phase], 50)
+
+    def rate_summary(self):
+        """DATA 업로드 속도 (측정 횟수, p50, p95 bytes/s), 측정값이 없으면 None"""
+        with self.lock:
+            if not self.data_rates:
+                return None
+            return (len(self.data_rates),
+                    percentile(self.data_rates, 50), percentile(self.data_rates, 95))
+
+    def report_lines(self):
+        """실행 보고서용 문자열 목록"""
+        lines = [f"{label}: p50 {p50 * 1000:.0f}ms / p95 {p95 * 1000:.0f}ms ({count}회)"
+                 for label, count, p50, p95 in self.summary()]
+        rates = self.rate_summary()
+        if rates:
+            count, p50, p95 = rates
+            lines.append(f"업로드 속도: p50 {p50 / 1024:.0f}KB/s / p95 {p95 / 1024:.0f}KB/s ({count}회)")
+        return lines
+
+
+_ssl_context = None
+_ssl_context_lock = threading.Lock()
+_tls_sessions = {}  # {(서버, 포트): ssl.SSLSession} - 재연결할 때 TLS 세션 재개에 사용
+_tls_sessions_lock = threading.Lock()
+
+
+def get_ssl_context():
+    """프로그램 전체에서 함께 쓰는 SSLContext (인증서 저장소는 처음 한 번만 읽음)"""
+    global _ssl_context
+    with _ssl_context_lock:
+        if _ssl_context is None:
+            _ssl_context = ssl.create_default_context()
+        return _ssl_context
+
+
+class _ResumingTLSContext:
+    """이전 TLS 세션을 넘겨서 handshake를 줄이는 SSLContext 대리 객체
+
+    smtplib은 context.wrap_socket(sock, server_hostname=...)만 호출하므로
+    그 자리에서 session 인자를 붙여 줍니다.
+    """
+
+    def __init__(self, context, session):
+        self.context = context
+        self.session = session
+
+    def wrap_socket(self, sock, server_hostname=None, **kwargs):
+        if self.session is not None:
+            kwargs.setdefault('session', self.session)
+        try:
+            return self.context.wrap_socket(sock, server_hostname=server_hostname, **kwargs)
+        except ValueError:
+            # 세션을 쓸 수 없으면 (다른 컨텍스트의 세션 등) 처음부터 handshake
+            kwargs.pop('session', None)
+            return self.context.wrap_socket(sock, server_hostname=server_hostname, **kwargs)
+
+
+def _tls_context_for(smtp_server, smtp_port):
+    with _tls_sessions_lock:
+        session = _tls_sessions.get((smtp_server, int(smtp_port)))
+    return _ResumingTLSContext(get_ssl_context(), session)
+
+
+def _remember_tls_session(server, smtp_server, smtp_port):
+    """로그인까지 끝난 연결의 TLS 세션 저장 (TLS 1.3은 세션 티켓을 handshake 뒤에 받음)"""
+    session = getattr(server.sock, 'session', None)
+    if session is not None:
+        with _tls_sessions_lock:
+            _tls_sessions[(smtp_server, int(smtp_port))] = session
+
+
+def _open_timed_socket(host, port, timeout, timings, source_address=None):
+    """DNS 조회와 TCP 연결 시간을 timings에 기록하며 서버에 연결"""
+    start = time.perf_counter()
+    addresses = socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM)
+    timings['resolve'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    sock = None
+    error = None
+    for family, _, _, _, sockaddr in addresses:
+        try:
+            sock = socket.create_connection(sockaddr[:2], timeout, source_address)
+            break
+        except OSError as e:
+            error = e
+    if sock is None:
+        raise error
+    timings['connect'] = time.perf_counter() - start
+    return sock
+
+
+class _TimedSMTP(smtplib.SMTP):
+    """연결할 때 DNS 조회·TCP 연결 시간을 timings에 기록하는 smtplib.SMTP"""
+
+    def __init__(self, host='', port=0, timings=None, **kwargs):
+        self.timings = {} if timings is None else timings
+        super().__init__(host, port, **kwargs)
+
+    def _get_socket(self, host, port, timeout):
+        return _open_timed_socket(host, port, timeout, self.timings, self.source_address)
+
+
+class _TimedSMTP_SSL(smtplib.SMTP_SSL):
+    """연결할 때 DNS 조회·TCP 연결·TLS 시간을 timings에 기록하는 smtplib.SMTP_SSL"""
+
+    def __init__(self, host='', port=0, timings=None, **kwargs):
+        self.timings = {} if timings is None else timings
+        super().__init__(host, port, **kwargs)
+
+    def _get_socket(self, host, port, timeout):
+        sock = _open_timed_socket(host, port, timeout, self.timings, self.source_address)
+        start = time.perf_counter()
+        try:
+            sock = self.context.wrap_socket(sock, server_hostname=host)
+        except Exception:
+            sock.close()
+            raise
+        self.timings['tls'] = time.perf_counter() - start
+        return sock
+
+
+def open_smtp_connection(smtp_server, smtp_port, sender_email, sender_password, timeout=30,
+                         connect_timeout=None, timings=None):
+    """SMTP 서버에 연결하고 로그인한 연결 객체 반환
+
+    465 포트는 처음부터 SSL로 연결하고, 그 외 포트는 STARTTLS로 암호화합니다.
+    connect_timeout을 주면 연결·로그인까지는 그 시간만 기다리고, 이후 전송에는 timeout을 사용합니다.
+    SSLContext는 프로그램 전체에서 공유하고, 같은 서버의 이전 TLS 세션이 있으면 재개합니다.
+    timings(dict)를 주면 단계별 소요 시간(SMTP_PHASES의 resolve~auth, 초)을 기록합니다.
+    """
+    connect_timeout = connect_timeout or timeout
+    if timings is None:
+        timings = {}
+    context = _tls_context_for(smtp_server, smtp_port)
+    # 생성자가 연결하고 서버 인사(220)까지 받음 (220이 아니면 SMTPConnectError)
+    start = time.perf_counter()
+    if int(smtp_port) == 465:
+        # SSL 연결
+        server = _TimedSMTP_SSL(smtp_server, smtp_port, timings=timings,
+                                timeout=connect_timeout, context=context)
+    else:
+        # TLS 연결
+        server = _TimedSMTP(smtp_server, smtp_port, timings=timings, timeout=connect_timeout)
+    timings['greeting'] = time.perf_counter() - start - sum(
+        timings.get(phase, 0) for phase in ('resolve', 'connect', 'tls'))
+
+    try:
+        start = time.perf_counter()
+        server.ehlo()
+        timings['ehlo'] = time.perf_counter() - start
+        if int(smtp_port) != 465:
+            start = time.perf_counter()
+            server.starttls(context=context)
+            timings['tls'] = time.perf_counter() - start
+            start = time.perf_counter()
+            server.ehlo()
+            timings['ehlo'] += time.perf_counter() - start
+
+        start = time.perf_counter()
+        server.login(sender_email, sender_password)
+        timings['auth'] = time.perf_counter() - start
+    except Exception:
+        server.close()
+        raise
+
+    _remember_tls_session(server, smtp_server, smtp_port)
+
+    if timeout != connect_timeout:
+        server.timeout = timeout
+        server.sock.settimeout(timeout)
+    return server
+
+
+class MessageTooLargeError(smtplib.SMTPResponseException):
+    """메시지가 서버가 EHLO SIZE로 알린 최대 크기보다 큼 (업로드 전에 거부)"""
+
+    def __init__(self, size, limit):
+        self.size = size
+        self.limit = limit
+        super().__init__(552, f"메시지 크기 {size / (1024 * 1024):.1f}MB가 "
+                              f"서버 제한 {limit / (1024 * 1024):.1f}MB를 넘습니다")
+
+
+class DeliveryUnknownError(smtplib.SMTPException):
+    """메일 본문을 끝('.')까지 보낸 뒤 서버의 마지막 응답을 받지 못함
+
+    서버가 이미 메일을 받았을 수 있으므로 다시 보내면 수신자가 같은 메일을 두 번 받을 수 있습니다.
+    """
+
+
+def get_advertised_size_limit(server):
+    """서버가 EHLO SIZE로 알린 최대 메시지 크기 (bytes, 알리지 않았거나 0이면 None)"""
+    if not server.does_esmtp:
+        return None
+    try:
+        limit = int(server.esmtp_features.get('size', ''))
+    except ValueError:
+        return None
+    return limit if limit > 0 else None
+
+
+def _send_envelope(server, from_addr, to_addrs, options):
+    """MAIL, RCPT, DATA를 하나씩 보내고 응답을 받음 (실패하면 그 자리에서 멈춤)
+
+    Returns: (MAIL 응답, [RCPT 응답], DATA 응답 또는 None)
+    """
+    mail_reply = server.mail(from_addr, options)
+    if mail_reply[0] != 250:
+        return mail_reply, [], None
+    rcpt_replies = []
+    for addr in to_addrs:
+        reply = server.rcpt(addr)
+        rcpt_replies.append(reply)
+        if reply[0] == 421:
+            return mail_reply, rcpt_replies, None
+    if all(code not in (250, 251) for code, _ in rcpt_replies):
+        return mail_reply, rcpt_replies, None
+    server.putcmd("data")
+    return mail_reply, rcpt_replies, server.getreply()
+
+
+def _send_envelope_pipelined(server, from_addr, to_addrs, options):
+    """MAIL, 모든 RCPT, DATA를 한 번에 보낸 뒤 응답을 차례로 받음 (ESMTP PIPELINING, RFC 2920)
+
+    Returns: (MAIL 응답, [RCPT 응답], DATA 응답)
+    """
+    option_text = ''.join(f" {option}" for option in options)
+    commands = [f"mail FROM:{smtplib.quoteaddr(from_addr)}{option_text}"]
+    commands += [f"rcpt TO:{smtplib.quoteaddr(addr)}" for addr in to_addrs]
+    commands.append("data")
+    server.send(''.join(f"{command}\r\n" for command in commands))
+
+    replies = []
+    try:
+        for _ in commands:
+            replies.append(server.getreply())
+    except smtplib.SMTPServerDisconnected:
+        # 421을 보내고 연결을 끊은 경우 - 나머지 응답도 421로 처리
+        if not any(code == 421 for code, _ in replies):
+            raise
+        replies += [(421, b"connection closed")] * (len(commands) - len(replies))
+    return replies[0], replies[1:-1], replies[-1]
+
+
+DATA_CHUNK_SIZE = 64 * 1024  # 중지 요청과 진행률을 확인하는 업로드 단위 (bytes)
+
+
+def send_message_timed(server, msg, to_addrs, timings=None, cancel_event=None, progress=None):
+    """server.send_message(msg, to_addrs=to_addrs)와 같지만 단계별 시간을 timings에 기록
+
+    MAIL/RCPT, DATA 업로드(시간과 바이트 수), 마지막 250 응답까지를 따로 잽니다.
+    서버가 EHLO에서 알린 확장을 따릅니다.
+    - SIZE: 제한보다 큰 메시지는 업로드하지 않고 MessageTooLargeError 발생
+    - PIPELINING: MAIL/RCPT/DATA를 한 번에 보내서 수신자가 많아도 왕복 한 번으로 처리
+    주소에 한글 등 ASCII가 아닌 문자가 있으면(SMTPUTF8 필요) 측정 없이 send_message를 사용합니다.
+    cancel_event가 설정되면 업로드를 멈추고 연결을 닫은 뒤 SendCancelledError를 발생시킵니다
+    (DATA 도중에 멈춘 SMTP 세션은 다시 쓸 수 없음).
+    progress가 있으면 업로드 단위마다 progress(보낸 바이트, 전체 바이트)를 호출합니다.
+    본문을 끝까지 보낸 뒤에는 timings['data_done']이 True가 되고, 그 뒤 마지막 응답을 받지 못하면
+    (연결 끊김, 감시자의 중단 등) DeliveryUnknownError를 발생시킵니다.
+    Returns: 거부된 수신자 {주소: (응답 코드, 응답 메시지)} (send_message와 동일)
+    """
+    if timings is None:
+        timings = {}
+    if cancel_event is not None and cancel_event.is_set():
+        raise SendCancelledError()
+    from_addr = getaddresses([msg['From']])[0][1]
+    try:
+        ''.join([from_addr, *to_addrs]).encode('ascii')
+    except UnicodeEncodeError:
+        return server.send_message(msg, to_addrs=to_addrs)
+
+    msg_copy = copy.copy(msg)
+    del msg_copy['Bcc']
+    del msg_copy['Resent-Bcc']
+    with io.BytesIO() as bytesmsg:
+        BytesGenerator(bytesmsg).flatten(msg_copy, linesep='\r\n')
+        flatmsg = bytesmsg.getvalue()
+
+    def reset():
+        try:
+            server.rset()
+        except smtplib.SMTPServerDisconnected:
+            pass
+
+    def fail(code):
+        # 421은 서버가 연결을 끊는 중이므로 닫고, 그 외에는 트랜잭션만 초기화
+        if code == 421:
+            server.close()
+        else:
+            reset()
+
+    def abort_data(data_reply):
+        # 받을 수신자가 없는데 DATA가 수락된 경우 - 빈 메일이 가지 않도록 연결을 버림
+        if data_reply is not None and data_reply[0] == 354:
+            server.close()
+            return True
+        return False
+
+    server.ehlo_or_helo_if_needed()
+    size_limit = get_advertised_size_limit(server)
+    if size_limit is not None and len(flatmsg) > size_limit:
+        raise MessageTooLargeError(len(flatmsg), size_limit)
+    options = []
+    if server.does_esmtp and server.has_extn('size'):
+        options.append(f"size={len(flatmsg)}")
+
+    start = time.perf_counter()
+    if server.does_esmtp and server.has_extn('pipelining'):
+        mail_reply, rcpt_replies, data_reply = _send_envelope_pipelined(
+            server, from_addr, to_addrs, options)
+    else:
+        mail_reply, rcpt_replies, data_reply = _send_envelope(
+            server, from_addr, to_addrs, options)
+    timings['mail_rcpt'] = time.perf_counter() - start
+
+    code, resp = mail_reply
+    if code != 250:
+        if not abort_data(data_reply):
+            fail(code)
+        raise smtplib.SMTPSenderRefused(code, resp, from_addr)
+    refused = {}
+    for addr, (code, resp) in zip(to_addrs, rcpt_replies):
+        if code not in (250, 251):
+            refused[addr] = (code, resp)
+        if code == 421:
+            server.close()
+            raise smtplib.SMTPRecipientsRefused(refused)
+    if len(refused) == len(to_addrs):
+        if not abort_data(data_reply):
+            reset()
+        raise smtplib.SMTPRecipientsRefused(refused)
+    code, resp = data_reply
+    if code != 354:
+        fail(code)
+        raise smtplib.SMTPDataError(code, resp)
+
+    # 본문 전송 (줄 맨 앞의 '.'은 '..'으로, 끝은 <CRLF>.<CRLF>)
+    data = re.sub(br'(?m)^\.', b'..', flatmsg)
+    if data[-2:] != b'\r\n':
+        data += b'\r\n'
+    data += b'.\r\n'
+    start = time.perf_counter()
+    if cancel_event is None and progress is None:
+        server.send(data)
+    else:
+        for offset in range(0, len(data), DATA_CHUNK_SIZE):
+            if cancel_event is not None and cancel_event.is_set():
+                server.close()
+                raise SendCancelledError()
+            server.send(data[offset:offset + DATA_CHUNK_SIZE])
+            if progress is not None:
+                progress(min(offset + DATA_CHUNK_SIZE, len(data)), len(data))
+    timings['data'] = time.perf_counter() - start
+    timings['data_bytes'] = len(data)
+    timings['data_done'] = True
+
+    # 여기부터는 서버가 메일을 받았을 수 있음 - 응답을 못 받았다고 다시 보내면 중복 발송
+    start = time.perf_counter()
+    try:
+        code, resp = server.getreply()
+    except OSError as e:
+        raise DeliveryUnknownError(f"메일을 보낸 뒤 서버 응답을 받지 못함: {e}") from e
+    timings['final'] = time.perf_counter() - start
+    if code != 250:
+        fail(code)
+        raise smtplib.SMTPDataError(code, resp)
+    return refused
+
+
+class IdleTimeoutStore:
+    """서버별 유휴 연결 종료 시간 학습 (프로그램 재시작 후에도 유지)
+
+    연결을 다시 사용할 때마다 직전의 유휴 시간(마지막 사용 후 지난 시간)을 기록합니다.
+    - 연결이 살아 있었으면 'survived'(버틴 최대 유휴 시간)를 늘리고
+    - 끊어져 있었으면 'dropped'(끊긴 최소 유휴 시간)를 줄입니다.
+    서버의 유휴 제한은 두 값 사이에 있으므로 'dropped'보다 조금 이른 시점에 연결을 교체합니다.
+    """
+
+    MIN_IDLE = 5          # 이보다 짧은 유휴 시간은 학습하지 않음 (유휴 제한이 아닌 네트워크 오류로 봄)
+    REFRESH_RATIO = 0.8   # 끊긴 시간의 80% 시점에 교체
+    REFRESH_MARGIN = 10   # 최소 여유 시간 (초)
+
+    def __init__(self, state_file):
+        self.state_file = Path(state_file)
+        self.lock = threading.Lock()
+        self.state = self._load()
+
+    def _load(self):
+        try:
+            if self.state_file.exists():
+                with open(self.state_file, 'r', encoding='utf-8') as f:
+                    state = json.load(f)
+                if isinstance(state, dict):
+                    return state
+        except Exception as e:
+            logging.error(f"유휴 시간 기록 로드 오류: {e}")
+        return {}
+
+    def _save(self):
+        try:
+            with open(self.state_file, 'w', encoding='utf-8') as f:
+                json.dump(self.state, f, indent=2, ensure_ascii=False)
+        except Exception as e:
+            logging.error(f"유휴 시간 기록 저장 오류: {e}")
+
+    def _entry(self, server_key):
+        entry = self.state.get(server_key)
+        if not isinstance(entry, dict):
+            entry = {'survived': 0, 'dropped': None}
+            self.state[server_key] = entry
+        return entry
+
+    def record_alive(self, server_key, idle):
+        """idle초 동안 쉬었던 연결이 살아 있었음"""
+        if idle is None or idle < self.MIN_IDLE:
+            return
+        with self.lock:
+            entry = self._entry(server_key)
+            changed = False
+            if idle > entry['survived']:
+                entry['survived'] = round(idle)
+                changed = True
+            # 끊겼던 시간보다 오래 버텼으면 서버 제한이 늘어난 것 - 다시 학습
+            if entry['dropped'] is not None and idle >= entry['dropped']:
+                entry['dropped'] = None
+                changed = True
+            if changed:
+                self._save()
+
+    def record_drop(self, server_key, idle):
+        """idle초 동안 쉬었던 연결이 끊어져 있었음"""
+        if idle is None or idle < self.MIN_IDLE:
+            return
+        with self.lock:
+            entry = self._entry(server_key)
+            if entry['dropped'] is not None and idle >= entry['dropped']:
+                return
+            entry['dropped'] = round(idle)
+            # 전에 버텼던 시간보다 짧게 끊겼으면 서버 제한이 줄어든 것 - 이전 기록 버림
+            if entry['survived'] >= entry['dropped']:
+                entry['survived'] = 0
+            self._save()
+
+    def refresh_after(self, server_key):
+        """마지막 사용 후 몇 초 뒤에 연결을 교체할지 (아직 끊긴 적이 없으면 None)"""
+        with self.lock:
+            entry = self.state.get(server_key)
+            if not isinstance(entry, dict) or not entry.get('dropped'):
+                return None
+            dropped = entry['dropped']
+        return max(self.MIN_IDLE, min(dropped * self.REFRESH_RATIO, dropped - self.REFRESH_MARGIN))
+
+
+def connection_idle_time(state):
+    """마지막 사용 후 지난 시간 (초, 연결이 없으면 None)"""
+    if not state['connected'] or state.get('last_activity') is None:
+        return None
+    return time.time() - state['last_activity']
+
+
+def check_connection_state(state, trust_window=0):
+    """연결 상태 확인 (trust_window초 안에 사용한 연결은 NOOP 없이 정상으로 봄)
+
+    Returns: (살아 있는지, NOOP으로 실제 확인했는지)
+    """
+    if not state['connected'] or not state['server_conn']:
+        return False, False
+
+    last_activity = state.get('last_activity')
+    if last_activity is not None and time.time() - last_activity < trust_window:
+        return True, False
+
+    try:
+        # 연결 상태 테스트
+        state['server_conn'].noop()
+        state['last_activity'] = time.time()
+        return True, True
+    except Exception:
+        # 연결이 끊어진 경우 상태 초기화
+        close_connection_state(state)
+        return False, True
+
+
+def is_connection_alive(state, trust_window=0):
+    """연결 상태 확인 (trust_window초 안에 사용한 연결은 NOOP 없이 정상으로 봄)"""
+    return check_connection_state(state, trust_window)[0]
+
+
+def abort_connection(state):
+    """다른 스레드에서 전송·응답 대기 중인 연결을 끊음 (그 스레드에서 오류가 발생함)"""
+    sock = getattr(state.get('server_conn'), 'sock', None)
+    if sock is not None:
+        try:
+            sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+
+def close_connection_state(state, quit=False):
+    """연결 종료 후 상태 초기화 (quit=True면 서버에 QUIT을 보내고 종료)"""
+    server = state.get('server_conn')
+    state['connected'] = False
+    state['server_conn'] = None
+    state['last_activity'] = None
+    if server is not None:
+        try:
+            if quit:
+                server.quit()
+            else:
+                server.close()
+        except Exception:
+            pass
+
+
+class ConnectionManager:
+    """기본 계정 SMTP 연결 관리 (백그라운드 스레드)
+
+    연결·재연결·주기적 상태 확인처럼 네트워크를 기다리는 작업을 GUI 스레드 밖에서 처리합니다.
+    상태가 바뀌면 events 큐에 ('status', {'state': 상태, ...}) 또는 ('log', (메시지, 레벨, 디버그 여부))를
+    넣고, GUI는 root.after로 큐를 읽어 화면에 반영합니다.
+
+    서버의 유휴 제한을 알고 있으면(IdleTimeoutStore) 끊기기 직전에 새 연결로 미리 교체해서,
+    발송을 시작할 때 항상 인증까지 끝난 연결이 준비되어 있도록 합니다.
+    """
+
+    MAX_CONNECT_ATTEMPTS = 3
+    RETRY_DELAY = 3       # 연결 재시도 간격 (초)
+    CHECK_INTERVAL = 60   # 연결 상태 확인 간격 (초)
+    REFRESH_BACKOFF_MIN = 5     # 미리 교체에 실패한 뒤 다시 시도할 때까지 최소 대기 (초, 실패할 때마다 2배)
+    REFRESH_BACKOFF_MAX = 300   # 미리 교체 재시도 대기의 상한 (초)
+
+    def __init__(self, config_manager, connection_state, idle_store=None):
+        self.config_manager = config_manager
+        self.connection_state = connection_state
+        self.idle_store = idle_store
+        self.events = queue.Queue()
+        self.commands = queue.Queue()
+        self.io_lock = threading.Lock()  # 연결을 다루는 동안 잠금 (발송 스레드와 겹치지 않도록)
+        self.monitoring = False  # 연결에 성공한 뒤에만 주기적으로 확인
+        self.paused = False      # 발송 중에는 확인하지 않음 (발송 스레드가 연결을 사용)
+        self.refresh_failures = 0    # 연속으로 미리 교체에 실패한 횟수
+        self.refresh_retry_at = None  # 실패 후 다음 교체 시도 시각 (monotonic)
+        self.thread = None
+
+    def start(self):
+        """관리 스레드 시작"""
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def connect(self):
+        """연결 요청 (이미 연결되어 있으면 재사용)"""
+        self.commands.put('connect')
+
+    def disconnect(self):
+        """연결 종료 요청"""
+        self.commands.put('disconnect')
+
+    def pause(self):
+        """주기적 상태 확인 일시 중지"""
+        self.paused = True
+
+    def resume(self):
+        """주기적 상태 확인 재개"""
+        self.paused = False
+        self.commands.put('wake')  # 교체 시점이 지났을 수 있으므로 다시 계산
+
+    def wait_idle(self):
+        """진행 중인 연결 작업이 끝날 때까지 대기 (발송 스레드에서 호출)"""
+        with self.io_lock:
+            pass
+
+    def shutdown(self, timeout=2.0):
+        """연결을 종료하고 관리 스레드 정지 (최대 timeout초 대기)"""
+        self.commands.put('shutdown')
+        if self.thread is not None:
+            self.thread.join(timeout)
+
+    def _emit_log(self, message, level='INFO', is_debug=False):
+        self.events.put(('log', (message, level, is_debug)))
+
+    def _emit_status(self, state, **info):
+        info['state'] = state
+        self.events.put(('status', info))
+
+    def _server_key(self):
+        return (f"{self.config_manager.get('email.smtp_server', '')}:"
+                f"{self.config_manager.get('email.smtp_port', 587)}")
+
+    def _refresh_delay(self):
+        """연결 교체까지 남은 시간 (초, 교체할 필요가 없으면 None)"""
+        if self.idle_store is None or not self.monitoring or self.paused:
+            return None
+        idle = connection_idle_time(self.connection_state)
+        if idle is None:
+            return None
+        refresh_after = self.idle_store.refresh_after(self._server_key())
+        if refresh_after is None:
+            return None
+        delay = refresh_after - idle
+        if self.refresh_retry_at is not None:
+            # 교체에 실패한 직후에는 기존 연결을 계속 믿으므로 유휴 시간이 줄지 않음 - 바로 다시 시도하지 않도록
+            delay = max(delay, self.refresh_retry_at - time.monotonic())
+        return delay
+
+    def _reset_refresh_backoff(self):
+        self.refresh_failures = 0
+        self.refresh_retry_at = None
+
+    def _run(self):
+        next_check = time.monotonic() + self.CHECK_INTERVAL
+        while True:
+            timeout = max(0.0, next_check - time.monotonic())
+            refresh_delay = self._refresh_delay()
+            if refresh_delay is not None:
+                timeout = min(timeout, max(0.0, refresh_delay))
+            try:
+                command = self.commands.get(timeout=timeout)
+            except queue.Empty:
+                refresh_delay = self._refresh_delay()
+                if refresh_delay is not None and refresh_delay <= 0:
+                    command = 'refresh'
+                else:
+                    command = 'check'
+                    next_check = time.monotonic() + self.CHECK_INTERVAL
+
+            try:
+                with self.io_lock:
+                    if command == 'shutdown':
+                        self._close()
+                        return
+                    if command == 'connect':
+                        self._connect()
+                    elif command == 'disconnect':
+                        self.monitoring = False
+                        self._close()
+                        self._emit_status('disconnected')
+                    elif command == 'check' and self.monitoring and not self.paused:
+                        self._check()
+                    elif command == 'refresh' and self.monitoring and not self.paused:
+                        self._refresh()
+            except Exception as e:
+                logging.error(f"연결 관리 오류: {e}")
+                self._emit_log(f"❌ 연결 관리 오류: {e}", 'ERROR')
+
+    def _close(self):
+        if self.connection_state['server_conn']:
+            self._emit_log("🔌 SMTP 연결 종료", is_debug=True)
+        close_connection_state(self.connection_state, quit=True)
+
+    def _connect(self):
+        email = self.config_manager.get('email.sender_email', '')
+        password = self.config_manager.get('email.sender_password', '')
+        smtp_server = self.config_manager.get('email.smtp_server', '')
+        smtp_port = self.config_manager.get('email.smtp_port', 587)
+        trust_window = self.config_manager.get('connection_trust_window', 30)
+
+        # 이미 연결되어 있으면 재사용
+        if is_connection_alive(self.connection_state, trust_window):
+            self._emit_log(f"✅ SMTP 연결 재사용: {email}", 'SUCCESS')
+            self.monitoring = True
+            self._emit_status('connected')
+            return
+
+        # SMTP 서버 연결 시도
+        self._emit_log(f"🔌 SMTP 서버 연결 중... ({smtp_server}:{smtp_port})", 'INFO')
+        self._emit_status('connecting')
+
+        for attempt in range(1, self.MAX_CONNECT_ATTEMPTS + 1):
+            try:
+                # 기존 연결이 있으면 종료
+                self._close()
+
+                # 새 연결 생성 - 포트에 따라 SSL/TLS 선택
+                self.connection_state['server_conn'] = open_smtp_connection(
+                    smtp_server, smtp_port, email, password, timeout=30)
+                self.connection_state['connected'] = True
+                self.connection_state['last_activity'] = time.time()
+                self._emit_log(f"✅ SMTP 서버 연결 성공: {email}", 'SUCCESS')
+                self.monitoring = True
+                self._reset_refresh_backoff()
+                self._emit_status('connected')
+                return
+
+            except smtplib.SMTPAuthenticationError as e:
+                close_connection_state(self.connection_state)
+                self._emit_log(f"❌ 인증 실패: {e}", 'ERROR')
+                self._emit_log("💡 이메일 주소와 앱 비밀번호를 확인하세요.", 'ERROR')
+                self.monitoring = False
+                self._emit_status('auth_failed')
+                return
+
+            except Exception as e:
+                close_connection_state(self.connection_state)
+                if attempt < self.MAX_CONNECT_ATTEMPTS:
+                    self._emit_log(f"❌ SMTP 연결 실패 (시도 {attempt}/{self.MAX_CONNECT_ATTEMPTS}): {e}", 'ERROR')
+                    self._emit_log(f"🔄 {self.RETRY_DELAY}초 후 재시도합니다...", 'WARNING')
+                    self._emit_status('retrying', attempt=attempt, max_attempts=self.MAX_CONNECT_ATTEMPTS)
+                    time.sleep(self.RETRY_DELAY)
+                else:
+                    self._emit_log(f"❌ SMTP 연결 최종 실패: {e}", 'ERROR')
+                    self.monitoring = False
+                    self._emit_status('failed')
+
+    def _check(self):
+        trust_window = self.config_manager.get('connection_trust_window', 30)
+        idle = connection_idle_time(self.connection_state)
+        alive, checked = check_connection_state(self.connection_state, trust_window)
+        if alive:
+            # NOOP 없이 믿은 연결은 실제로 버텼는지 모르므로 학습하지 않음
+            if checked and self.idle_store is not None:
+                self.idle_store.record_alive(self._server_key(), idle)
+            self._emit_log("🔍 연결 상태 확인: 정상", is_debug=True)
+        else:
+            if checked and self.idle_store is not None:
+                self.idle_store.record_drop(self._server_key(), idle)
+            # 연결이 끊어진 경우
+            self._emit_log("⚠️ 연결이 끊어짐을 감지했습니다. 재연결을 시도합니다.", 'WARNING')
+            self._emit_status('lost')
+            self._connect()
+
+    def _refresh(self):
+        """서버 유휴 제한 직전에 새 연결로 교체 (새 연결이 준비된 뒤 기존 연결 종료)"""
+        email = self.config_manager.get('email.sender_email', '')
+        password = self.config_manager.get('email.sender_password', '')
+        smtp_server = self.config_manager.get('email.smtp_server', '')
+        smtp_port = self.config_manager.get('email.smtp_port', 587)
+
+        try:
+            server = open_smtp_connection(smtp_server, smtp_port, email, password, timeout=30)
+        except Exception as e:
+            # 새 연결을 못 만들었으면 기존 연결 상태를 확인 (끊겼으면 평소처럼 재연결)
+            self.refresh_failures += 1
+            backoff = min(self.REFRESH_BACKOFF_MAX,
+                          self.REFRESH_BACKOFF_MIN * 2 ** (self.refresh_failures - 1))
+            self.refresh_retry_at = time.monotonic() + backoff
+            self._emit_log(f"⚠️ SMTP 연결 미리 교체 실패: {e} ({backoff:.0f}초 후 다시 시도)",
+                           'WARNING', is_debug=True)
+            self._check()
+            return
+
+        old_server = self.connection_state['server_conn']
+        self.connection_state['server_conn'] = server
+        self.connection_state['connected'] = True
+        self.connection_state['last_activity'] = time.time()
+        self._reset_refresh_backoff()
+        if old_server is not None:
+            try:
+                old_server.quit()
+            except Exception:
+                pass
+        self._emit_log("🔄 서버 유휴 제한 전에 SMTP 연결을 새로 만들었습니다", is_debug=True)
+        self._emit_status('connected')
+
+
+def classify_reply_code(code):
+    """SMTP 응답 코드 분류: 'ok'(2xx/3xx), 'transient'(4xx), 'permanent'(5xx)"""
+    if code is None:
+        return 'transient'
+    if code < 400:
+        return 'ok'
+    if code < 500:
+        return 'transient'
+    return 'permanent'
+
+
+def decode_smtp_reply(reply):
+    """SMTP 응답 메시지(bytes)를 문자열로 변환"""
+    if isinstance(reply, bytes):
+        return reply.decode('utf-8', 'replace')
+    return str(reply)
+
+
+def split_refused_recipients(refused):
+    """거부된 수신자를 일시적 거부와 영구 거부로 나눔
+
+    refused: {주소: (응답 코드, 응답 메시지)} (send_message 반환값 형식)
+    """
+    transient, permanent = {}, {}
+    for address, (code, reply) in refused.items():
+        target = transient if classify_reply_code(code) == 'transient' else permanent
+        target[address] = (code, decode_smtp_reply(reply))
+    return transient, permanent
+
+
+def is_connection_error(error):
+    """연결이 끊어졌거나 맺어지지 않은 오류인지 확인 (다시 연결해야 함)"""
+    if isinstance(error, (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError)):
+        return True
+    if isinstance(error, smtplib.SMTPResponseException):
+        return error.smtp_code == 421  # 서버가 연결을 닫겠다는 응답
+    # SMTPException도 OSError를 상속하므로 제외
+    return isinstance(error, OSError) and not isinstance(error, smtplib.SMTPException)
+
+
+def classify_smtp_error(error):
+    """SMTP 발송 오류 분류
+
+    Returns:
+        tuple: (분류, 응답 코드)
+            분류 - 'auth': 인증 실패, 'transient': 일시적 (4xx, 연결 끊김),
+                   'permanent': 영구적 (5xx, 지원하지 않는 기능 등)
+    """
+    if isinstance(error, smtplib.SMTPAuthenticationError):
+        return 'auth', error.smtp_code
+    if is_connection_error(error):
+        return 'transient', getattr(error, 'smtp_code', None)
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        transient, permanent = split_refused_recipients(error.recipients)
+        codes = [code for code, _ in list(transient.values()) + list(permanent.values())]
+        return ('transient' if transient else 'permanent'), (codes[0] if codes else None)
+    if isinstance(error, smtplib.SMTPResponseException):
+        return classify_reply_code(error.smtp_code), error.smtp_code
+    return 'permanent', None
+
+
+TEMPLATE_VARIABLE = re.compile(r'\{([^{}]+)\}')  # 양식 변수 {이름}
+TEMPLATE_CACHE_SIZE = 256  # 분석해 둘 양식 문자열 최대 개수
+
+WEEKDAYS_KO = ['월', '화', '수', '목', '금', '토', '일']
+
+
+class TemplateSyntaxError(ValueError):
+    """양식의 반복/조건 블록이 잘못됨"""
+
+
+TEMPLATE_BLOCKS = ('반복', '만약')  # {#반복 목록}...{/반복}, {#만약 조건}...{#아니면}...{/만약}
+
+
+def parse_template(text):
+    """양식을 노드 목록으로 분석
+
+    노드: 문자열 | ('var', 이름) | ['loop', 목록 이름, 노드 목록]
+          | ['if', 조건 이름, 부정 여부, 참일 때 노드 목록, 거짓일 때 노드 목록]
+    """
+    nodes = []
+    stack = [(None, nodes, None)]  # (블록 종류, 지금 채우는 노드 목록, 블록 노드)
+    position = 0
+    for match in TEMPLATE_VARIABLE.finditer(text):
+        if match.start() > position:
+            stack[-1][1].append(text[position:match.start()])
+        position = match.end()
+        content = match.group(1).strip()
+        keyword, _, argument = content[1:].partition(' ')
+        argument = argument.strip()
+
+        if content[:1] == '#' and keyword in TEMPLATE_BLOCKS:
+            if not argument.lstrip('!'):
+                raise TemplateSyntaxError(f"{{#{keyword}}} 뒤에 변수 이름이 필요합니다")
+            if keyword == '반복':
+                node = ['loop', argument, []]
+                children = node[2]
+            else:
+                node = ['if', argument.lstrip('!').strip(), argument.startswith('!'), [], []]
+                children = node[3]
+            stack[-1][1].append(node)
+            stack.append((keyword, children, node))
+        elif content == '#아니면':
+            kind, children, node = stack[-1]
+            if kind != '만약' or children is node[4]:
+                raise TemplateSyntaxError("{#아니면}은 {#만약} 블록 안에 한 번만 쓸 수 있습니다")
+            stack[-1] = (kind, node[4], node)
+        elif content[:1] == '/' and content[1:] in TEMPLATE_BLOCKS:
+            if stack[-1][0] != content[1:]:
+                raise TemplateSyntaxError(f"{{{content}}}와 짝이 맞는 {{#{content[1:]}}}가 없습니다")
+            stack.pop()
+        else:
+            stack[-1][1].append(('var', match.group(1)))
+    if position < len(text):
+        stack[-1][1].append(text[position:])
+    if len(stack) > 1:
+        raise TemplateSyntaxError(f"{{#{stack[-1][0]}}} 블록을 닫는 {{/{stack[-1][0]}}}가 없습니다")
+    return nodes
+
+
+def is_truthy(value):
+    """조건 블록의 참/거짓 (값이 없거나 빈 문자열·'0'·빈 목록이면 거짓)"""
+    return value not in (None, '', '0', 0, False) and value != []
+
+
+def _render_segments(segments, values):
+    parts = []
+    for literal, name in segments:
+        parts.append(literal)
+        if name is not None:
+            value = values.get(name)
+            parts.append(f'{{{name}}}' if value is None else str(value))
+    return ''.join(parts)
+
+
+def _compile_nodes(nodes):
+    """노드 목록을 렌더링 함수(values -> 문자열) 하나로 변환
+
+    문자열과 변수만 이어진 구간은 (앞 문자열, 변수 이름) 조각 목록으로 한 번에 처리합니다.
+    """
+    renderers = []
+    run = []  # 아직 조각으로 만들지 않은 문자열/변수 노드
+
+    def flush():
+        if not run:
+            return
+        segments = []
+        literal = ''
+        for node in run:
+            if isinstance(node, str):
+                literal += node
+            else:
+                segments.append((literal, node[1]))
+                literal = ''
+        segments.append((literal, None))
+        segments = tuple(segments)
+        renderers.append(lambda values: _render_segments(segments, values))
+        run.clear()
+
+    for node in nodes:
+        if isinstance(node, str) or node[0] == 'var':
+            run.append(node)
+        elif node[0] == 'loop':
+            flush()
+            renderers.append(_loop_renderer(node[1], _compile_nodes(node[2])))
+        else:
+            flush()
+            renderers.append(_condition_renderer(
+                node[1], node[2], _compile_nodes(node[3]), _compile_nodes(node[4])))
+    flush()
+
+    if not renderers:
+        return lambda values: ''
+    if len(renderers) == 1:
+        return renderers[0]
+    return lambda values: ''.join([render(values) for render in renderers])
+
+
+def _loop_renderer(name, render_body):
+    """목록의 항목마다 본문 렌더링 (항목의 값이 바깥 변수보다 우선)"""
+    def render(values):
+        items = values.get(name)
+        if not isinstance(items, (list, tuple)):
+            return ''
+        return ''.join([render_body(ChainMap(item, values)) for item in items])
+    return render
+
+
+def _condition_renderer(name, negate, render_then, render_else):
+    def render(values):
+        if is_truthy(values.get(name)) != negate:
+            return render_then(values)
+        return render_else(values)
+    return render
+
+
+def _bind_nodes(nodes, constants):
+    """상수 변수를 문자열로 바꾸고, 상수 조건은 해당 쪽 블록만 남김"""
+    bound = []
+    for node in nodes:
+        if isinstance(node, str):
+            bound.append(node)
+        elif node[0] == 'var':
+            bound.append(str(constants[node[1]]) if node[1] in constants else node)
+        elif node[0] == 'if' and node[1] in constants:
+            branch = node[3] if is_truthy(constants[node[1]]) != node[2] else node[4]
+            bound.extend(_bind_nodes(branch, constants))
+        elif node[0] == 'if':
+            bound.append(['if', node[1], node[2],
+                          _bind_nodes(node[3], constants), _bind_nodes(node[4], constants)])
+        else:
+            # 반복 블록 안은 항목 값이 상수보다 우선하므로 렌더링 때 찾음
+            bound.append(node)
+    return bound
+
+
+def _collect_names(nodes, variables, loops):
+    for node in nodes:
+        if isinstance(node, str):
+            continue
+        variables.add(node[1])
+        if node[0] == 'loop':
+            loops.add(node[1])
+            _collect_names(node[2], variables, loops)
+        elif node[0] == 'if':
+            _collect_names(node[3], variables, loops)
+            _collect_names(node[4], variables, loops)
+
+
+class CompiledTemplate:
+    """한 번 분석해서 렌더링 함수로 만들어 둔 양식
+
+    render()는 양식을 한 번만 훑으며 값을 채웁니다.
+    값이 없는 변수는 {이름} 그대로 남깁니다.
+    채운 값은 글자 그대로 들어가며, 값 안에 있는 {이름}은 다시 치환하지 않습니다.
+    반복/조건 블록 문법이 틀리면 TemplateSyntaxError가 발생합니다.
+    """
+
+    __slots__ = ('nodes', 'variables', 'loops', 'render')
+
+    def __init__(self, text=None, nodes=None):
+        self.nodes = parse_template(text) if nodes is None else nodes
+        variables, loops = set(), set()
+        _collect_names(self.nodes, variables, loops)
+        self.variables = frozenset(variables)  # 양식에서 쓰는 모든 이름 (조건·반복 목록 포함)
+        self.loops = frozenset(loops)          # 반복하는 목록 이름
+        self.render = _compile_nodes(self.nodes)
+
+    def bind(self, constants):
+        """일부 변수 값을 미리 채운 양식 (남은 변수만 render()에서 채움)"""
+        if not constants or not self.variables & constants.keys():
+            return self
+        return CompiledTemplate(nodes=_bind_nodes(self.nodes, constants))
+
+
+_compiled_templates = {}  # {양식 문자열: CompiledTemplate}
+_compiled_templates_lock = threading.Lock()
+
+
+def compile_template(text):
+    """양식 문자열 분석 (같은 내용은 캐시된 결과 사용)"""
+    with _compiled_templates_lock:
+        compiled = _compiled_templates.get(text)
+        if compiled is None:
+            if len(_compiled_templates) >= TEMPLATE_CACHE_SIZE:
+                _compiled_templates.clear()
+            compiled = _compiled_templates[text] = CompiledTemplate(text)
+        return compiled
+
+
+def format_file_size(size):
+    """파일 크기 표시 (예: 512KB, 1.2MB)"""
+    if size >= 1024 * 1024:
+        return f"{size / (1024 * 1024):.1f}MB"
+    return f"{max(1, round(size / 1024))}KB" if size else "0KB"
+
+
+def file_template_variables(pdf_paths, sizes=None):
+    """첨부 파일 양식 변수 ({파일명}은 첫 번째 파일, {#반복 파일}의 항목은 파일명/파일크기/번호)
+
+    sizes: 파일 크기 목록 (미리보기의 예시 파일용, 없으면 파일에서 읽음)
+    """
+    files = []
+    for number, path in enumerate(pdf_paths, 1):
+        try:
+            size = sizes[number - 1] if sizes else path.stat().st_size
+        except OSError:
+            size = 0
+        files.append({'파일명': path.name, '파일크기': format_file_size(size), '번호': str(number)})
+    return {
+        '파일명': files[0]['파일명'] if files else '',
+        '파일': files,
+        '파일수': str(len(files)),
+        '여러파일': '예' if len(files) > 1 else '',
+    }
+
+
+COMPANY_TEMPLATE_VARIABLES = frozenset({'회사명', '파일명', '파일', '파일수', '여러파일'})  # 회사마다 다른 기본 변수
+RESERVED_TEMPLATE_VARIABLES = frozenset({'파일', '파일수', '여러파일'})  # 커스텀·회사 변수로 덮어쓸 수 없는 기본 변수
+
+# 본문 양식에 {#반복 파일} 블록이 없을 때 끝에 붙이는 첨부 파일 목록
+DEFAULT_FILE_LIST_TEMPLATE = "{#만약 여러파일}\n\n[첨부 파일]{#반복 파일}\n- {파일명}{/반복}{/만약}"
+
+
+def with_default_file_list(body_text):
+    """본문 양식이 첨부 파일 목록을 직접 만들지 않으면 기본 목록 블록을 덧붙임"""
+    if '파일' in compile_template(body_text).loops:
+        return body_text
+    return body_text + DEFAULT_FILE_LIST_TEMPLATE
+
+
+def time_template_variables(now):
+    """날짜/시간 양식 변수 값 {변수 이름: 값}"""
+    return {
+        '날짜': now.strftime('%Y-%m-%d'),
+        '시간': now.strftime('%H:%M:%S'),
+        # 세분화된 날짜 변수들
+        '년': now.strftime('%Y'),
+        '월': now.strftime('%m'),
+        '일': now.strftime('%d'),
+        '요일': now.strftime('%A'),
+        '요일한글': WEEKDAYS_KO[now.weekday()],
+        # 세분화된 시간 변수들
+        '시': now.strftime('%H'),
+        '분': now.strftime('%M'),
+        '초': now.strftime('%S'),
+        # 12시간 형식
+        '시간12': now.strftime('%I:%M %p'),
+        '오전오후': '오전' if now.hour < 12 else '오후',
+    }
+
+
+RENDER_TIMESTAMP_FORMATS = ('%Y-%m-%d %H:%M', '%Y-%m-%d %H:%M:%S', '%Y-%m-%d')
+
+
+def parse_render_timestamp(text):
+    """양식 날짜/시간 고정 시각 변환 (비었으면 None, 형식이 틀리면 ValueError)"""
+    text = (text or '').strip()
+    if not text:
+        return None
+    for fmt in RENDER_TIMESTAMP_FORMATS:
+        try:
+            return datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+    raise ValueError(f"날짜/시간 형식이 올바르지 않습니다: {text} (예: 2024-01-15 09:00)")
+
+
+class RenderContext:
+    """발송 1회 동안 공통으로 쓰는 양식 변수
+
+    날짜/시간 변수는 만들 때 한 번만 계산하므로 모든 회사가 같은 시각으로 렌더링됩니다.
+    회사별 값은 values()에서 그 위에 겹쳐 놓습니다
+    (우선순위: 첨부 파일 목록 > 회사 변수 > 커스텀 변수 > 회사명·파일명 > 날짜/시간).
+    첨부 파일 목록 변수(RESERVED_TEMPLATE_VARIABLES)는 반복 블록과 기본 파일 목록이 쓰므로
+    같은 이름의 커스텀·회사 변수가 있어도 덮어쓰지 않습니다.
+    """
+
+    def __init__(self, now=None, custom_vars=None):
+        self.pinned = now is not None
+        self.now = now or datetime.now()
+        self.batch = time_template_variables(self.now)
+        self.custom = dict(custom_vars or {})
+
+    @classmethod
+    def from_config(cls, config_manager):
+        """설정의 고정 시각과 커스텀 변수로 생성 (고정 시각 형식이 틀리면 ValueError)"""
+        return cls(parse_render_timestamp(config_manager.get('render_timestamp', '')),
+                   config_manager.get('custom_variables', {}))
+
+    def values(self, company_name, pdf_paths=(), company_vars=None, file_sizes=None):
+        """회사 하나의 변수 값 (복사하지 않고 층으로 겹침, 첨부 파일 목록 다음으로 회사 변수가 우선)"""
+        files = file_template_variables(pdf_paths, file_sizes)
+        company = {'회사명': company_name, '파일명': files.pop('파일명')}
+        return ChainMap(files, company_vars or {}, self.custom, company, self.batch)
+
+    def render(self, text, company_name, pdf_paths=(), company_vars=None):
+        return compile_template(text).render(self.values(company_name, pdf_paths, company_vars))
+
+
+# 프로세스를 띄우는 비용(Windows에서는 프로세스마다 1초 안팎)이 렌더링보다 커서 아주 많을 때만 나눔
+BATCH_RENDER_PROCESS_MIN = 50000  # 이 건수 이상이면 여러 프로세스로 나눠 렌더링
+BATCH_RENDER_CHUNK = 5000         # 프로세스에 한 번에 넘기는 메일 수
+
+
+def _render_rows(subject_text, body_text, constants, rows):
+    """공통 값을 채운 양식으로 메일 여러 건 렌더링 (프로세스 풀에서도 호출)
+
+    rows: [{회사마다 다른 변수: 값}] -> [(제목, 본문)]
+    반복 블록 안에서는 공통 값도 렌더링 때 찾으므로 constants를 함께 넘깁니다.
+    """
+    subject = compile_template(subject_text).bind(constants)
+    body = compile_template(body_text).bind(constants)
+    results = []
+    for row in rows:
+        values = ChainMap(row, constants)
+        results.append((subject.render(values), body.render(values)))
+    return results
+
+
+def render_batch(subject_text, body_text, context, rows, process_min=BATCH_RENDER_PROCESS_MIN):
+    """같은 양식을 쓰는 메일 여러 건을 한 번에 렌더링
+
+    모든 메일에 같은 값(날짜/시간, 커스텀 변수)은 양식에 한 번만 채우고
+    회사마다 다른 변수만 메일별로 채웁니다. 건수가 많으면 여러 프로세스로 나눕니다.
+    rows: [(회사명, 첨부 파일 경로 목록, 회사 변수 또는 None)]
+    Returns: [(제목, 본문)] - rows와 같은 순서
+    양식 문법이 틀리면 TemplateSyntaxError가 발생합니다.
+    """
+    names = compile_template(subject_text).variables | compile_template(body_text).variables
+    varying = set(COMPANY_TEMPLATE_VARIABLES)
+    for _, _, company_vars in rows:
+        if company_vars:
+            varying.update(company_vars)
+    varying &= names
+
+    shared = context.values('')
+    constants = {name: shared[name] for name in names - varying if name in shared}
+    value_rows = []
+    for company_name, pdf_paths, company_vars in rows:
+        values = context.values(company_name, pdf_paths, company_vars)
+        value_rows.append({name: values[name] for name in varying if name in values})
+
+    if len(value_rows) >= process_min and (os.cpu_count() or 1) > 1:
+        chunks = [value_rows[i:i + BATCH_RENDER_CHUNK]
+                  for i in range(0, len(value_rows), BATCH_RENDER_CHUNK)]
+        try:
+            with ProcessPoolExecutor(max_workers=min(len(chunks), os.cpu_count() or 1)) as pool:
+                results = pool.map(_render_rows, [subject_text] * len(chunks),
+                                   [body_text] * len(chunks), [constants] * len(chunks), chunks)
+                return [item for chunk in results for item in chunk]
+        except Exception as e:
+            logging.warning(f"여러 프로세스로 렌더링하지 못해 한 프로세스로 렌더링합니다: {e}")
+    return _render_rows(subject_text, body_text, constants, value_rows)
+
+
 def center_window(child_window, parent_window, width=None, height=None):
     """창을 부모 창의 중앙에 위치시키는 함수"""
     child_window.update_idletasks()
@@ -253,6 +2401,20 @@ def center_window(child_window, parent_window, width=None, height=None):
     child_window.geometry(f"{width}x{height}+{x}+{y}")
 
 
+def open_folder_in_explorer(folder):
+    """운영체제의 파일 탐색기로 폴더 열기 (Windows 탐색기, macOS Finder, Linux xdg-open)"""
+    import subprocess
+    import platform
+
+    folder = str(folder)
+    if platform.system() == 'Windows':
+        os.startfile(folder)
+    elif platform.system() == 'Darwin':  # macOS
+        subprocess.Popen(['open', folder])
+    else:  # Linux
+        subprocess.Popen(['xdg-open', folder])
+
+
 class SettingsDialog:
     """설정 대화상자"""
 
@@ -267,6 +2429,8 @@ class SettingsDialog:
             config_manager.get('companies', {}))
         self.temp_templates = copy.deepcopy(
             config_manager.get('email_templates', {}))
+        self.temp_accounts = copy.deepcopy(
+            config_manager.get('email.accounts', []))
 
         self.dialog = tk.Toplevel(parent)
         self.dialog.title("설정")
@@ -803,9 +2967,28 @@ class SettingsDialog:
             bg="#f0f0f0", relief="sunken", bd=1)
         self.test_result_label.grid(row=2, column=0, sticky="nsew", padx=10, pady=(0, 10))
 
+        # 추가 발신 계정 (일일 발송 한도 분산)
+        accounts_frame = tk.LabelFrame(parent, text="📨 추가 발신 계정")
+        accounts_frame.grid(row=3, column=0, sticky="nsew", padx=10, pady=(0, 10))
+
+        self.account_listbox = tk.Listbox(accounts_frame, height=3)
+        self.account_listbox.pack(fill=tk.X, padx=5, pady=(5, 0))
+        self.refresh_account_list()
+
+        account_btn_frame = tk.Frame(accounts_frame)
+        account_btn_frame.pack(fill=tk.X, padx=5, pady=5)
+        ttk.Button(account_btn_frame, text="추가", command=self.add_account).pack(
+            side=tk.LEFT, padx=5)
+        ttk.Button(account_btn_frame, text="수정", command=self.edit_account).pack(
+            side=tk.LEFT, padx=5)
+        ttk.Button(account_btn_frame, text="삭제", command=self.delete_account).pack(
+            side=tk.LEFT, padx=5)
+        tk.Label(account_btn_frame, text="여러 계정이 있으면 남은 한도와 전송 속도에 따라 회사를 나눠 보냅니다",
+                 fg='gray', font=('맑은 고딕', 8)).pack(side=tk.LEFT, padx=5)
+
         # 도움말 프레임
         help_frame = tk.LabelFrame(parent, text="📖 설정 도움말")
-        help_frame.grid(row=3, column=0, sticky="nsew", padx=10, pady=10)
+        help_frame.grid(row=4, column=0, sticky="nsew", padx=10, pady=10)
 
         help_text = scrolledtext.ScrolledText(
             help_frame, wrap=tk.WORD, font=('맑은 고딕', 9), cursor="arrow")
@@ -817,7 +3000,8 @@ class SettingsDialog:
         parent.grid_rowconfigure(0, weight=0)  # input_frame
         parent.grid_rowconfigure(1, weight=0)  # btn_frame  
         parent.grid_rowconfigure(2, weight=0)  # test_result_label
-        parent.grid_rowconfigure(3, weight=1, minsize=100)  # help_frame (확장)
+        parent.grid_rowconfigure(3, weight=0)  # accounts_frame
+        parent.grid_rowconfigure(4, weight=1, minsize=100)  # help_frame (확장)
         parent.grid_columnconfigure(0, weight=1, minsize=50)
 
         help_content = """📧 SMTP 설정이란?
@@ -946,6 +3130,17 @@ SMTP는 "Simple Mail Transfer Protocol"의 줄임말로, 이메일을 자동으
 
 💡 이메일 서비스를 선택하면 서버와 포트가 자동으로 설정됩니다!
 
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+ 📨 추가 발신 계정
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+한 계정의 일일 발송 한도(Gmail 하루 500명 등)를 넘게 보내야 할 때 사용합니다.
+
+• "추가" 버튼으로 다른 계정을 등록하세요 (다른 이메일 서비스도 가능)
+• 발송할 때 남은 한도가 많고 전송이 빠른 계정을 골라 회사별로 나눠 보냅니다
+• 계정마다 SMTP 연결을 따로 유지합니다
+• 특정 회사는 항상 같은 계정으로 보내려면 '회사 정보'에서 발신 계정을 고정하세요
+
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
  🔧 문제 해결
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -1213,41 +3408,135 @@ SMTP는 "Simple Mail Transfer Protocol"의 줄임말로, 이메일을 자동으
         ttk.Label(parent, text="자동 실행 대기 시간 (초):").pack(
             anchor=tk.W, pady=(20, 5), padx=10)
 
-        timeout_frame = ttk.Frame(parent)
-        timeout_frame.pack(fill=tk.X, pady=5, padx=10)
+        timeout_frame = ttk.Frame(parent)
+        timeout_frame.pack(fill=tk.X, pady=5, padx=10)
+
+        ttk.Label(timeout_frame, text="모드 선택:").pack(
+            side=tk.LEFT, padx=(0, 10))
+        self.auto_select_var = tk.StringVar(
+            value=str(self.config_manager.get('auto_select_timeout', 10)))
+        ttk.Entry(timeout_frame, textvariable=self.auto_select_var,
+                  width=10).pack(side=tk.LEFT)
+
+        ttk.Label(timeout_frame, text="발송 확인:").pack(
+            side=tk.LEFT, padx=(20, 10))
+        self.auto_send_var = tk.StringVar(
+            value=str(self.config_manager.get('auto_send_timeout', 10)))
+        ttk.Entry(timeout_frame, textvariable=self.auto_send_var,
+                  width=10).pack(side=tk.LEFT)
+
+        ttk.Label(parent, text="* 0: 즉시 실행, 음수: 비활성화",
+                 foreground='gray').pack(anchor=tk.W, pady=2, padx=10)
+
+        # 메일 1건 제한 시간 설정
+        ttk.Label(parent, text="메일 1건 기본 제한 시간 (초):").pack(
+            anchor=tk.W, pady=(20, 5), padx=10)
+
+        email_timeout_frame = ttk.Frame(parent)
+        email_timeout_frame.pack(fill=tk.X, pady=5, padx=10)
+
+        self.message_deadline_base_var = tk.StringVar(
+            value=str(self.config_manager.get('message_deadline_base', 60)))
+        ttk.Entry(email_timeout_frame, textvariable=self.message_deadline_base_var,
+                  width=10).pack(side=tk.LEFT)
+        ttk.Label(email_timeout_frame, text="초 (기본값: 60초)",
+                 foreground='gray').pack(side=tk.LEFT, padx=(10, 0))
+
+        ttk.Label(parent, text="* 첨부 파일 크기와 측정된 업로드 속도에 따라 자동으로 늘어나며,\n"
+                               "  넘긴 메일 1건만 중단하고 다시 보냅니다",
+                 foreground='gray').pack(anchor=tk.W, pady=2, padx=10)
+
+        # 발송 재시도 설정
+        ttk.Label(parent, text="발송 실패 시 재시도:").pack(
+            anchor=tk.W, pady=(20, 5), padx=10)
+
+        retry_frame = ttk.Frame(parent)
+        retry_frame.pack(fill=tk.X, pady=5, padx=10)
 
-        ttk.Label(timeout_frame, text="모드 선택:").pack(
+        ttk.Label(retry_frame, text="최대 시도 횟수:").pack(
             side=tk.LEFT, padx=(0, 10))
-        self.auto_select_var = tk.StringVar(
-            value=str(self.config_manager.get('auto_select_timeout', 10)))
-        ttk.Entry(timeout_frame, textvariable=self.auto_select_var,
+        self.retry_max_attempts_var = tk.StringVar(
+            value=str(self.config_manager.get('retry_max_attempts', 3)))
+        ttk.Entry(retry_frame, textvariable=self.retry_max_attempts_var,
                   width=10).pack(side=tk.LEFT)
 
-        ttk.Label(timeout_frame, text="발송 확인:").pack(
+        ttk.Label(retry_frame, text="최대 대기 시간(초):").pack(
             side=tk.LEFT, padx=(20, 10))
-        self.auto_send_var = tk.StringVar(
-            value=str(self.config_manager.get('auto_send_timeout', 10)))
-        ttk.Entry(timeout_frame, textvariable=self.auto_send_var,
+        self.retry_backoff_max_var = tk.StringVar(
+            value=str(self.config_manager.get('retry_backoff_max', 60)))
+        ttk.Entry(retry_frame, textvariable=self.retry_backoff_max_var,
                   width=10).pack(side=tk.LEFT)
 
-        ttk.Label(parent, text="* 0: 즉시 실행, 음수: 비활성화",
+        ttk.Label(parent, text="* 실패한 회사는 대기 시간을 2배씩 늘려가며 재시도하고, 그동안 다른 회사는 계속 발송합니다",
                  foreground='gray').pack(anchor=tk.W, pady=2, padx=10)
 
-        # 이메일 발송 타임아웃 설정
-        ttk.Label(parent, text="이메일 발송 최대 대기 시간 (초):").pack(
+        # 동시 발송 설정
+        ttk.Label(parent, text="최대 동시 발송 수:").pack(
             anchor=tk.W, pady=(20, 5), padx=10)
 
-        email_timeout_frame = ttk.Frame(parent)
-        email_timeout_frame.pack(fill=tk.X, pady=5, padx=10)
+        concurrency_frame = ttk.Frame(parent)
+        concurrency_frame.pack(fill=tk.X, pady=5, padx=10)
 
-        self.email_send_timeout_var = tk.StringVar(
-            value=str(self.config_manager.get('email_send_timeout', 180)))
-        ttk.Entry(email_timeout_frame, textvariable=self.email_send_timeout_var,
-                  width=10).pack(side=tk.LEFT)
-        ttk.Label(email_timeout_frame, text="초 (기본값: 180초 = 3분)",
+        self.max_concurrency_var = tk.StringVar(
+            value=str(self.config_manager.get('max_concurrency', 4)))
+        ttk.Spinbox(concurrency_frame, from_=1, to=10, textvariable=self.max_concurrency_var,
+                    width=8).pack(side=tk.LEFT)
+        ttk.Label(concurrency_frame, text="개 (기본값: 4)",
+                 foreground='gray').pack(side=tk.LEFT, padx=(10, 0))
+
+        ttk.Label(parent, text="* 1개부터 시작해 서버 응답이 좋으면 늘리고, 서버가 속도 제한을 걸면 절반으로 줄입니다",
+                 foreground='gray').pack(anchor=tk.W, pady=2, padx=10)
+
+        # 발송 순서 설정
+        ttk.Label(parent, text="발송 순서:").pack(
+            anchor=tk.W, pady=(20, 5), padx=10)
+
+        queue_order = self.config_manager.get('queue_order', 'original')
+        self.queue_order_var = tk.StringVar(
+            value=QUEUE_ORDERS.get(queue_order, QUEUE_ORDERS['original']))
+        ttk.Combobox(parent, textvariable=self.queue_order_var,
+                     values=list(QUEUE_ORDERS.values()), state='readonly',
+                     width=30).pack(anchor=tk.W, pady=5, padx=10)
+
+        ttk.Label(parent, text="* 우선순위와 마감 시각은 회사 정보에서 회사마다 지정합니다",
+                 foreground='gray').pack(anchor=tk.W, pady=2, padx=10)
+
+        # 로그 설정
+        ttk.Label(parent, text="화면 로그 최대 줄 수:").pack(
+            anchor=tk.W, pady=(20, 5), padx=10)
+
+        log_frame = ttk.Frame(parent)
+        log_frame.pack(fill=tk.X, pady=5, padx=10)
+
+        self.log_max_lines_var = tk.StringVar(
+            value=str(self.config_manager.get('log_max_lines', 5000)))
+        ttk.Spinbox(log_frame, from_=LOG_MAX_LINES_MIN, to=100000, increment=500,
+                    textvariable=self.log_max_lines_var, width=8).pack(side=tk.LEFT)
+        ttk.Label(log_frame, text="줄   로그 기록 보관:").pack(side=tk.LEFT, padx=(10, 5))
+        self.log_history_days_var = tk.StringVar(
+            value=str(self.config_manager.get('log_history_days', 30)))
+        ttk.Spinbox(log_frame, from_=1, to=365, textvariable=self.log_history_days_var,
+                    width=6).pack(side=tk.LEFT)
+        ttk.Label(log_frame, text="일", foreground='gray').pack(side=tk.LEFT, padx=(5, 0))
+
+        ttk.Label(parent, text="* 화면에서 지워진 로그도 logs 폴더에 남으며, 메인 화면의 '🔍 로그 검색'으로 찾을 수 있습니다",
+                 foreground='gray').pack(anchor=tk.W, pady=2, padx=10)
+
+        # 양식 날짜/시간 고정
+        ttk.Label(parent, text="양식 날짜/시간 고정:").pack(
+            anchor=tk.W, pady=(20, 5), padx=10)
+
+        render_timestamp_frame = ttk.Frame(parent)
+        render_timestamp_frame.pack(fill=tk.X, pady=5, padx=10)
+
+        self.render_timestamp_var = tk.StringVar(
+            value=self.config_manager.get('render_timestamp', ''))
+        ttk.Entry(render_timestamp_frame, textvariable=self.render_timestamp_var,
+                  width=20).pack(side=tk.LEFT)
+        ttk.Label(render_timestamp_frame, text="(예: 2024-01-15 09:00)",
                  foreground='gray').pack(side=tk.LEFT, padx=(10, 0))
 
-        ttk.Label(parent, text="* 이메일 발송이 이 시간을 초과하면 자동으로 중단됩니다",
+        ttk.Label(parent, text="* 비워 두면 발송 시작 시각이 {날짜}, {시간} 등에 들어갑니다 (모든 회사 같은 시각)",
                  foreground='gray').pack(anchor=tk.W, pady=2, padx=10)
 
         # 버전 정보
@@ -1272,6 +3561,24 @@ SMTP는 "Simple Mail Transfer Protocol"의 줄임말로, 이메일을 자동으
         ttk.Label(parent, text="* 디버그 모드 활성화 시 상세한 UI 구성 로그가 표시됩니다",
                  foreground='gray').pack(anchor=tk.W, pady=2, padx=10)
 
+        # 분류별 로그 레벨 (비우면 디버그 모드를 따름)
+        ttk.Label(parent, text="분류별 로그 레벨:").pack(
+            anchor=tk.W, pady=(10, 5), padx=10)
+        level_frame = ttk.Frame(parent)
+        level_frame.pack(anchor=tk.W, pady=5, padx=10)
+        self.log_level_vars = {}
+        for row, (category, label) in enumerate(LOG_CATEGORIES.items()):
+            ttk.Label(level_frame, text=f"{label}:").grid(
+                row=row, column=0, sticky=tk.W, pady=2)
+            level = self.config_manager.get(f'log_level_{category}', '') or LOG_LEVEL_FOLLOW_DEBUG
+            self.log_level_vars[category] = tk.StringVar(value=level)
+            ttk.Combobox(level_frame, textvariable=self.log_level_vars[category],
+                         values=[LOG_LEVEL_FOLLOW_DEBUG, 'DEBUG', 'INFO', 'WARNING', 'ERROR'],
+                         state='readonly', width=20).grid(row=row, column=1, sticky=tk.W, padx=(10, 0), pady=2)
+
+        ttk.Label(parent, text="* 예: SMTP만 DEBUG로 두면 SMTP 통신 과정만 자세히 표시됩니다",
+                 foreground='gray').pack(anchor=tk.W, pady=2, padx=10)
+
         # 구분선
         ttk.Separator(parent, orient='horizontal').pack(
             fill=tk.X, pady=20, padx=10)
@@ -1356,8 +3663,9 @@ SMTP는 "Simple Mail Transfer Protocol"의 줄임말로, 이메일을 자동으
         for company_name, info in companies.items():
             emails = ', '.join(info.get('emails', []))
             template = info.get('template', 'A')
+            pinned = f" | 📌 {info['account']}" if info.get('account') else ""
             self.company_listbox.insert(
-                tk.END, f"{company_name} | {emails} | {template}")
+                tk.END, f"{company_name} | {emails} | {template}{pinned}")
 
     def add_company(self):
         """회사 추가"""
@@ -1410,6 +3718,55 @@ SMTP는 "Simple Mail Transfer Protocol"의 줄임말로, 이메일을 자동으
             messagebox.showerror(
                 "오류", f"회사 삭제 중 오류가 발생했습니다.\n\n{str(e, parent=self.dialog)}")
 
+    def refresh_account_list(self):
+        """추가 발신 계정 목록 새로고침"""
+        self.account_listbox.delete(0, tk.END)
+        for account in self.config_manager.get('email.accounts', []):
+            state = "" if account.get('enabled', True) else " (사용 안 함)"
+            self.account_listbox.insert(
+                tk.END, f"{account.get('sender_email', '')} | "
+                        f"{account.get('smtp_server', '')}:{account.get('smtp_port', '')}{state}")
+
+    def add_account(self):
+        """추가 발신 계정 추가"""
+        try:
+            SenderAccountDialog(self.dialog, self.config_manager, None,
+                                self.refresh_account_list, parent_gui=self.parent_gui)
+        except Exception as e:
+            logging.error(f"발신 계정 추가 오류: {e}")
+            messagebox.showerror(
+                "오류", f"발신 계정 추가 중 오류가 발생했습니다.\n\n{str(e)}", parent=self.dialog)
+
+    def edit_account(self):
+        """추가 발신 계정 수정"""
+        selection = self.account_listbox.curselection()
+        if not selection:
+            messagebox.showwarning(
+                "선택 없음", "수정할 계정을 선택하세요.", parent=self.dialog)
+            return
+        try:
+            SenderAccountDialog(self.dialog, self.config_manager, selection[0],
+                                self.refresh_account_list, parent_gui=self.parent_gui)
+        except Exception as e:
+            logging.error(f"발신 계정 수정 오류: {e}")
+            messagebox.showerror(
+                "오류", f"발신 계정 수정 중 오류가 발생했습니다.\n\n{str(e)}", parent=self.dialog)
+
+    def delete_account(self):
+        """추가 발신 계정 삭제"""
+        selection = self.account_listbox.curselection()
+        if not selection:
+            messagebox.showwarning(
+                "선택 없음", "삭제할 계정을 선택하세요.", parent=self.dialog)
+            return
+
+        accounts = list(self.config_manager.get('email.accounts', []))
+        sender_email = accounts[selection[0]].get('sender_email', '')
+        if messagebox.askyesno("삭제 확인", f"'{sender_email}' 계정을 삭제하시겠습니까?", parent=self.dialog):
+            del accounts[selection[0]]
+            self.config_manager.set('email.accounts', accounts)
+            self.refresh_account_list()
+
     def refresh_template_list(self):
         """양식 목록 새로고침"""
         self.template_listbox.delete(0, tk.END)
@@ -1504,20 +3861,10 @@ SMTP는 "Simple Mail Transfer Protocol"의 줄임말로, 이메일을 자동으
 
     def detect_email_service(self, server, port):
         """현재 서버/포트로 이메일 서비스 감지"""
-        port = int(port) if isinstance(port, str) else port
-        
-        if server == 'smtp.gmail.com' and port == 587:
-            self.email_service_var.set("Gmail (TLS)")
-        elif server == 'smtp.gmail.com' and port == 465:
-            self.email_service_var.set("Gmail (SSL)")
-        elif server == 'smtp.naver.com' and port == 587:
-            self.email_service_var.set("Naver")
-        elif server == 'smtp.daum.net' and port == 465:
-            self.email_service_var.set("Daum")
-        elif server == 'smtp-mail.outlook.com' and port == 587:
-            self.email_service_var.set("Outlook")
-        else:
-            self.email_service_var.set("직접 입력")
+        service = detect_email_service_name(server, port)
+        self.email_service_var.set(service)
+
+        if service == "직접 입력":
             # 직접 입력 모드로 전환
             self.smtp_server_entry.config(state='normal')
             self.smtp_port_entry.config(state='normal')
@@ -1528,11 +3875,7 @@ SMTP는 "Simple Mail Transfer Protocol"의 줄임말로, 이메일을 자동으
         
         # 서비스별 설정
         email_services = {
-            "Gmail (TLS)": ("smtp.gmail.com", "587"),
-            "Gmail (SSL)": ("smtp.gmail.com", "465"),
-            "Naver": ("smtp.naver.com", "587"),
-            "Daum": ("smtp.daum.net", "465"),
-            "Outlook": ("smtp-mail.outlook.com", "587"),
+            name: (server, str(port)) for name, (server, port) in EMAIL_SERVICES.items()
         }
         
         if service == "직접 입력":
@@ -1581,16 +3924,9 @@ SMTP는 "Simple Mail Transfer Protocol"의 줄임말로, 이메일을 자동으
             return
 
         try:
-            # 포트에 따라 SSL/TLS 선택
-            if smtp_port == 465:
-                # SSL 연결
-                server = smtplib.SMTP_SSL(smtp_server, smtp_port, timeout=10)
-            else:
-                # TLS 연결
-                server = smtplib.SMTP(smtp_server, smtp_port, timeout=10)
-            server.starttls()
-            
-            server.login(sender_email, sender_password)
+            # 포트에 따라 SSL/TLS 선택 후 로그인
+            server = open_smtp_connection(smtp_server, smtp_port, sender_email,
+                                          sender_password, timeout=10)
             server.quit()
 
             self.test_result_label.config(
@@ -1652,9 +3988,30 @@ SMTP는 "Simple Mail Transfer Protocol"의 줄임말로, 이메일을 자동으
                 self.auto_select_var.get())
             self.config_manager.config['auto_send_timeout'] = int(
                 self.auto_send_var.get())
-            self.config_manager.config['email_send_timeout'] = int(
-                self.email_send_timeout_var.get())
+            self.config_manager.config['message_deadline_base'] = max(10, int(
+                self.message_deadline_base_var.get()))
+            self.config_manager.config['retry_max_attempts'] = max(1, int(
+                self.retry_max_attempts_var.get()))
+            self.config_manager.config['retry_backoff_max'] = max(0, int(
+                self.retry_backoff_max_var.get()))
+            self.config_manager.config['max_concurrency'] = min(10, max(1, int(
+                self.max_concurrency_var.get())))
+            self.config_manager.config['log_max_lines'] = max(LOG_MAX_LINES_MIN, int(
+                self.log_max_lines_var.get()))
+            self.config_manager.config['log_history_days'] = max(1, int(
+                self.log_history_days_var.get()))
+            if self.parent_gui:
+                self.parent_gui.log_history.keep_days = self.config_manager.config['log_history_days']
+            render_timestamp = self.render_timestamp_var.get().strip()
+            parse_render_timestamp(render_timestamp)  # 형식이 틀리면 ValueError
+            self.config_manager.config['render_timestamp'] = render_timestamp
+            self.config_manager.config['queue_order'] = next(
+                (key for key, label in QUEUE_ORDERS.items() if label == self.queue_order_var.get()),
+                'original')
             self.config_manager.config['debug_mode'] = self.debug_mode_var.get()
+            for category, var in self.log_level_vars.items():
+                level = var.get()
+                self.config_manager.config[f'log_level_{category}'] = '' if level == LOG_LEVEL_FOLLOW_DEBUG else level
             
             # 글자 크기 설정 저장
             old_font_size = self.config_manager.get('ui.font_size', 9)
@@ -1677,8 +4034,13 @@ SMTP는 "Simple Mail Transfer Protocol"의 줄임말로, 이메일을 자동으
                            old_smtp_server != new_smtp_server or
                            old_smtp_port != new_smtp_port)
 
+            # 발송 중이면 발송 스레드가 연결을 쓰고 있으므로 끝난 뒤 새 설정으로 연결
+            if email_changed and self.parent_gui and self.parent_gui.sending:
+                self.parent_gui.reconnect_after_send = True
+                self.parent_gui.log(
+                    "📧 이메일 설정이 변경되었습니다. 진행 중인 발송이 끝나면 새 설정으로 연결합니다.", 'INFO')
             # 이메일 설정이 변경되었으면 기존 연결 완전히 제거하고 새로 연결
-            if email_changed and self.parent_gui:
+            elif email_changed and self.parent_gui:
                 self.parent_gui.log(
                     "📧 이메일 설정이 변경되었습니다. 기존 연결을 완전히 제거합니다.", 'INFO')
                 # 기존 연결 완전히 제거
@@ -1712,6 +4074,7 @@ SMTP는 "Simple Mail Transfer Protocol"의 줄임말로, 이메일을 자동으
         # 임시 데이터 복원
         self.config_manager.set('companies', self.temp_companies)
         self.config_manager.set('email_templates', self.temp_templates)
+        self.config_manager.set('email.accounts', self.temp_accounts)
         self.result = False
         self.dialog.destroy()
 
@@ -1836,13 +4199,31 @@ SMTP는 "Simple Mail Transfer Protocol"의 줄임말로, 이메일을 자동으
                 'pattern', '^([가-힣A-Za-z0-9\\s]+?)(?:___|\.pdf$)')
             self.config_manager.set('auto_select_timeout', 10)
             self.config_manager.set('auto_send_timeout', 10)
-            self.config_manager.set('email_send_timeout', 180)
+            self.config_manager.set('message_deadline_base', 60)
+            self.config_manager.set('retry_max_attempts', 3)
+            self.config_manager.set('retry_backoff_max', 60)
+            self.config_manager.set('max_concurrency', 4)
+            self.config_manager.set('queue_order', 'original')
+            self.config_manager.set('render_timestamp', '')
+            self.config_manager.set('log_max_lines', 5000)
+            self.config_manager.set('log_history_days', 30)
+            for category in LOG_CATEGORIES:
+                self.config_manager.set(f'log_level_{category}', '')
 
             # UI 업데이트
             self.pattern_var.set('^([가-힣A-Za-z0-9\\s]+?)(?:___|\.pdf$)')
             self.auto_select_var.set('10')
             self.auto_send_var.set('10')
-            self.email_send_timeout_var.set('180')
+            self.message_deadline_base_var.set('60')
+            self.retry_max_attempts_var.set('3')
+            self.retry_backoff_max_var.set('60')
+            self.max_concurrency_var.set('4')
+            self.queue_order_var.set(QUEUE_ORDERS['original'])
+            self.render_timestamp_var.set('')
+            self.log_max_lines_var.set('5000')
+            self.log_history_days_var.set('30')
+            for var in self.log_level_vars.values():
+                var.set(LOG_LEVEL_FOLLOW_DEBUG)
 
             messagebox.showinfo(
                 "초기화 완료", "고급 설정이 초기화되었습니다.", parent=self.dialog)
@@ -2040,6 +4421,40 @@ SMTP는 "Simple Mail Transfer Protocol"의 줄임말로, 이메일을 자동으
   • 오전/오후만 표시됩니다 (예: 오전, 오후)
   • "지금은 {오전오후}입니다" → "지금은 오후입니다"
 
+■ 날짜/시간 기준:
+  • 날짜/시간 변수는 '발송 시작' 시각으로 정해지며,
+    한 번에 보내는 모든 회사에 같은 값이 들어갑니다
+  • 고급 설정의 '양식 날짜/시간 고정'에 시각을 입력하면
+    (예: 2024-01-15 09:00) 그 시각으로 표시됩니다
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+ 🔁 반복과 조건 (첨부 파일 목록 등)
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+■ {#반복 파일} ... {/반복}:
+  • 첨부 파일마다 안쪽 내용을 한 번씩 넣습니다
+  • 안쪽에서는 {파일명}, {파일크기}, {번호}가 그 파일의 값입니다
+  • 예시:
+      {#반복 파일}
+      {번호}. {파일명} ({파일크기}){/반복}
+    → 1. 보고서.pdf (350KB)
+      2. 부록.pdf (1.2MB)
+
+■ {#만약 조건} ... {#아니면} ... {/만약}:
+  • 조건 변수에 값이 있으면 앞쪽을, 없으면 {#아니면} 뒤쪽을 넣습니다
+    ({#아니면} 부분은 생략 가능, {#만약 !조건}은 반대로 동작)
+  • {여러파일}: 첨부 파일이 2개 이상이면 값이 있음
+  • {파일수}: 첨부 파일 개수
+  • 커스텀 변수나 회사 변수도 조건으로 쓸 수 있습니다
+  • 예시: {#만약 여러파일}파일 {파일수}개를 보냅니다{#아니면}{파일명}을 보냅니다{/만약}
+
+■ 기본 첨부 파일 목록:
+  • 본문에 {#반복 파일} 블록이 없으면, 파일이 여러 개일 때
+    본문 끝에 "[첨부 파일]" 목록이 자동으로 붙습니다
+  • 목록 모양을 바꾸고 싶으면 본문에 {#반복 파일} 블록을 직접 넣으세요
+  • {파일}, {파일수}, {여러파일}은 같은 이름의 커스텀·회사 변수를 만들어도
+    항상 실제 첨부 파일 값이 들어갑니다
+
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
  💡 양식 관리 방법
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -2194,30 +4609,136 @@ SMTP는 "Simple Mail Transfer Protocol"의 줄임말로, 이메일을 자동으
   • 수동 확인 필요: -1 (비활성화)
 
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-⏰ 이메일 발송 최대 대기 시간 설정
+⏰ 메일 1건 제한 시간 설정
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
-■ 이메일 발송 타임아웃:
+■ 메일마다 제한 시간이 따로 있습니다:
+
+  제한 시간 = 기본 제한 시간 + 예상 업로드 시간 × 3
 
-  이메일 발송이 이 시간을 초과하면 자동으로 중단됩니다.
+  • 예상 업로드 시간은 첨부 파일 크기와 이번 발송에서 잰 업로드 속도로 계산합니다
+    (아직 잰 적이 없으면 50KB/s로 가정)
+  • 제한 시간을 넘긴 메일 1건만 중단하고 재시도 대기열에 다시 넣습니다
+  • 단, 본문을 끝까지 보내고 서버의 마지막 응답만 기다리던 중이었다면
+    서버가 이미 받았을 수 있으므로 다시 보내지 않고 '수신 여부 불명'으로 실패 처리합니다
+    (중복 발송 방지 - 받는 쪽에 도착했는지 확인하세요)
+  • 다른 회사의 메일은 그대로 계속 발송됩니다
+  • 발송 전체에는 시간 제한이 없으므로 회사가 많아도 중간에 끊기지 않습니다
 
-  • 기본값: 180초 (3분)
-  • 권장 범위: 60~300초 (1~5분)
-  • 네트워크가 느린 환경: 300초 이상
-  • 빠른 환경: 60~120초
+  • 기본값: 60초
+  • 네트워크가 느리거나 불안정한 환경: 120초 이상
 
 ■ 설정 방법:
 
-  1. 고급 설정 탭에서 "이메일 발송 최대 대기 시간" 입력
-  2. 초 단위로 입력 (예: 180 = 3분)
+  1. 고급 설정 탭에서 "메일 1건 기본 제한 시간" 입력
+  2. 초 단위로 입력 (최소 10초)
   3. "저장" 버튼 클릭
 
 ■ 주의사항:
 
-  • 너무 짧게 설정하면 정상 발송도 중단될 수 있습니다!
-  • 너무 길게 설정하면 문제 발생 시 오래 기다려야 합니다!
+  • 너무 짧게 설정하면 서버 응답이 느릴 때 정상 발송도 중단될 수 있습니다!
+  • 발송 전체를 멈추려면 메인 화면의 '⏹ 중지' 버튼을 사용하세요!
   • 네트워크 상황에 맞게 조정하세요!
 
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+ 🔄 발송 실패 시 재시도
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+일시적인 오류로 발송에 실패한 회사는 잠시 후 다시 보냅니다.
+재시도를 기다리는 동안 다른 회사는 계속 발송됩니다.
+
+  • 최대 시도 횟수: 첫 발송을 포함한 횟수 (기본값: 3회)
+  • 최대 대기 시간: 재시도 간격의 상한 (기본값: 60초)
+  • 재시도 간격은 2초 → 4초 → 8초... 처럼 2배씩 늘어나며,
+    여러 회사가 동시에 몰리지 않도록 약간씩 무작위로 조정됩니다
+  • 인증 실패, 파일 크기 초과처럼 다시 보내도 안 되는 경우는
+    재시도하지 않습니다
+  • 발송이 끝나면 로그에 시도 차수별 성공/실패 건수가 표시됩니다
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+ ⚡ 최대 동시 발송 수
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+여러 회사에 동시에 메일을 보내 발송 시간을 줄입니다.
+
+  • 1개부터 시작해 발송이 정상이고 전송 시간이 평소와 비슷하면
+    동시 발송 수를 조금씩 늘립니다 (설정한 최대값까지)
+  • 서버가 "잠시 후 다시 시도"(421, 451 등)로 응답하거나
+    연결이 끊기면 동시 발송 수를 절반으로 줄입니다
+  • 현재 동시 발송 수는 화면 아래 상태 표시줄에 표시됩니다
+  • 계정 하나가 여는 연결 수는 서비스별로 제한됩니다
+    (Gmail·Outlook 3개, Naver·Daum 2개)
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+ 📋 발송 순서
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+보낼 수 있는 회사가 여러 곳이면 어느 회사부터 보낼지 정합니다.
+
+  • PDF 분석 순서: 목록에 나온 순서대로 (기본값)
+  • 용량 작은 회사 먼저: 많은 회사가 빨리 받습니다
+  • 용량 큰 회사 먼저: 큰 메일을 먼저 시작해 전체 시간이 줄어듭니다
+  • 회사별 우선순위: 회사 정보의 '발송 우선순위'가 큰 회사부터
+  • 마감 시각 빠른 회사 먼저: 회사 정보의 '마감 시각'이 빠른 회사부터
+    (마감 시각이 없는 회사는 맨 뒤)
+  • 발송을 시작하면 로그에 예상 소요 시간이 표시되고,
+    마감 시각까지 끝나지 않을 것 같은 회사는 미리 알려줍니다
+  • 남은 예상 시간은 화면 아래 상태 표시줄에 표시됩니다
+  • 발송 중에는 '📤 발송 진행' 창에 보낸 메일 수, 올린 용량,
+    업로드 속도, 남은 시간과 지금 올리는 메일별 진행률이 표시됩니다
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+ 📋 로그 보관
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+오래 켜 두어도 프로그램이 느려지지 않도록 화면에는 최근 로그만 남깁니다.
+
+  • 화면 로그 최대 줄 수: 넘으면 오래된 줄부터 한꺼번에 지웁니다
+    (기본값: 5000줄)
+  • 모든 로그는 설정 파일 옆 logs 폴더에 날짜별 파일로 저장됩니다
+  • 메인 화면의 '🔍 로그 검색'으로 지난 로그를 찾을 수 있고,
+    '📂 로그 폴더'로 파일을 직접 열 수 있습니다
+  • 로그 기록 보관: 지난 파일은 프로그램 시작 때 삭제합니다
+    (기본값: 30일)
+  • 분류별 로그 레벨: PDF 분석 / SMTP 연결·발송 / 파일 이동·폴더
+    로그를 따로 조절합니다 (예: SMTP만 DEBUG, 파일 이동은 WARNING)
+    '기본'이면 디버그 모드 설정을 따릅니다
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+ 🚫 서버 장애 시 발송 중단
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+SMTP 서버가 응답하지 않을 때 회사마다 연결을 기다리느라
+시간을 낭비하지 않도록 그 서버로의 발송을 잠시 멈춥니다.
+
+  • 연결 실패가 3번 연속되면 발송을 멈춥니다
+  • 15초 후 한 건만 시험 발송하여, 성공하면 발송을 재개하고
+    실패하면 대기 시간을 2배씩 늘립니다 (최대 5분)
+  • 기다리는 동안은 재시도 횟수가 줄지 않습니다
+  • 장애가 10분 넘게 이어지면 남은 회사는 실패로 처리하고
+    파일은 그대로 둡니다
+  • 다른 서버의 추가 발신 계정이 있으면 그 계정으로 계속 보냅니다
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+ 📮 발송 속도 제한 (서비스별 한도)
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+너무 빨리 보내거나 하루 한도를 넘기면 계정이 잠길 수 있어
+서비스별 한도에 맞춰 발송 속도를 자동으로 조절합니다.
+
+  Gmail:    분당 20건, 하루 수신자 500명
+  Naver:    분당 10건, 하루 수신자 500명
+  Daum:     분당 10건, 하루 수신자 500명
+  Outlook:  분당 30건, 하루 수신자 300명
+  직접 입력: 분당 30건, 하루 제한 없음
+
+• 오늘 보낸 수신자 수는 프로그램을 다시 켜도 유지됩니다
+  (프로그램 옆 'send_quota.json' 파일에 기록)
+• 하루 한도를 넘는 회사는 발송하지 않고 파일도 그대로 둡니다
+• 회사 계정(Google Workspace 등)처럼 한도가 다르면 설정 파일의
+  "rate_limits" 항목에서 바꿀 수 있습니다
+  예: "rate_limits": {"Gmail": {"recipients_per_day": 2000}}
+
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
  ⚠️ 주의사항
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -2467,8 +4988,25 @@ class CustomVariableManager:
 • 변수명에는 공백이나 특수문자를 사용하지 마세요
 • 변수명은 중괄호 { } 없이 입력하세요 (프로그램이 자동으로 추가합니다)
 • 변수값은 이메일에서 표시될 실제 내용입니다
+• 변수값 안에 다른 변수({날짜} 등)를 넣어도 바뀌지 않고 글자 그대로 들어갑니다
 • 변수를 삭제하면 해당 변수를 사용하는 이메일 양식에서 오류가 발생할 수 있습니다
 
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+🏢 회사별 변수
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+회사마다 값이 다른 변수(호칭, 계약번호 등)는 회사 정보의
+'회사 변수'에 한 줄에 하나씩 "변수명=값"으로 입력하세요
+
+예시 (삼성전자 회사 정보):
+  호칭=김부장님
+  계약번호=C-2024-001
+
+• 같은 이름의 커스텀 변수가 있으면 회사 변수가 우선합니다
+• 회사 변수가 없는 회사에는 커스텀 변수 값이 들어갑니다
+  (둘 다 없으면 {호칭}처럼 그대로 남습니다)
+• 양식 하나로 회사마다 다른 인사말을 보낼 수 있습니다
+
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
 💡 꿀팁:
@@ -2592,9 +5130,182 @@ class CustomVariableDialog:
                 "저장 오류", f"변수 저장 중 오류가 발생했습니다:\n{e}", parent=self.dialog)
 
 
+class SenderAccountDialog:
+    """추가 발신 계정 추가/수정 대화상자"""
+
+    def __init__(self, parent, config_manager, index, callback, parent_gui=None):
+        self.config_manager = config_manager
+        self.index = index  # 수정할 계정의 목록 위치 (추가할 때는 None)
+        self.callback = callback
+        self.parent_gui = parent_gui
+
+        self.dialog = tk.Toplevel(parent)
+        self.dialog.title("발신 계정 추가" if index is None else "발신 계정 수정")
+        self.dialog.transient(parent)
+        self.dialog.grab_set()
+
+        # 중앙 위치 설정
+        center_window(self.dialog, parent)
+
+        self.setup_ui()
+
+    def setup_ui(self):
+        """UI 구성"""
+        try:
+            accounts = self.config_manager.get('email.accounts', [])
+            account = accounts[self.index] if self.index is not None else {}
+
+            frame = ttk.Frame(self.dialog, padding="20")
+            frame.pack(fill=tk.BOTH, expand=True)
+
+            server = account.get('smtp_server', 'smtp.gmail.com')
+            port = account.get('smtp_port', 587)
+
+            # 이메일 서비스
+            ttk.Label(frame, text="이메일 서비스:").grid(
+                row=0, column=0, sticky=tk.W, pady=5)
+            self.service_var = tk.StringVar(value=detect_email_service_name(server, port))
+            service_combo = ttk.Combobox(
+                frame, textvariable=self.service_var,
+                values=list(EMAIL_SERVICES.keys()) + ["직접 입력"],
+                state='readonly', width=37)
+            service_combo.grid(row=0, column=1, sticky=(tk.W, tk.E), pady=5)
+            service_combo.bind('<<ComboboxSelected>>', self.on_service_changed)
+
+            # SMTP 서버 / 포트
+            ttk.Label(frame, text="SMTP 서버:").grid(
+                row=1, column=0, sticky=tk.W, pady=5)
+            self.server_var = tk.StringVar(value=server)
+            ttk.Entry(frame, textvariable=self.server_var, width=40).grid(
+                row=1, column=1, pady=5, sticky=(tk.W, tk.E))
+
+            ttk.Label(frame, text="SMTP 포트:").grid(
+                row=2, column=0, sticky=tk.W, pady=5)
+            self.port_var = tk.StringVar(value=str(port))
+            ttk.Entry(frame, textvariable=self.port_var, width=40).grid(
+                row=2, column=1, pady=5, sticky=(tk.W, tk.E))
+
+            # 발신 이메일 / 앱 비밀번호
+            ttk.Label(frame, text="발신 이메일:").grid(
+                row=3, column=0, sticky=tk.W, pady=5)
+            self.email_var = tk.StringVar(value=account.get('sender_email', ''))
+            ttk.Entry(frame, textvariable=self.email_var, width=40).grid(
+                row=3, column=1, pady=5, sticky=(tk.W, tk.E))
+
+            ttk.Label(frame, text="앱 비밀번호:").grid(
+                row=4, column=0, sticky=tk.W, pady=5)
+            self.password_var = tk.StringVar(value=account.get('sender_password', ''))
+            ttk.Entry(frame, textvariable=self.password_var, show='*', width=40).grid(
+                row=4, column=1, pady=5, sticky=(tk.W, tk.E))
+
+            self.enabled_var = tk.BooleanVar(value=account.get('enabled', True))
+            ttk.Checkbutton(frame, text="이 계정으로 발송", variable=self.enabled_var).grid(
+                row=5, column=1, sticky=tk.W, pady=5)
+
+            frame.columnconfigure(1, weight=1)
+
+            # 버튼
+            btn_frame = ttk.Frame(frame)
+            btn_frame.grid(row=6, column=0, columnspan=2, pady=20)
+
+            ttk.Button(btn_frame, text="🔌 연결 테스트", command=self.test_connection).pack(
+                side=tk.LEFT, padx=5)
+            ttk.Button(btn_frame, text="💾 저장", command=self.save).pack(
+                side=tk.LEFT, padx=5)
+            ttk.Button(btn_frame, text="❌ 취소", command=self.dialog.destroy).pack(
+                side=tk.LEFT, padx=5)
+
+            # 창 크기를 내용에 맞춰 자동 조정
+            self.dialog.update_idletasks()
+            self.dialog.geometry("")
+
+        except Exception as e:
+            error_msg = f"❌ 발신 계정 대화상자 UI 구성 중 오류 발생: {e}"
+            if self.parent_gui:
+                self.parent_gui.log(error_msg)
+            messagebox.showerror(
+                "UI 오류", f"발신 계정 대화상자 생성 중 오류:\n{e}", parent=self.dialog)
+
+    def on_service_changed(self, event=None):
+        """이메일 서비스 선택 시 서버/포트 자동 입력"""
+        service = self.service_var.get()
+        if service in EMAIL_SERVICES:
+            server, port = EMAIL_SERVICES[service]
+            self.server_var.set(server)
+            self.port_var.set(str(port))
+
+    def _read_fields(self):
+        """입력값 확인 후 계정 정보 반환 (잘못된 입력이면 None)"""
+        sender_email = self.email_var.get().strip()
+        server = self.server_var.get().strip()
+        if not sender_email or not server:
+            messagebox.showwarning(
+                "입력 오류", "SMTP 서버와 발신 이메일을 입력하세요.", parent=self.dialog)
+            return None
+        try:
+            port = int(self.port_var.get().strip())
+        except ValueError:
+            messagebox.showwarning(
+                "입력 오류", "포트 번호는 숫자여야 합니다.", parent=self.dialog)
+            return None
+        return {
+            'smtp_server': server,
+            'smtp_port': port,
+            'sender_email': sender_email,
+            'sender_password': self.password_var.get().replace(' ', '').replace('\t', ''),
+            'enabled': self.enabled_var.get()
+        }
+
+    def test_connection(self):
+        """연결 테스트"""
+        account = self._read_fields()
+        if account is None:
+            return
+        try:
+            server = open_smtp_connection(account['smtp_server'], account['smtp_port'],
+                                          account['sender_email'], account['sender_password'],
+                                          timeout=10)
+            server.quit()
+            messagebox.showinfo(
+                "연결 성공", f"✅ 연결 성공! ({account['sender_email']})", parent=self.dialog)
+        except smtplib.SMTPAuthenticationError:
+            messagebox.showerror(
+                "인증 실패", "이메일 주소 또는 앱 비밀번호를 확인하세요.", parent=self.dialog)
+        except Exception as e:
+            messagebox.showerror(
+                "연결 실패", f"SMTP 서버에 연결할 수 없습니다.\n\n{e}", parent=self.dialog)
+
+    def save(self):
+        """저장"""
+        account = self._read_fields()
+        if account is None:
+            return
+
+        accounts = list(self.config_manager.get('email.accounts', []))
+        primary_email = self.config_manager.get('email.sender_email', '')
+        duplicate = any(other.get('sender_email') == account['sender_email']
+                        for i, other in enumerate(accounts) if i != self.index)
+        if duplicate or account['sender_email'] == primary_email:
+            messagebox.showwarning(
+                "중복 오류", f"'{account['sender_email']}' 계정이 이미 등록되어 있습니다.", parent=self.dialog)
+            return
+
+        if self.index is None:
+            accounts.append(account)
+        else:
+            accounts[self.index] = account
+        self.config_manager.set('email.accounts', accounts)
+
+        if self.callback:
+            self.callback()
+        self.dialog.destroy()
+
+
 class CompanyDialog:
     """회사 정보 추가/수정 대화상자"""
 
+    AUTO_ACCOUNT = "자동 (남은 한도에 따라 분배)"
+
     def __init__(self, parent, config_manager, company_name, callback, parent_gui=None):
         self.config_manager = config_manager
         self.company_name = company_name
@@ -2685,13 +5396,53 @@ class CompanyDialog:
             if self.parent_gui:
                 self.parent_gui.log("  ✓ 양식 Combobox 완료", is_debug=True)
 
+            # 발신 계정 고정 (자동이면 남은 한도에 따라 분배)
+            ttk.Label(frame, text="발신 계정:").grid(
+                row=4, column=0, sticky=tk.W, pady=5)
+            account_names = [self.AUTO_ACCOUNT] + [
+                account['sender_email'] for account in get_sender_accounts(self.config_manager)
+                if account['sender_email']]
+            current_account = ''
+            if self.company_name:
+                companies = self.config_manager.get('companies', {})
+                current_account = companies.get(self.company_name, {}).get('account', '')
+            self.account_var = tk.StringVar(value=current_account or self.AUTO_ACCOUNT)
+            ttk.Combobox(frame, textvariable=self.account_var, values=account_names,
+                         state='readonly', width=37).grid(
+                row=4, column=1, sticky=(tk.W, tk.E), pady=5)
+
+            # 발송 순서 (고급 설정의 발송 순서가 '우선순위'/'마감 시각'일 때 사용)
+            company_info = {}
+            if self.company_name:
+                company_info = self.config_manager.get('companies', {}).get(self.company_name, {})
+            ttk.Label(frame, text="발송 우선순위:").grid(
+                row=5, column=0, sticky=tk.W, pady=5)
+            self.priority_var = tk.StringVar(value=str(company_info.get('priority', 0)))
+            ttk.Spinbox(frame, from_=-99, to=99, textvariable=self.priority_var,
+                        width=8).grid(row=5, column=1, sticky=tk.W, pady=5)
+            ttk.Label(frame, text="마감 시각 (HH:MM):").grid(
+                row=6, column=0, sticky=tk.W, pady=5)
+            self.deadline_var = tk.StringVar(value=company_info.get('deadline', ''))
+            ttk.Entry(frame, textvariable=self.deadline_var, width=10).grid(
+                row=6, column=1, sticky=tk.W, pady=5)
+
+            # 회사 변수 (이 회사에만 쓰는 양식 변수, 커스텀 변수보다 우선)
+            ttk.Label(frame, text="회사 변수:").grid(
+                row=7, column=0, sticky=(tk.W, tk.N), pady=5)
+            ttk.Label(frame, text="(한 줄에 하나, 변수명=값)", foreground='gray').grid(
+                row=8, column=0, sticky=(tk.W, tk.N))
+            self.variables_text = tk.Text(frame, height=4, width=40)
+            self.variables_text.grid(row=7, column=1, rowspan=2, pady=5, sticky=(tk.W, tk.E))
+            self.variables_text.insert('1.0', '\n'.join(
+                f"{name}={value}" for name, value in company_info.get('variables', {}).items()))
+
             frame.columnconfigure(1, weight=1)
 
             # 버튼
             if self.parent_gui:
                 self.parent_gui.log("  - 버튼 생성 중...", is_debug=True)
             btn_frame = ttk.Frame(frame)
-            btn_frame.grid(row=4, column=0, columnspan=2, pady=20)
+            btn_frame.grid(row=9, column=0, columnspan=2, pady=20)
 
             ttk.Button(btn_frame, text="저장", command=self.save).pack(
                 side=tk.LEFT, padx=5)
@@ -2728,6 +5479,32 @@ class CompanyDialog:
                 "입력 오류", "회사명과 이메일을 입력하세요.", parent=self.dialog)
             return
 
+        try:
+            priority = int(self.priority_var.get().strip() or 0)
+        except ValueError:
+            self.dialog.focus_force()
+            messagebox.showwarning(
+                "입력 오류", "발송 우선순위는 숫자로 입력하세요.", parent=self.dialog)
+            return
+        deadline = self.deadline_var.get().strip()
+        if deadline and parse_deadline(deadline) is None:
+            self.dialog.focus_force()
+            messagebox.showwarning(
+                "입력 오류", "마감 시각은 HH:MM 형식으로 입력하세요. (예: 17:30)", parent=self.dialog)
+            return
+        variables = {}
+        for line in self.variables_text.get('1.0', tk.END).splitlines():
+            if not line.strip():
+                continue
+            name, sep, value = line.partition('=')
+            name = name.strip().strip('{}')
+            if not sep or not name:
+                self.dialog.focus_force()
+                messagebox.showwarning(
+                    "입력 오류", f"회사 변수는 '변수명=값' 형식으로 입력하세요.\n\n{line}", parent=self.dialog)
+                return
+            variables[name] = value.strip()
+
         emails = [e.strip() for e in emails_str.split(',') if e.strip()]
 
         companies = self.config_manager.get('companies', {})
@@ -2735,6 +5512,15 @@ class CompanyDialog:
             'emails': emails,
             'template': template
         }
+        account = self.account_var.get()
+        if account and account != self.AUTO_ACCOUNT:
+            companies[company_name]['account'] = account
+        if priority:
+            companies[company_name]['priority'] = priority
+        if deadline:
+            companies[company_name]['deadline'] = parse_deadline(deadline).strftime('%H:%M')
+        if variables:
+            companies[company_name]['variables'] = variables
         self.config_manager.set('companies', companies)
 
         self.callback()
@@ -2744,11 +5530,15 @@ class CompanyDialog:
 class TemplateDialog:
     """이메일 양식 추가/수정 대화상자"""
 
+    PREVIEW_DELAY_MS = 300  # 입력이 멈춘 뒤 미리보기를 갱신할 때까지 기다리는 시간
+    SAMPLE_COMPANY = "예시회사"
+
     def __init__(self, parent, config_manager, template_name, callback, parent_gui=None):
         self.config_manager = config_manager
         self.template_name = template_name
         self.callback = callback
         self.parent_gui = parent_gui
+        self.preview_after_id = None
 
         self.dialog = tk.Toplevel(parent)
         self.dialog.title("양식 추가" if not template_name else "양식 수정")
@@ -2758,7 +5548,7 @@ class TemplateDialog:
         self.setup_ui()
         
         # 중앙 위치 설정
-        center_window(self.dialog, parent, 550, 450)
+        center_window(self.dialog, parent, 600, 680)
 
     def setup_ui(self):
         """UI 구성"""
@@ -2831,9 +5621,11 @@ class TemplateDialog:
             var_frame.grid(row=3, column=1, sticky=(tk.W, tk.E), pady=5)
 
             # 변수들을 줄바꿈으로 표시
-            var_text = """{회사명}, {파일명}, {날짜}, {시간}
+            var_text = """{회사명}, {파일명}, {파일수}, {날짜}, {시간}
 {년}, {월}, {일}, {요일}, {요일한글}
-{시}, {분}, {초}, {시간12}, {오전오후}"""
+{시}, {분}, {초}, {시간12}, {오전오후}
+{#반복 파일}{번호}. {파일명} ({파일크기}){/반복}
+{#만약 여러파일}...{#아니면}...{/만약}"""
 
             var_label = ttk.Label(var_frame, text=var_text, foreground='blue',
                                font=('맑은 고딕', 9), justify='left')
@@ -2842,11 +5634,40 @@ class TemplateDialog:
             if self.parent_gui:
                 self.parent_gui.log("  ✓ 변수 안내 완료")
 
+            # 미리보기 (예시 회사와 파일로 렌더링, 입력이 멈추면 갱신)
+            preview_frame = ttk.LabelFrame(frame, text="👀 미리보기", padding="10")
+            preview_frame.grid(row=4, column=1, sticky=(tk.W, tk.E), pady=5)
+
+            sample_frame = ttk.Frame(preview_frame)
+            sample_frame.pack(fill=tk.X)
+            ttk.Label(sample_frame, text="예시 회사:").pack(side=tk.LEFT)
+            companies = self.config_manager.get('companies', {})
+            company_names = list(companies) or [self.SAMPLE_COMPANY]
+            using_template = [name for name, info in companies.items()
+                              if self.template_name and info.get('template') == self.template_name]
+            self.sample_company_var = tk.StringVar(value=(using_template or company_names)[0])
+            sample_combo = ttk.Combobox(sample_frame, textvariable=self.sample_company_var,
+                                        values=company_names, state='readonly', width=20)
+            sample_combo.pack(side=tk.LEFT, padx=5)
+            sample_combo.bind('<<ComboboxSelected>>', lambda e: self.schedule_preview())
+            self.sample_multi_var = tk.BooleanVar(value=False)
+            ttk.Checkbutton(sample_frame, text="첨부 파일 여러 개", variable=self.sample_multi_var,
+                            command=self.schedule_preview).pack(side=tk.LEFT, padx=10)
+
+            self.preview_text = scrolledtext.ScrolledText(
+                preview_frame, wrap=tk.WORD, width=50, height=8, state='disabled')
+            self.preview_text.pack(fill=tk.BOTH, expand=True, pady=(5, 0))
+
+            self.subject_var.trace_add('write', lambda *args: self.schedule_preview())
+            self.body_text.edit_modified(False)  # 처음 넣은 본문은 변경으로 보지 않음
+            self.body_text.bind('<<Modified>>', self.on_body_modified)
+            self.update_preview()
+
             # 버튼
             if self.parent_gui:
                 self.parent_gui.log("  - 버튼 생성 중...")
             btn_frame = ttk.Frame(frame)
-            btn_frame.grid(row=4, column=0, columnspan=2, pady=15)
+            btn_frame.grid(row=5, column=0, columnspan=2, pady=15)
 
             ttk.Button(btn_frame, text="💾 저장", command=self.save,
                        width=10).pack(side=tk.LEFT, padx=5)
@@ -2871,37 +5692,330 @@ class TemplateDialog:
             messagebox.showerror(
                 "UI 오류", f"양식 대화상자 생성 중 오류:\n{e}", parent=self.dialog)
 
+    def on_body_modified(self, event=None):
+        """본문이 바뀌면 미리보기 예약 (<<Modified>>는 플래그를 풀어야 다시 발생)"""
+        if self.body_text.edit_modified():
+            self.body_text.edit_modified(False)
+            self.schedule_preview()
+
+    def schedule_preview(self):
+        """입력이 이어지는 동안은 미루고, 멈춘 뒤 한 번만 미리보기 갱신"""
+        if self.preview_after_id is not None:
+            self.dialog.after_cancel(self.preview_after_id)
+        self.preview_after_id = self.dialog.after(self.PREVIEW_DELAY_MS, self.update_preview)
+
+    def _sample_files(self, company_name):
+        """미리보기용 첨부 파일 (PDF 분석 결과가 있으면 실제 파일) -> (경로 목록, 크기 목록 또는 None)"""
+        company_pdfs = getattr(self.parent_gui, 'company_pdfs', None) or {}
+        if company_name in company_pdfs:
+            pdf_paths = list(company_pdfs[company_name])
+            return (pdf_paths if self.sample_multi_var.get() else pdf_paths[:1]), None
+        samples = [(Path(f"{company_name}___보고서.pdf"), 350 * 1024),
+                   (Path(f"{company_name}___부록.pdf"), 1200 * 1024)]
+        if not self.sample_multi_var.get():
+            samples = samples[:1]
+        return [path for path, _ in samples], [size for _, size in samples]
+
+    def update_preview(self):
+        """예시 회사와 파일로 양식을 렌더링해서 미리보기에 표시"""
+        self.preview_after_id = None
+        if not self.dialog.winfo_exists():
+            return
+        company_name = self.sample_company_var.get()
+        company_info = self.config_manager.get('companies', {}).get(company_name, {})
+        try:
+            context = RenderContext.from_config(self.config_manager)
+        except ValueError:
+            context = RenderContext(custom_vars=self.config_manager.get('custom_variables', {}))
+        pdf_paths, sizes = self._sample_files(company_name)
+
+        try:
+            values = context.values(company_name, pdf_paths, company_info.get('variables'), sizes)
+            subject = compile_template(self.subject_var.get().strip()).render(values)
+            body_template = with_default_file_list(self.body_text.get('1.0', tk.END).strip())
+            preview = f"제목: {subject}\n{'─' * 30}\n{compile_template(body_template).render(values)}"
+            color = 'black'
+        except TemplateSyntaxError as e:
+            preview = f"⚠️ 양식 오류: {e}"
+            color = 'red'
+
+        self.preview_text.config(state='normal')
+        self.preview_text.delete('1.0', tk.END)
+        self.preview_text.insert('1.0', preview)
+        self.preview_text.config(state='disabled', foreground=color)
+
     def save(self):
         """저장"""
         template_name = self.template_name_var.get().strip()
         subject = self.subject_var.get().strip()
         body = self.body_text.get('1.0', tk.END).strip()
 
-        if not template_name:
-            self.dialog.focus_force()
-            messagebox.showwarning("입력 오류", "양식명을 입력하세요.", parent=self.dialog)
+        if not template_name:
+            self.dialog.focus_force()
+            messagebox.showwarning("입력 오류", "양식명을 입력하세요.", parent=self.dialog)
+            return
+
+        if not subject or not body:
+            self.dialog.focus_force()
+            messagebox.showwarning(
+                "입력 오류", "제목과 본문을 입력하세요.", parent=self.dialog)
+            return
+
+        try:
+            compile_template(subject)
+            compile_template(body)
+        except TemplateSyntaxError as e:
+            self.dialog.focus_force()
+            messagebox.showwarning("양식 오류", f"반복/조건 블록을 확인하세요.\n\n{e}", parent=self.dialog)
+            return
+
+        templates = self.config_manager.get('email_templates', {})
+        templates[template_name] = {
+            'subject': subject,
+            'body': body
+        }
+        self.config_manager.set('email_templates', templates)
+
+        if self.callback:
+            self.callback()
+
+        self.dialog.focus_force()
+        messagebox.showinfo(
+            "저장 완료", f"양식 '{template_name}'이(가) 저장되었습니다.", parent=self.dialog)
+        self.dialog.destroy()
+
+
+LOG_FLUSH_INTERVAL_MS = 100  # 로그 대기열을 화면에 반영하는 주기
+LOG_FLUSH_MAX_LINES = 1000   # 한 번에 반영하는 최대 줄 수 (나머지는 다음 주기에)
+LOG_MAX_LINES_MIN = 500      # 화면에 남길 최대 로그 줄 수 설정의 최솟값
+LOG_SEARCH_MAX_RESULTS = 2000  # 로그 검색 결과 최대 표시 수
+LOG_LEVELS = {'DEBUG': 10, 'INFO': 20, 'SUCCESS': 20, 'WARNING': 30, 'ERROR': 40}
+LOG_CATEGORIES = {'scan': 'PDF 분석', 'smtp': 'SMTP 연결·발송', 'fs': '파일 이동·폴더'}
+LOG_LEVEL_FOLLOW_DEBUG = '기본 (디버그 모드 따름)'
+
+
+class Logger:
+    """로그 필터 (레벨 판단 후 대기열에 넣음, 화면 반영은 flush_logs가 함)
+
+    카테고리별 최소 레벨을 설정이 바뀔 때만 계산해 두므로,
+    꺼진 로그는 사전 조회 한 번으로 바로 버려집니다.
+    메시지를 만드는 비용이 큰 곳은 enabled로 먼저 확인하고 건너뛸 수 있습니다.
+    """
+
+    def __init__(self, sink):
+        self.sink = sink  # (시각, 메시지, 레벨)을 받는 대기열
+        self.thresholds = {None: LOG_LEVELS['INFO']}
+
+    def configure(self, config_manager):
+        """설정에서 카테고리별 최소 레벨을 다시 계산 (설정이 바뀔 때 호출)"""
+        base = LOG_LEVELS['DEBUG'] if config_manager.get('debug_mode', False) else LOG_LEVELS['INFO']
+        thresholds = {None: base}
+        for category in LOG_CATEGORIES:
+            level = str(config_manager.get(f'log_level_{category}', '') or '').upper()
+            thresholds[category] = LOG_LEVELS.get(level, base)
+        # 사전을 통째로 바꿔서 다른 스레드가 읽는 중에도 안전하게
+        self.thresholds = thresholds
+
+    def enabled(self, level='INFO', category=None):
+        """이 레벨·카테고리의 로그가 표시되는지"""
+        thresholds = self.thresholds
+        return LOG_LEVELS.get(level, 20) >= thresholds.get(category, thresholds[None])
+
+    def emit(self, message, level='INFO', category=None, is_debug=False):
+        """카테고리의 최소 레벨 이상이면 대기열에 추가하고 True 반환
+
+        is_debug=True인 로그는 level과 관계없이 DEBUG 레벨로 판단합니다.
+        """
+        if not self.enabled('DEBUG' if is_debug else level, category):
+            return False
+        self.sink.put((datetime.now().strftime('%H:%M:%S'), message, level))
+        return True
+
+
+class LogHistory:
+    """전체 로그 기록 (날짜별 텍스트 파일)
+
+    화면 로그는 최근 줄만 남기지만, 여기에는 모든 줄이 남습니다.
+    append()는 대기열에 넣기만 하고 파일 쓰기는 전용 스레드가 하므로,
+    화면을 그리는 메인 스레드가 디스크(네트워크 드라이브 등)를 기다리지 않습니다.
+    보관 일수가 지난 파일은 프로그램 시작 때 삭제합니다.
+    """
+
+    def __init__(self, folder, keep_days=30):
+        self.folder = Path(folder)
+        self.keep_days = keep_days
+        self.pending = queue.Queue()  # (파일 경로, 텍스트), None이면 종료
+        self.thread = None
+
+    def start(self):
+        self.thread = threading.Thread(target=self._run, name="LogHistoryWriter", daemon=True)
+        self.thread.start()
+
+    def close(self, timeout=2):
+        """남은 로그를 모두 쓰고 스레드 종료"""
+        if self.thread and self.thread.is_alive():
+            self.pending.put(None)
+            self.thread.join(timeout)
+
+    def path_for(self, day):
+        return self.folder / f"{NAME_PREFIX}log_{day:%Y-%m-%d}.txt"
+
+    def append(self, text, day=None):
+        """로그 줄들을 오늘 파일 끝에 추가 예약 (text는 줄바꿈으로 끝나는 문자열, 바로 반환)"""
+        if text:
+            self.pending.put((self.path_for(day or datetime.now()), text))
+
+    def _run(self):
+        while True:
+            items = [self.pending.get()]
+            try:
+                while True:
+                    items.append(self.pending.get_nowait())
+            except queue.Empty:
+                pass
+            # 같은 파일에 갈 줄은 모아서 한 번에 씀 (날짜가 바뀌는 순간에는 파일이 둘)
+            chunks = {}
+            for item in items:
+                if item is not None:
+                    chunks.setdefault(item[0], []).append(item[1])
+            for path, texts in chunks.items():
+                try:
+                    self.folder.mkdir(parents=True, exist_ok=True)
+                    with open(path, 'a', encoding='utf-8') as f:
+                        f.write(''.join(texts))
+                except OSError as e:
+                    logging.error(f"로그 기록 저장 오류: {e}")
+            if None in items:
+                return
+
+    def files(self):
+        """기록 파일 목록 (최근 날짜부터)"""
+        if not self.folder.exists():
+            return []
+        return sorted(self.folder.glob(f"{NAME_PREFIX}log_*.txt"), reverse=True)
+
+    def cleanup(self):
+        """보관 일수가 지난 기록 파일 삭제"""
+        if self.keep_days <= 0:
             return
+        oldest = self.path_for(datetime.now() - timedelta(days=self.keep_days)).name
+        for path in self.files():
+            if path.name < oldest:
+                try:
+                    path.unlink()
+                except OSError as e:
+                    logging.error(f"오래된 로그 기록 삭제 오류: {e}")
 
-        if not subject or not body:
-            self.dialog.focus_force()
-            messagebox.showwarning(
-                "입력 오류", "제목과 본문을 입력하세요.", parent=self.dialog)
-            return
+    def search(self, keyword, max_results=LOG_SEARCH_MAX_RESULTS):
+        """키워드가 들어간 줄 찾기 (대소문자 무시, 최근 날짜 파일부터)
 
-        templates = self.config_manager.get('email_templates', {})
-        templates[template_name] = {
-            'subject': subject,
-            'body': body
-        }
-        self.config_manager.set('email_templates', templates)
+        Returns: ([(날짜, 줄)], 결과가 잘렸는지 여부)
+        """
+        keyword = keyword.lower()
+        results = []
+        for path in self.files():
+            day = path.stem[len(f"{NAME_PREFIX}log_"):]
+            try:
+                with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                    matches = [line.rstrip('\n') for line in f if keyword in line.lower()]
+            except OSError as e:
+                logging.error(f"로그 기록 읽기 오류: {e}")
+                continue
+            for line in reversed(matches):
+                results.append((day, line))
+                if len(results) >= max_results:
+                    return results, True
+        return results, False
 
-        if self.callback:
-            self.callback()
 
-        self.dialog.focus_force()
-        messagebox.showinfo(
-            "저장 완료", f"양식 '{template_name}'이(가) 저장되었습니다.", parent=self.dialog)
-        self.dialog.destroy()
+class RunLog:
+    """발송 기록 (JSON Lines, 한 줄에 이벤트 하나)
+
+    write()는 대기열에 넣기만 하고, 파일 쓰기는 전용 스레드가 모아서 처리하므로
+    발송 스레드가 디스크를 기다리지 않습니다.
+    파일은 날짜별로 나뉘고, 크기가 max_bytes를 넘으면 같은 날짜의 다음 번호 파일로 넘어갑니다.
+    (예: Ato_run_2024-01-15.jsonl → Ato_run_2024-01-15.2.jsonl)
+    """
+
+    def __init__(self, folder, max_bytes=10 * 1024 * 1024, keep_days=30):
+        self.folder = Path(folder)
+        self.max_bytes = max_bytes
+        self.keep_days = keep_days
+        self.events = queue.Queue()
+        self.thread = None
+        self.current = None  # (날짜, 번호)
+
+    def start(self):
+        self.cleanup()
+        self.thread = threading.Thread(target=self._run, name="RunLogWriter", daemon=True)
+        self.thread.start()
+
+    def write(self, event, level='INFO', **fields):
+        """이벤트 기록 예약 (바로 반환)"""
+        record = {'ts': datetime.now().isoformat(timespec='milliseconds'),
+                  'level': level, 'event': event}
+        record.update(fields)
+        self.events.put(record)
+
+    def close(self, timeout=2):
+        """남은 이벤트를 모두 쓰고 스레드 종료"""
+        if self.thread and self.thread.is_alive():
+            self.events.put(None)
+            self.thread.join(timeout)
+
+    def _path(self, day, part):
+        suffix = f".{part}" if part > 1 else ""
+        return self.folder / f"{NAME_PREFIX}run_{day}{suffix}.jsonl"
+
+    def _target_path(self):
+        """지금 쓸 파일 (날짜가 바뀌거나 크기를 넘으면 다음 파일)"""
+        day = datetime.now().strftime('%Y-%m-%d')
+        if self.current is None or self.current[0] != day:
+            part = 1
+            while self._path(day, part + 1).exists():
+                part += 1
+            self.current = (day, part)
+        path = self._path(*self.current)
+        try:
+            if path.stat().st_size >= self.max_bytes:
+                self.current = (day, self.current[1] + 1)
+                path = self._path(*self.current)
+        except OSError:
+            pass  # 아직 파일이 없음
+        return path
+
+    def _run(self):
+        while True:
+            records = [self.events.get()]
+            try:
+                while True:
+                    records.append(self.events.get_nowait())
+            except queue.Empty:
+                pass
+            stop = None in records
+            lines = ''.join(json.dumps(record, ensure_ascii=False, default=str) + '\n'
+                            for record in records if record is not None)
+            if lines:
+                try:
+                    self.folder.mkdir(parents=True, exist_ok=True)
+                    with open(self._target_path(), 'a', encoding='utf-8') as f:
+                        f.write(lines)
+                except OSError as e:
+                    logging.error(f"발송 기록 저장 오류: {e}")
+            if stop:
+                return
+
+    def cleanup(self):
+        """보관 일수가 지난 기록 파일 삭제"""
+        if self.keep_days <= 0 or not self.folder.exists():
+            return
+        oldest = f"{NAME_PREFIX}run_{datetime.now() - timedelta(days=self.keep_days):%Y-%m-%d}"
+        for path in self.folder.glob(f"{NAME_PREFIX}run_*.jsonl"):
+            if path.name < oldest:
+                try:
+                    path.unlink()
+                except OSError as e:
+                    logging.error(f"오래된 발송 기록 삭제 오류: {e}")
 
 
 # GUI 클래스
@@ -2914,37 +6028,75 @@ class PDFEmailSenderGUI:
         # 초기화 중 로그 버퍼
         self.init_log_buffer = []
 
+        # 화면에 표시할 로그 대기열 (메인/발송 스레드 모두 넣고, 메인 스레드가 주기적으로 한꺼번에 표시)
+        self.log_queue = queue.Queue()  # (시각, 메시지, 레벨)
+        self.logger = Logger(self.log_queue)
+
         # SMTP 연결 관리
         # 통합 상태 관리
         self.connection_state = {
             'server_conn': None,
             'connected': False,
-            'last_activity': None,
-            'check_timer': None
+            'last_activity': None
         }
 
-        # 실시간 시간 표시를 위한 변수
-        self.time_display_timer = None
-        self.time_display_start = None
+        # 발송 중에는 발송 스레드가 기본 연결을 쓰므로 연결 관리자를 깨우지 않음
+        self.sending = False
+        self.reconnect_after_send = False  # 발송 중에 이메일 설정이 바뀌면 끝난 뒤 다시 연결
+
+        # 발송 진행 표시 (발송 스레드가 카운터를 올리고 화면은 일정 주기로 읽음)
+        self.send_progress = None
+        self.progress_timer = None
+        self.progress_rate_samples = deque()  # 최근 (시각, 올린 바이트) - 업로드 속도 계산용
 
         try:
             # ConfigManager에 버퍼 로그 함수 전달
             self.config_manager = ConfigManager(log_func=self.buffer_log)
+            self.logger.configure(self.config_manager)
             self.current_folder = None
 
+            # 계정별 일일 발송량 기록 (설정 파일과 같은 위치)
+            self.quota_store = SendQuotaStore(
+                self.config_manager.config_file.parent / f'{NAME_PREFIX}send_quota.json')
+
+            # 서버별 유휴 연결 종료 시간 기록 (연결을 끊기기 전에 교체하는 데 사용)
+            self.idle_store = IdleTimeoutStore(
+                self.config_manager.config_file.parent / f'{NAME_PREFIX}idle_timeouts.json')
+
+            # 전체 로그 기록 (화면에는 최근 로그만 남김)
+            self.log_history = LogHistory(
+                self.config_manager.config_file.parent / 'logs',
+                self.config_manager.get('log_history_days', 30))
+            self.log_history.cleanup()
+            self.log_history.start()
+
+            # 발송 기록 (JSONL, 전용 스레드가 파일에 씀)
+            self.run_log = RunLog(
+                self.config_manager.config_file.parent / 'logs',
+                max_bytes=max(1, self.config_manager.get('run_log_max_mb', 10)) * 1024 * 1024,
+                keep_days=self.config_manager.get('log_history_days', 30))
+            self.run_log.start()
+
+            # 연결·재연결·상태 확인은 백그라운드에서 처리 (화면이 멈추지 않도록)
+            self.connection_manager = ConnectionManager(
+                self.config_manager, self.connection_state, self.idle_store)
+
             self.buffer_log("🔧 프로그램 초기화 시작", is_debug=True)
             
             # 글자 크기 설정 적용
             self.apply_font_size()
 
             self.setup_ui()
+            self._drain_log_queue()
 
             # 버퍼에 모인 로그 출력
             self.flush_log_buffer()
 
             self.log("✅ 프로그램 시작 완료", 'INFO')
 
-            # 이메일 설정 확인 및 연결
+            # 연결 관리 시작 후 이메일 설정 확인 및 연결
+            self.connection_manager.start()
+            self._poll_connection_events()
             self.check_and_connect_email()
 
             # 프로그램 종료 시 연결 해제
@@ -2960,6 +6112,7 @@ class PDFEmailSenderGUI:
             # UI가 준비되었으면 로그 출력
             if hasattr(self, 'log_text'):
                 self.flush_log_buffer()
+                self.flush_logs()
 
             messagebox.showerror(
                 "초기화 오류", f"프로그램 시작 중 오류가 발생했습니다.\n\n{str(e)}", parent=self.root)
@@ -3052,10 +6205,12 @@ class PDFEmailSenderGUI:
             ttk.Label(header_frame, text=f"📧 {MAIN_NAME}! PDF 자동 이메일 발송 프로그램",
                      font=('맑은 고딕', 16, 'bold')).grid(row=0, column=0, sticky=tk.W)
 
-            ttk.Button(header_frame, text="📖 사용방법", command=self.show_help).grid(
+            ttk.Button(header_frame, text="📊 진단", command=self.show_diagnostics).grid(
                 row=0, column=1, padx=5)
-            ttk.Button(header_frame, text="⚙️ 설정", command=self.open_settings).grid(
+            ttk.Button(header_frame, text="📖 사용방법", command=self.show_help).grid(
                 row=0, column=2, padx=5)
+            ttk.Button(header_frame, text="⚙️ 설정", command=self.open_settings).grid(
+                row=0, column=3, padx=5)
 
             # 폴더 설정
             folder_frame = ttk.LabelFrame(
@@ -3111,18 +6266,54 @@ class PDFEmailSenderGUI:
             self.send_button.grid(row=0, column=1, padx=5,
                                   pady=5, sticky=(tk.W, tk.E))
 
+            # 발송 제어 (발송 중에만 사용 가능)
+            self.pause_button = ttk.Button(button_frame, text="⏸ 일시정지", command=self.toggle_pause_sending,
+                                           state='disabled', style='Large.TButton')
+            self.pause_button.grid(row=0, column=2, padx=5, pady=5)
+
+            self.cancel_button = ttk.Button(button_frame, text="⏹ 중지", command=self.cancel_sending,
+                                            state='disabled', style='Large.TButton')
+            self.cancel_button.grid(row=0, column=3, padx=5, pady=5)
+
+            # 발송 진행 (발송을 시작하면 표시)
+            self.progress_frame = ttk.LabelFrame(
+                main_frame, text="📤 발송 진행", padding="10")
+            self.progress_frame.grid(row=3, column=0, pady=(0, 10), sticky=(tk.W, tk.E))
+            self.progress_frame.columnconfigure(0, weight=1)
+
+            self.batch_progress_bar = ttk.Progressbar(
+                self.progress_frame, mode='determinate', maximum=1000)
+            self.batch_progress_bar.grid(row=0, column=0, sticky=(tk.W, tk.E))
+            self.batch_progress_label = ttk.Label(self.progress_frame, text="-")
+            self.batch_progress_label.grid(row=1, column=0, sticky=tk.W, pady=(5, 0))
+
+            # 업로드 중인 메일 (동시 발송 수만큼 줄을 만들어 두고 다시 씀)
+            self.message_progress_frame = ttk.Frame(self.progress_frame)
+            self.message_progress_frame.grid(row=2, column=0, sticky=(tk.W, tk.E))
+            self.message_progress_frame.columnconfigure(1, weight=1)
+            self.message_progress_rows = []
+            self.progress_frame.grid_remove()
+
             # 로그
             log_frame = ttk.LabelFrame(
                 main_frame, text="📋 실행 로그", padding="10")
             log_frame.grid(row=4, column=0, sticky=(
                 tk.W, tk.E, tk.N, tk.S), pady=(0, 10))
             log_frame.columnconfigure(0, weight=1)
-            log_frame.rowconfigure(0, weight=1)
+            log_frame.rowconfigure(1, weight=1)
+
+            # 화면에는 최근 로그만 남으므로 전체 기록은 검색 창에서 확인
+            log_toolbar = ttk.Frame(log_frame)
+            log_toolbar.grid(row=0, column=0, sticky=tk.E, pady=(0, 5))
+            ttk.Button(log_toolbar, text="🔍 로그 검색", command=self.show_log_history).pack(
+                side=tk.LEFT, padx=(0, 5))
+            ttk.Button(log_toolbar, text="📂 로그 폴더", command=self.open_log_folder).pack(
+                side=tk.LEFT)
 
             self.log_text = scrolledtext.ScrolledText(
                 log_frame, wrap=tk.WORD, width=80, height=20, font=('Consolas', 9))
             self.log_text.grid(
-                row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+                row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
 
             self.buffer_log("✓ UI 구성 완료", is_debug=True)
 
@@ -3144,6 +6335,20 @@ class PDFEmailSenderGUI:
                 status_frame, text="연결 안됨", foreground='red')
             self.email_status_label.pack(side=tk.LEFT)
 
+            # 동시 발송 수 (발송 중에만 표시)
+            ttk.Label(status_frame, text="| 동시 발송:").pack(
+                side=tk.LEFT, padx=(20, 5))
+            self.concurrency_label = ttk.Label(
+                status_frame, text="-", foreground='gray')
+            self.concurrency_label.pack(side=tk.LEFT)
+
+            # 남은 예상 시간 (발송 중에만 표시)
+            ttk.Label(status_frame, text="| 남은 시간:").pack(
+                side=tk.LEFT, padx=(20, 5))
+            self.eta_label = ttk.Label(
+                status_frame, text="-", foreground='gray')
+            self.eta_label.pack(side=tk.LEFT)
+
         except Exception as e:
             error_msg = f"❌ 메인 UI 생성 오류: {e}"
             self.buffer_log(error_msg)
@@ -3182,9 +6387,9 @@ class PDFEmailSenderGUI:
             self.config_manager.set('pdf_folder', str(pdf_folder))
             self.config_manager.set('completed_folder', str(completed_folder))
 
-            self.log(f"✅ 폴더 생성됨: {pdf_folder}, {completed_folder}", 'SUCCESS')
+            self.log(f"✅ 폴더 생성됨: {pdf_folder}, {completed_folder}", 'SUCCESS', category='fs')
         else:
-            self.log("폴더 자동 생성 비활성화", 'INFO')
+            self.log("폴더 자동 생성 비활성화", 'INFO', category='fs')
 
     def select_pdf_folder(self):
         """PDF 폴더 선택"""
@@ -3193,7 +6398,7 @@ class PDFEmailSenderGUI:
         if folder:
             self.pdf_folder_var.set(folder)
             self.config_manager.set('pdf_folder', folder)
-            self.log(f"PDF 폴더 변경: {folder}", 'INFO')
+            self.log(f"PDF 폴더 변경: {folder}", 'INFO', category='fs')
 
     def select_completed_folder(self):
         """완료 폴더 선택"""
@@ -3202,7 +6407,7 @@ class PDFEmailSenderGUI:
         if folder:
             self.completed_folder_var.set(folder)
             self.config_manager.set('completed_folder', folder)
-            self.log(f"완료 폴더 변경: {folder}", 'INFO')
+            self.log(f"완료 폴더 변경: {folder}", 'INFO', category='fs')
 
     def open_pdf_folder(self):
         """PDF 폴더 열기"""
@@ -3213,17 +6418,8 @@ class PDFEmailSenderGUI:
                     "폴더 없음", f"폴더가 존재하지 않습니다:\n{folder}", "warning")
                 return
 
-            import subprocess
-            import platform
-
-            if platform.system() == 'Windows':
-                os.startfile(folder)
-            elif platform.system() == 'Darwin':  # macOS
-                subprocess.Popen(['open', folder])
-            else:  # Linux
-                subprocess.Popen(['xdg-open', folder])
-
-            self.log(f"📂 폴더 열기: {folder}", 'INFO')
+            open_folder_in_explorer(folder)
+            self.log(f"📂 폴더 열기: {folder}", 'INFO', category='fs')
         except Exception as e:
             logging.error(f"폴더 열기 오류: {e}")
             self._show_custom_message(
@@ -3238,17 +6434,8 @@ class PDFEmailSenderGUI:
                     "폴더 없음", f"폴더가 존재하지 않습니다:\n{folder}", "warning")
                 return
 
-            import subprocess
-            import platform
-
-            if platform.system() == 'Windows':
-                os.startfile(folder)
-            elif platform.system() == 'Darwin':  # macOS
-                subprocess.Popen(['open', folder])
-            else:  # Linux
-                subprocess.Popen(['xdg-open', folder])
-
-            self.log(f"📂 폴더 열기: {folder}", 'INFO')
+            open_folder_in_explorer(folder)
+            self.log(f"📂 폴더 열기: {folder}", 'INFO', category='fs')
         except Exception as e:
             logging.error(f"폴더 열기 오류: {e}")
             self._show_custom_message(
@@ -3383,6 +6570,57 @@ class PDFEmailSenderGUI:
 
         return result[0]
 
+    def show_diagnostics(self):
+        """진단 창 - 마지막 발송의 SMTP 단계별 소요 시간 (p50/p95)"""
+        diag_window = tk.Toplevel(self.root)
+        diag_window.title("📊 발송 진단")
+        diag_window.geometry("560x420")
+        diag_window.resizable(True, True)
+        diag_window.transient(self.root)
+        center_window(diag_window, self.root, 560, 420)
+
+        main_frame = ttk.Frame(diag_window, padding="20")
+        main_frame.pack(fill=tk.BOTH, expand=True)
+
+        ttk.Label(main_frame, text="📊 SMTP 단계별 소요 시간",
+                  font=('맑은 고딕', 14, 'bold')).pack(pady=(0, 5))
+        info_label = ttk.Label(main_frame, foreground='gray')
+        info_label.pack(pady=(0, 10))
+
+        columns = ('count', 'p50', 'p95')
+        tree = ttk.Treeview(main_frame, columns=columns, height=10)
+        tree.heading('#0', text="단계")
+        tree.heading('count', text="측정 횟수")
+        tree.heading('p50', text="p50")
+        tree.heading('p95', text="p95")
+        tree.column('#0', width=180)
+        for column in columns:
+            tree.column(column, width=100, anchor=tk.E)
+        tree.pack(fill=tk.BOTH, expand=True)
+
+        def refresh():
+            tree.delete(*tree.get_children())
+            timings = getattr(self, 'last_phase_timings', None)
+            if timings is None:
+                info_label.config(text="아직 발송 기록이 없습니다. 발송 후 다시 확인하세요.")
+                return
+            sending = hasattr(self, 'send_thread') and self.send_thread.is_alive()
+            info_label.config(text="현재 발송 중 (새로고침으로 갱신)" if sending else "마지막 발송 기준")
+            for label, count, p50, p95 in timings.summary():
+                tree.insert('', tk.END, text=label,
+                            values=(count, f"{p50 * 1000:.0f}ms", f"{p95 * 1000:.0f}ms"))
+            rates = timings.rate_summary()
+            if rates:
+                count, p50, p95 = rates
+                tree.insert('', tk.END, text="업로드 속도",
+                            values=(count, f"{p50 / 1024:.0f}KB/s", f"{p95 / 1024:.0f}KB/s"))
+
+        btn_frame = ttk.Frame(main_frame)
+        btn_frame.pack(fill=tk.X, pady=(10, 0))
+        ttk.Button(btn_frame, text="닫기", command=diag_window.destroy).pack(side=tk.RIGHT)
+        ttk.Button(btn_frame, text="🔄 새로고침", command=refresh).pack(side=tk.RIGHT, padx=(0, 5))
+        refresh()
+
     def show_help(self):
         """사용방법 안내 창"""
         help_window = tk.Toplevel(self.root)
@@ -3504,124 +6742,88 @@ Q. 파일이 인식이 안 돼요?
         self.root.wait_window(dialog.dialog)
 
         if dialog.result:
-            self.log("⚙️ 설정이 업데이트되었습니다", 'SUCCESS')
             # 설정 다시 로드
             self.config_manager.reload()
+            self.logger.configure(self.config_manager)
+            self.log("⚙️ 설정이 업데이트되었습니다", 'SUCCESS')
             # 설정창에서 이미 연결 처리가 완료되었으므로 추가 처리 불필요
 
-    def check_and_connect_email(self, retry_count=0):
-        """이메일 설정 확인 및 SMTP 연결 (재시도 포함)"""
+    def check_and_connect_email(self):
+        """이메일 설정 확인 후 SMTP 연결 요청
+
+        실제 연결(재시도 포함)은 연결 관리자가 백그라운드에서 하고,
+        결과는 _poll_connection_events에서 화면에 반영합니다.
+        """
         email = self.config_manager.get('email.sender_email', '')
         password = self.config_manager.get('email.sender_password', '')
         smtp_server = self.config_manager.get('email.smtp_server', '')
-        smtp_port = self.config_manager.get('email.smtp_port', 587)
 
         if not email or not password or not smtp_server:
             self.log("⚠️ 이메일 설정이 필요합니다. '⚙️ 설정' 버튼을 클릭하세요.", 'WARNING')
             self.set_status("이메일 설정 필요 ⚠️", 'orange')
             self.set_email_status("연결 안됨", 'red')
-            self.connection_state['connected'] = False
             return False
 
-        # 이미 연결되어 있으면 재사용
-        if self.get_connection_state():
-            self.log(f"✅ SMTP 연결 재사용: {email}", 'SUCCESS')
-            self.set_status("준비 완료 ✅", 'green')
-            self.set_email_status("연결됨", 'green')
-            return True
+        if self.sending:
+            # 발송 스레드가 기본 연결을 쓰는 중 - 두 스레드가 한 연결을 쓰지 않도록 끝난 뒤 연결
+            self.reconnect_after_send = True
+            return False
 
-        # SMTP 서버 연결 시도
-        self.log(f"🔌 SMTP 서버 연결 중... ({smtp_server}:{smtp_port})", 'INFO')
+        self.connection_manager.resume()
+        self.connection_manager.connect()
+        return True
 
+    def _poll_connection_events(self):
+        """연결 관리자가 보낸 이벤트를 화면에 반영 (메인 스레드에서 주기적으로 실행)"""
         try:
-            # 기존 연결이 있으면 종료
-            self.disconnect_smtp()
-
-            # 새 연결 생성 - 포트에 따라 SSL/TLS 선택
-            if smtp_port == 465:
-                # SSL 연결
-                self.connection_state['server_conn'] = smtplib.SMTP_SSL(
-                    smtp_server, smtp_port, timeout=30)
-                self.connection_state['server_conn'].ehlo()
-            else:
-                # TLS 연결
-                self.connection_state['server_conn'] = smtplib.SMTP(
-                smtp_server, smtp_port, timeout=30)
-            self.connection_state['server_conn'].ehlo()
-            self.connection_state['server_conn'].starttls()
-            self.connection_state['server_conn'].ehlo()
-            
-            self.connection_state['server_conn'].login(email, password)
+            while True:
+                kind, data = self.connection_manager.events.get_nowait()
+                if kind == 'log':
+                    message, level, is_debug = data
+                    self.log(message, level, is_debug=is_debug, category='smtp')
+                elif kind == 'status':
+                    self._apply_connection_status(data)
+        except queue.Empty:
+            pass
+        self.root.after(200, self._poll_connection_events)
 
-            self.connection_state['connected'] = True
-            self.connection_state['last_activity'] = time.time()
-            self.log(f"✅ SMTP 서버 연결 성공: {email}", 'SUCCESS')
+    def _apply_connection_status(self, info):
+        """연결 상태 변경을 상태 표시줄에 반영"""
+        state = info['state']
+        if state == 'connected':
             self.set_status("준비 완료 ✅", 'green')
             self.set_email_status("연결됨", 'green')
-            # 연결 모니터링 시작
-            self.start_connection_monitor()
-            return True
-
-        except smtplib.SMTPAuthenticationError as e:
-            self.connection_state['connected'] = False
-            self.connection_state['server_conn'] = None
-            self.log(f"❌ 인증 실패: {e}", 'ERROR')
-            self.log("💡 이메일 주소와 앱 비밀번호를 확인하세요.", 'ERROR')
+        elif state == 'connecting':
+            self.set_email_status("연결 중...", 'orange')
+        elif state == 'retrying':
+            self.set_status(f"연결 재시도 중... ({info['attempt']}/{info['max_attempts']})", 'orange')
+            self.set_email_status("재시도 중", 'orange')
+        elif state == 'auth_failed':
             self.set_status("이메일 연결 실패 ❌", 'red')
             self.set_email_status("인증 실패", 'red')
-            return False
-
-        except Exception as e:
-            self.connection_state['connected'] = False
-            self.connection_state['server_conn'] = None
-
-            # 재시도 로직 (최대 2번)
-            if retry_count < 2:
-                retry_count += 1
-                self.log(f"❌ SMTP 연결 실패 (시도 {retry_count}/3): {e}", 'ERROR')
-                self.log(f"🔄 3초 후 재시도합니다...", 'WARNING')
-                self.set_status(f"연결 재시도 중... ({retry_count}/3)", 'orange')
-                self.set_email_status("재시도 중", 'orange')
-
-                # 모니터링 중지 (재시도 중)
-                self.stop_connection_monitor()
-                # 3초 대기 후 재시도
-                self.root.after(
-                    3000, lambda: self.check_and_connect_email(retry_count))
-                return False
-            else:
-                self.log(f"❌ SMTP 연결 최종 실패: {e}", 'ERROR')
-                self.set_status("이메일 연결 실패 ❌", 'red')
-                self.set_email_status("연결 실패", 'red')
-            return False
-
-    def disconnect_smtp(self):
-        """SMTP 연결 종료"""
-        if self.connection_state['server_conn']:
-            try:
-                self.connection_state['server_conn'].quit()
-                self.log("🔌 SMTP 연결 종료", is_debug=True)
-            except:
-                pass
-
-        # 상태 초기화
-        self.connection_state['server_conn'] = None
-        self.connection_state['connected'] = False
-        self.connection_state['last_activity'] = None
-
-        # 타이머 정지
-        if self.connection_state['check_timer']:
-            self.root.after_cancel(self.connection_state['check_timer'])
-            self.connection_state['check_timer'] = None
-
-        self.update_connection_status()
+        elif state == 'failed':
+            self.set_status("이메일 연결 실패 ❌", 'red')
+            self.set_email_status("연결 실패", 'red')
+        elif state == 'lost':
+            self.set_status("연결 끊어짐 ⚠️", 'orange')
+            self.set_email_status("연결 안됨", 'red')
+        elif state == 'disconnected':
+            self.set_email_status("연결 안됨", 'red')
 
     def on_closing(self):
         """프로그램 종료 시 처리"""
         self.log("프로그램 종료 중...", 'INFO')
-        # 연결 모니터링 중지
-        self.stop_connection_monitor()
-        self.disconnect_smtp()
+        # 발송 중이면 중지하고 잠시 기다림 (업로드 중인 메일도 중단됨)
+        if hasattr(self, 'send_thread') and self.send_thread.is_alive():
+            self.send_control.cancel()
+            self.send_thread.join(5)
+        # 연결 종료 (서버가 응답하지 않아도 오래 기다리지 않음)
+        self.connection_manager.shutdown()
+        self.run_log.close()
+        # 대기열에 남은 로그까지 모두 기록 파일에 쓰고 종료 (한 번에 LOG_FLUSH_MAX_LINES줄씩)
+        while self.flush_logs():
+            pass
+        self.log_history.close()
         self.root.destroy()
 
     def check_email_config(self):
@@ -3630,13 +6832,8 @@ Q. 파일이 인식이 안 돼요?
         password = self.config_manager.get('email.sender_password', '')
 
         if email and password:
-            # 이메일 연결 시도
-            if self.check_and_connect_email():
-                self.log(f"✅ 이메일 설정 및 연결 성공: {email}", 'SUCCESS')
-                self.set_status("준비 완료 ✅", 'green')
-            else:
-                self.log(f"⚠️ 이메일 설정됨: {email} (연결 실패)", 'WARNING')
-                self.set_status("이메일 연결 실패 ❌", 'red')
+            # 이메일 연결 시도 (결과는 연결 관리자가 알려줌)
+            self.check_and_connect_email()
         else:
             self.log("⚠️ 이메일 설정이 필요합니다. '⚙️ 설정' 버튼을 클릭하세요.", 'WARNING')
             self.set_status("이메일 설정 필요 ⚠️", 'orange')
@@ -3644,9 +6841,9 @@ Q. 파일이 인식이 안 돼요?
 
     def scan_pdfs(self):
         """PDF 분석"""
-        self.log("\n" + "="*60, 'INFO')
-        self.log("📂 PDF 파일 분석 시작", 'INFO')
-        self.log("="*60 + "\n", 'INFO')
+        self.log("\n" + "="*60, 'INFO', category='scan')
+        self.log("📂 PDF 파일 분석 시작", 'INFO', category='scan')
+        self.log("="*60 + "\n", 'INFO', category='scan')
 
         pdf_folder = Path(self.pdf_folder_var.get())
         if not pdf_folder.exists():
@@ -3656,7 +6853,7 @@ Q. 파일이 인식이 안 돼요?
 
         # PDF 파일 검색
         pdf_files = list(pdf_folder.rglob('*.pdf'))
-        self.log(f"총 {len(pdf_files)}개 PDF 파일 발견", 'INFO')
+        self.log(f"총 {len(pdf_files)}개 PDF 파일 발견", 'INFO', category='scan')
 
         # 회사별로 그룹화
         pattern = re.compile(self.config_manager.get('pattern', ''))
@@ -3686,9 +6883,9 @@ Q. 파일이 인식이 안 돼요?
             company_pdfs[company_name].append(pdf_path)
 
         # 결과 출력
-        self.log("\n" + "="*60, 'INFO')
-        self.log("📊 PDF 분석 결과", 'INFO')
-        self.log("="*60, 'INFO')
+        self.log("\n" + "="*60, 'INFO', category='scan')
+        self.log("📊 PDF 분석 결과", 'INFO', category='scan')
+        self.log("="*60, 'INFO', category='scan')
 
         # 파일 크기 체크 및 발송 가능한 회사 분리
         valid_company_pdfs = {}
@@ -3702,75 +6899,81 @@ Q. 파일이 인식이 안 돼요?
             else:
                 valid_company_pdfs[company_name] = files
 
+        rejected_emails = self.config_manager.get('rejected_emails', {})
         if valid_company_pdfs:
-            self.log(f"\n✅ 발송 가능한 회사 ({len(valid_company_pdfs)}개):", 'SUCCESS')
+            self.log(f"\n✅ 발송 가능한 회사 ({len(valid_company_pdfs)}개):", 'SUCCESS', category='scan')
             for company_name, files in valid_company_pdfs.items():
                 info = companies[company_name]
-                self.log(f"   [{company_name}]", 'INFO')
-                self.log(f"   받는 사람: {', '.join(info['emails'])}", 'INFO')
-                self.log(f"   이메일 양식: {info['template']}", 'INFO')
-                self.log(f"   첨부 파일: {len(files)}개", 'INFO')
+                self.log(f"   [{company_name}]", 'INFO', category='scan')
+                self.log(f"   받는 사람: {', '.join(info['emails'])}", 'INFO', category='scan')
+                for email in info['emails']:
+                    if email in rejected_emails:
+                        rejected = rejected_emails[email]
+                        self.log(f"   ⛔ 이전에 영구 거부된 주소: {email} "
+                                 f"[{rejected.get('code')}] ({rejected.get('date', '')})", 'WARNING', category='scan')
+                self.log(f"   이메일 양식: {info['template']}", 'INFO', category='scan')
+                self.log(f"   첨부 파일: {len(files)}개", 'INFO', category='scan')
 
                 # 파일 크기 표시
                 total_size = sum(file.stat().st_size for file in files)
                 size_mb = total_size / (1024 * 1024)
-                self.log(f"   📎 총 파일 크기: {size_mb:.1f}MB", 'INFO')
+                self.log(f"   📎 총 파일 크기: {size_mb:.1f}MB", 'INFO', category='scan')
 
                 for file in files:
-                    self.log(f"     - {file.name}", 'INFO')
+                    self.log(f"     - {file.name}", 'INFO', category='scan')
 
         if size_exceeded:
             self.log(
-                f"\n❌ 파일 크기 초과로 발송 불가능한 회사 ({len(size_exceeded)}개):", 'ERROR')
+                f"\n❌ 파일 크기 초과로 발송 불가능한 회사 ({len(size_exceeded)}개):", 'ERROR', category='scan')
             for company_name, files in size_exceeded.items():
                 info = companies[company_name]
                 total_size = sum(file.stat().st_size for file in files)
                 size_mb = total_size / (1024 * 1024)
-                self.log(f"   [{company_name}]", 'ERROR')
-                self.log(f"   받는 사람: {', '.join(info['emails'])}", 'ERROR')
+                self.log(f"   [{company_name}]", 'ERROR', category='scan')
+                self.log(f"   받는 사람: {', '.join(info['emails'])}", 'ERROR', category='scan')
                 self.log(
-                    f"   ⚠️ 파일 크기 초과: {size_mb:.1f}MB (제한: 25MB)", 'ERROR')
-                self.log(f"   📝 해결 방법: 파일을 분할하거나 압축하세요", 'INFO')
+                    f"   ⚠️ 파일 크기 초과: {size_mb:.1f}MB (제한: 25MB)", 'ERROR', category='scan')
+                self.log(f"   📝 해결 방법: 파일을 분할하거나 압축하세요", 'INFO', category='scan')
                 for file in files:
-                    self.log(f"     - {file.name}", 'ERROR')
+                    self.log(f"     - {file.name}", 'ERROR', category='scan')
 
         if unrecognized:
-            self.log(f"\n⚠️ 파일명 인식 실패 ({len(unrecognized)}개):", 'WARNING')
-            self.log("   📝 해결 방법:", 'INFO')
-            self.log("   1. 파일명에 회사명이 포함되어 있는지 확인", 'INFO')
-            self.log("   2. 파일명 패턴이 올바른지 '⚙️ 설정 > 고급 설정'에서 확인", 'INFO')
-            self.log("   3. 예시: '삼성전자___보고서.pdf' 또는 '삼성전자.pdf'", 'INFO')
-            self.log("   ", 'INFO')
+            self.log(f"\n⚠️ 파일명 인식 실패 ({len(unrecognized)}개):", 'WARNING', category='scan')
+            self.log("   📝 해결 방법:", 'INFO', category='scan')
+            self.log("   1. 파일명에 회사명이 포함되어 있는지 확인", 'INFO', category='scan')
+            self.log("   2. 파일명 패턴이 올바른지 '⚙️ 설정 > 고급 설정'에서 확인", 'INFO', category='scan')
+            self.log("   3. 예시: '삼성전자___보고서.pdf' 또는 '삼성전자.pdf'", 'INFO', category='scan')
+            self.log("   ", 'INFO', category='scan')
             for f in unrecognized[:3]:
-                self.log(f"   - {f}", 'WARNING')
+                self.log(f"   - {f}", 'WARNING', category='scan')
             if len(unrecognized) > 3:
-                self.log(f"   ... 외 {len(unrecognized)-3}개", 'WARNING')
+                self.log(f"   ... 외 {len(unrecognized)-3}개", 'WARNING', category='scan')
 
         if no_info:
-            self.log(f"\n❌ 회사 정보 미등록 ({len(no_info)}개):", 'ERROR')
+            self.log(f"\n❌ 회사 정보 미등록 ({len(no_info)}개):", 'ERROR', category='scan')
             for company_name in list(no_info.keys())[:3]:
-                self.log(f"   - {company_name}", 'ERROR')
+                self.log(f"   - {company_name}", 'ERROR', category='scan')
             if len(no_info) > 3:
-                self.log(f"   ... 외 {len(no_info)-3}개", 'ERROR')
-            self.log("   ", 'INFO')
-            self.log("   📝 해결 방법:", 'INFO')
-            self.log("   1. '⚙️ 설정 > 회사 정보'에서 해당 회사 추가", 'INFO')
-            self.log("   2. 이메일 주소와 사용할 양식 설정", 'INFO')
-            self.log("   3. 회사명이 정확히 일치하는지 확인", 'INFO')
+                self.log(f"   ... 외 {len(no_info)-3}개", 'ERROR', category='scan')
+            self.log("   ", 'INFO', category='scan')
+            self.log("   📝 해결 방법:", 'INFO', category='scan')
+            self.log("   1. '⚙️ 설정 > 회사 정보'에서 해당 회사 추가", 'INFO', category='scan')
+            self.log("   2. 이메일 주소와 사용할 양식 설정", 'INFO', category='scan')
+            self.log("   3. 회사명이 정확히 일치하는지 확인", 'INFO', category='scan')
 
         # 최종 결과
         if valid_company_pdfs:
             self.send_button.config(state='normal')
             self.company_pdfs = valid_company_pdfs  # 발송 가능한 회사만 저장
             self.log(
-                f"\n🎉 분석 완료! {len(valid_company_pdfs)}개 회사에 이메일을 발송할 수 있습니다.", 'SUCCESS')
-            self.log("   '✉️ 이메일 발송하기' 버튼을 클릭하세요.", 'SUCCESS')
+                f"\n🎉 분석 완료! {len(valid_company_pdfs)}개 회사에 이메일을 발송할 수 있습니다.", 'SUCCESS', category='scan')
+            self.log("   '✉️ 이메일 발송하기' 버튼을 클릭하세요.", 'SUCCESS', category='scan')
         else:
-            self.log(f"\n😞 발송 가능한 PDF가 없습니다.", 'ERROR')
+            self.log(f"\n😞 발송 가능한 PDF가 없습니다.", 'ERROR', category='scan')
             if unrecognized or no_info or size_exceeded:
-                self.log("   위의 해결 방법을 참고하여 문제를 해결하세요.", 'INFO')
+                self.log("   위의 해결 방법을 참고하여 문제를 해결하세요.", 'INFO', category='scan')
             else:
-                self.log("   PDF 폴더에 파일이 없거나, 파일명 패턴에 맞는 파일이 없습니다.", 'INFO')
+                self.log("   PDF 폴더에 파일이 없거나, 파일명 패턴에 맞는 파일이 없습니다.", 'INFO', category='scan')
 
     def send_emails(self):
         """이메일 발송 (별도 스레드에서 실행)"""
@@ -3786,8 +6989,8 @@ Q. 파일이 인식이 안 돼요?
                 "PDF 없음", "발송할 PDF가 없습니다.\nPDF 분석을 먼저 실행하세요.", parent=self.root)
             return
 
-        # 이메일 연결 상태 확인
-        if not self.get_connection_state():
+        # 이메일 연결 상태 확인 (네트워크 확인 없이 마지막으로 알려진 상태 사용)
+        if not self.connection_state['connected']:
             messagebox.showerror(
                 "연결 오류", "이메일 서버에 연결되지 않았습니다.\n'⚙️ 설정'에서 이메일 설정을 확인하세요.", parent=self.root)
             return
@@ -3803,9 +7006,12 @@ Q. 파일이 인식이 안 돼요?
         if not self._show_confirm_dialog("발송 확인", "이메일을 발송하시겠습니까?"):
             return
 
-        # 발송 버튼 비활성화 (중복 실행 방지)
-        self.send_button.config(state='disabled', text="📤 발송 중...")
-        self.scan_button.config(state='disabled')
+        # 발송 버튼 비활성화 (중복 실행 방지) - 스레드가 끝나야 다시 활성화됨
+        self.send_control = SendJobControl()
+        self.send_progress = SendProgress()
+        self.sending = True
+        self.set_send_state('running')
+        self._start_progress_display()
 
         # 이메일 발송 중에는 연결 모니터링 중지
         self.stop_connection_monitor()
@@ -3818,20 +7024,82 @@ Q. 파일이 인식이 안 돼요?
         self.send_thread.start()
         self.log("✅ 이메일 발송 스레드 시작됨", 'INFO')
 
-        # 스레드 상태 확인을 위한 타이머 (설정된 시간 후)
-        timeout_seconds = self.config_manager.get(
-            'email_send_timeout', 180)  # 기본 3분
-        self.thread_check_timer = self.root.after(
-            timeout_seconds * 1000, self._check_thread_status)
+    def set_send_state(self, state):
+        """발송 상태에 맞게 버튼과 상태 표시 변경
+
+        state: 'running', 'pausing'(진행 중인 메일 완료 대기), 'paused', 'cancelling', 'idle'
+        """
+        if state == 'idle':
+            self.send_button.config(state='normal', text="이메일 발송하기")
+            self.scan_button.config(state='normal')
+            self.pause_button.config(state='disabled', text="⏸ 일시정지")
+            self.cancel_button.config(state='disabled')
+            return
+
+        self.send_button.config(state='disabled', text="📤 발송 중...")
+        self.scan_button.config(state='disabled')
+        if state == 'running':
+            self.pause_button.config(state='normal', text="⏸ 일시정지")
+            self.cancel_button.config(state='normal')
+            self.set_status("발송 중... 📤", 'blue')
+        elif state == 'pausing':
+            self.pause_button.config(state='normal', text="▶ 계속")
+            self.cancel_button.config(state='normal')
+            self.set_status("일시정지 중... (진행 중인 메일 완료 대기)", 'orange')
+        elif state == 'paused':
+            self.pause_button.config(state='normal', text="▶ 계속")
+            self.cancel_button.config(state='normal')
+            self.set_status("일시정지됨 ⏸", 'orange')
+        elif state == 'cancelling':
+            self.pause_button.config(state='disabled')
+            self.cancel_button.config(state='disabled')
+            self.set_status("중지 중... ⏹", 'orange')
+
+    def toggle_pause_sending(self):
+        """발송 일시정지 / 재개"""
+        control = getattr(self, 'send_control', None)
+        if control is None or control.cancelled:
+            return
+        if control.paused:
+            control.resume()
+            self.log("▶️ 발송 재개 요청", 'INFO')
+            self.set_send_state('running')
+        else:
+            control.pause()
+            self.log("⏸️ 일시정지 요청 - 진행 중인 메일까지만 보냅니다", 'INFO')
+            self.set_send_state('pausing')
+
+    def _on_send_paused(self):
+        """발송 스레드가 실제로 멈췄을 때 (그사이 재개·중지했으면 무시)"""
+        control = getattr(self, 'send_control', None)
+        if control is not None and control.paused:
+            self.set_send_state('paused')
+
+    def cancel_sending(self):
+        """발송 중지 (업로드 중인 메일도 중단, 남은 회사는 보내지 않음)"""
+        control = getattr(self, 'send_control', None)
+        if control is None or control.cancelled:
+            return
+        if not self._show_confirm_dialog(
+                "발송 중지", "발송을 중지하시겠습니까?\n\n업로드 중인 메일도 중단되고, 남은 회사는 보내지 않습니다."):
+            return
+        control.cancel()
+        self.log("⏹ 발송 중지 요청", 'WARNING')
+        self.set_send_state('cancelling')
 
     def _send_emails_thread(self):
         """이메일 발송 스레드 함수"""
+        run_id = datetime.now().strftime('%Y%m%d-%H%M%S')  # 발송 기록에서 이번 발송을 묶는 값
+        run_started = time.monotonic()
         try:
             self._thread_safe_log("\n" + "="*60, 'INFO')
             self._thread_safe_log("✉️ 이메일 발송 시작", 'INFO')
             self._thread_safe_log("="*60 + "\n", 'INFO')
             self._thread_safe_log("🔍 스레드가 정상적으로 시작되었습니다", 'INFO')
 
+            # 연결 관리자가 연결을 다루는 중이면 끝날 때까지 대기
+            self.connection_manager.wait_idle()
+
             # company_pdfs 확인
             if not hasattr(self, 'company_pdfs') or not self.company_pdfs:
                 self._thread_safe_log("❌ company_pdfs가 없거나 비어있습니다", 'ERROR')
@@ -3841,212 +7109,703 @@ Q. 파일이 인식이 안 돼요?
             self._thread_safe_log(
                 f"📊 발송할 회사 수: {len(self.company_pdfs)}", 'INFO')
 
-            # 이메일 설정 가져오기 (현재 설정)
-            smtp_server = self.config_manager.get('email.smtp_server')
-            smtp_port = self.config_manager.get('email.smtp_port')
-            sender_email = self.config_manager.get('email.sender_email')
-            sender_password = self.config_manager.get('email.sender_password')
-
-            self._thread_safe_log(
-                f"   [DEBUG] 현재 이메일 설정: {sender_email}", is_debug=True)
-
             companies = self.config_manager.get('companies', {})
             templates = self.config_manager.get('email_templates', {})
+            # 양식 변수 (날짜/시간과 커스텀 변수는 발송 시작 때 한 번만 계산)
+            render_context = RenderContext.from_config(self.config_manager)
+            if render_context.pinned:
+                self._thread_safe_log(
+                    f"🕒 양식 날짜/시간을 {render_context.now:%Y-%m-%d %H:%M:%S}로 고정합니다", 'INFO')
+
+            # 발신 계정 준비 (계정마다 발송 한도와 SMTP 연결을 따로 관리)
+            # 기본 계정은 메인 화면에서 관리하는 연결을 그대로 사용
+            account_pool = SenderAccountPool()
+            rate_limits = self.config_manager.get('rate_limits', {})
+            breakers = {}  # {(서버, 포트): CircuitBreaker} - 같은 서버를 쓰는 계정은 차단기 공유
+            for settings in get_sender_accounts(self.config_manager):
+                quota_profile = get_quota_profile(
+                    settings['smtp_server'], settings['smtp_port'], rate_limits)
+                rate_limiter = SendRateLimiter(
+                    settings['sender_email'], quota_profile, self.quota_store)
+                account = account_pool.add(settings, rate_limiter,
+                                           self.connection_state if settings['primary'] else None)
+                server_key = (settings['smtp_server'], str(settings['smtp_port']))
+                if server_key not in breakers:
+                    breakers[server_key] = CircuitBreaker(
+                        f"{settings['smtp_server']}:{settings['smtp_port']}",
+                        failure_threshold=self.config_manager.get('circuit_failure_threshold', 3),
+                        probe_interval=self.config_manager.get('circuit_probe_interval', 15))
+                account['breaker'] = breakers[server_key]
+
+                remaining_today = rate_limiter.remaining_recipients_today()
+                self._thread_safe_log(
+                    f"📮 {settings['sender_email']} 발송 한도 ({quota_profile['provider']}): "
+                    f"분당 {quota_profile['messages_per_minute'] or '무제한'}건, "
+                    f"오늘 남은 수신자 {'무제한' if remaining_today is None else f'{remaining_today}명'}", 'INFO')
+            multi_account = len(account_pool.accounts) > 1
 
             success_count = 0
             fail_count = 0
 
-            # 회사별로 이메일 발송
-            for company_name, pdf_paths in self.company_pdfs.items():
+            # 발송 대기열 (실패한 회사는 백오프 후 다시 대기열에 들어감)
+            # 동시에 보낼 수 있는 작업이 여러 개면 설정한 발송 순서대로 꺼냄
+            queue_order = self.config_manager.get('queue_order', 'original')
+            if queue_order not in QUEUE_ORDERS:
+                queue_order = 'original'
+            scheduler = RetryScheduler(
+                max_attempts=self.config_manager.get('retry_max_attempts', 3),
+                backoff_base=self.config_manager.get('retry_backoff_base', 2),
+                backoff_max=self.config_manager.get('retry_backoff_max', 60),
+                order_key=lambda job: queue_order_key(
+                    queue_order, job, companies.get(job['company'], {})))
+            jobs = []
+            for index, (company_name, pdf_paths) in enumerate(self.company_pdfs.items()):
                 try:
-                    company_info = companies[company_name]
-                    to_emails = company_info['emails']
-                    template_name = company_info['template']
-
-                    # 이메일 내용 생성
-                    template = templates.get(template_name, {})
-                    subject = template.get('subject', '')
-                    body = template.get('body', '')
-
-                    # 변수 치환 (첫 번째 파일 이름 사용)
-                    now = datetime.now()
-                    filename = pdf_paths[0].name if pdf_paths else ''
-
-                    replacements = {
-                        '{회사명}': company_name,
-                        '{파일명}': filename,
-                        '{날짜}': now.strftime('%Y-%m-%d'),
-                        '{시간}': now.strftime('%H:%M:%S'),
-                        # 세분화된 날짜 변수들
-                        '{년}': now.strftime('%Y'),
-                        '{월}': now.strftime('%m'),
-                        '{일}': now.strftime('%d'),
-                        '{요일}': now.strftime('%A'),
-                        '{요일한글}': ['월', '화', '수', '목', '금', '토', '일'][now.weekday()],
-                        # 세분화된 시간 변수들
-                        '{시}': now.strftime('%H'),
-                        '{분}': now.strftime('%M'),
-                        '{초}': now.strftime('%S'),
-                        # 12시간 형식
-                        '{시간12}': now.strftime('%I:%M %p'),
-                        '{오전오후}': '오전' if now.hour < 12 else '오후'
-                    }
-
-                    # 커스텀 변수 추가
-                    custom_vars = self.config_manager.get('custom_variables', {})
-                    for var_name, var_value in custom_vars.items():
-                        replacements[f'{{{var_name}}}'] = var_value
-
-                    for key, value in replacements.items():
-                        subject = subject.replace(key, value)
-                        body = body.replace(key, value)
-
-                    # 여러 파일인 경우 본문에 파일 목록 추가
-                    if len(pdf_paths) > 1:
-                        file_list = '\n'.join(
-                            [f"- {pdf.name}" for pdf in pdf_paths])
-                        body = body + f"\n\n[첨부 파일]\n{file_list}"
-
-                    # 이메일 발송
+                    # 본문을 만들기 전까지는 첨부 크기로 추정 (렌더링 후 다시 계산)
+                    message_size = estimate_message_size('', pdf_paths)
+                except OSError:
+                    message_size = 0  # 분석 뒤 PDF가 없어짐 - 발송 단계에서 이 회사만 실패 처리
+                jobs.append({'company': company_name, 'pdf_paths': pdf_paths,
+                             'index': index,    # PDF 분석 순서 (같은 순위일 때 기준)
+                             'message_size': message_size,
+                             'attempt': 0, 'history': [],
+                             'pending': None,   # 아직 수락되지 않은 수신자 (첫 시도 때 채움)
+                             'accepted': [],    # 수락된 수신자
+                             'rejected': {}})   # 영구 거부된 수신자 {주소: (코드, 메시지)}
+
+            # 제목/본문은 발송 전에 양식별로 한 번에 만들어 둠 (발송 순서와 예상 시간에도 사용)
+            self._prerender_jobs(jobs, companies, templates, render_context)
+            for job in jobs:
+                scheduler.push(job)
+            progress = self.send_progress
+            progress.begin(len(jobs), sum(job['message_size'] for job in jobs))
+
+            attempt_stats = {}  # {시도 차수: {'success': n, 'fail': n}}
+            failed_jobs = []
+            cancelled_jobs = []  # 중지 요청으로 보내지 않은 작업
+            control = self.send_control
+            pause_reported = False
+            rejected_emails = {}  # 이번 발송에서 영구 거부된 주소
+            phase_timings = PhaseTimings()  # SMTP 단계별 소요 시간 (진단 창에서도 사용)
+            self.last_phase_timings = phase_timings
+
+            # 동시 발송 수 조절 (서버 응답을 보고 1부터 자동으로 늘리고 줄임)
+            concurrency = ConcurrencyController(
+                max_limit=self.config_manager.get('max_concurrency', 4))
+            self.root.after(0, self.set_concurrency_status,
+                            concurrency.current, concurrency.max_limit)
+            executor = ThreadPoolExecutor(max_workers=concurrency.max_limit)
+            running = {}  # {Future: (작업, 계정, 연결, 감시 정보)}
+            deadline_base = self.config_manager.get('message_deadline_base', 60)
+            deadline_min_rate = self.config_manager.get('message_deadline_min_rate', 50) * 1024
+            give_up_after = self.config_manager.get('circuit_give_up_after', 600)
+
+            # 발송 순서와 예상 소요 시간 안내 (동시 발송 수는 최대치로 가정)
+            schedule, total_eta = self._estimate_send_schedule(
+                scheduler, running, concurrency.max_limit, phase_timings)
+            self._thread_safe_log(
+                f"📋 발송 순서: {QUEUE_ORDERS[queue_order]} (예상 소요 시간 {format_duration(total_eta)})", 'INFO')
+            self.run_log.write('run_start', run=run_id, companies=len(jobs),
+                               accounts=[account['sender_email'] for account in account_pool.accounts],
+                               queue_order=queue_order, max_concurrency=concurrency.max_limit,
+                               estimated_seconds=round(total_eta, 1))
+            start_clock = datetime.now()
+            for position, (job, finish_in) in enumerate(schedule, 1):
+                deadline = parse_deadline(companies.get(job['company'], {}).get('deadline'), start_clock)
+                deadline_text = f", 마감 {deadline:%H:%M}" if deadline else ""
+                self._thread_safe_log(
+                    f"   {position}. [{job['company']}] {job['message_size'] / 1024:.0f}KB{deadline_text}", is_debug=True)
+                if deadline and start_clock + timedelta(seconds=finish_in) > deadline:
                     self._thread_safe_log(
-                        f"📤 [{company_name}] 발송 중...", 'INFO')
-                    if self.send_email_smtp(to_emails, subject, body, pdf_paths,
-                                           smtp_server, smtp_port, sender_email, sender_password):
-                        self._thread_safe_log(
-                                f"   ✓ 성공: {', '.join(to_emails)}", 'INFO')
-                        success_count += 1
-                        
-                        # 발송 완료된 파일 이동
-                        self.move_pdfs_to_completed(pdf_paths)
-                    else:
-                        self._thread_safe_log(f"   ✗ 실패", 'ERROR')
+                        f"   ⏰ [{job['company']}] 마감 시각 {deadline:%H:%M}까지 발송이 끝나지 않을 수 있습니다 "
+                        f"(예상 완료 {start_clock + timedelta(seconds=finish_in):%H:%M})", 'WARNING')
+            progress.set_eta(total_eta)
+
+            try:
+                while True:
+                    # 끝난 발송 결과 처리
+                    finished = [f for f in running if f.done()]
+                    for future in finished:
+                        job, account, connection, watch = running.pop(future)
+                        account_pool.checkin(account, connection)
+                        company_name = job['company']
+
+                        try:
+                            result = future.result()
+                        except Exception as e:
+                            self._thread_safe_log(f"❌ [{company_name}] 오류: {e}", 'ERROR')
+                            result = {'success': False, 'status': 'permanent', 'retryable': False,
+                                      'error': str(e), 'accepted': [],
+                                      'transient_refused': {}, 'permanent_refused': {}}
+
+                        if watch['timed_out'] and result['status'] == 'cancelled' and not control.cancelled:
+                            # 감시자가 중단한 발송 - 연결 장애처럼 처리하고 다시 보냄
+                            result = {'success': False, 'status': 'transient', 'retryable': True,
+                                      'error': f"발송 시간 초과 ({watch['limit']:.0f}초)", 'code': None,
+                                      'accepted': [], 'transient_refused': {}, 'permanent_refused': {},
+                                      'duration': result.get('duration', watch['limit']),
+                                      'connection_error': True, 'timings': result.get('timings')}
+
+                        if result['status'] == 'cancelled':
+                            account['breaker'].cancel_probe()
+                            cancelled_jobs.append(job)
+                            continue
+
+                        stats = attempt_stats.setdefault(
+                            job['attempt'], {'success': 0, 'fail': 0})
+
+                        if result['status'] in ('sent', 'partial'):
+                            account_pool.record_result(account, result['duration'])
+                        phase_timings.add(result.get('timings'))
+                        self.run_log.write(
+                            'attempt', 'INFO' if result['success'] else 'WARNING', run=run_id,
+                            company=company_name, attempt=job['attempt'], account=account['sender_email'],
+                            status=result['status'], bytes=job['message_size'],
+                            duration=round(result.get('duration') or 0.0, 3),
+                            timings={phase: round(seconds, 3)
+                                     for phase, seconds in (result.get('timings') or {}).items()
+                                     if phase in SMTP_PHASES},
+                            accepted=result['accepted'],
+                            refused={email: code for email, (code, _) in
+                                     {**result['transient_refused'], **result['permanent_refused']}.items()},
+                            code=result.get('code'), error=result['error'] or None)
+
+                        # 서버 차단기에 결과 반영 (서버가 응답했으면 정상으로 봄)
+                        breaker = account['breaker']
+                        if result.get('connection_error'):
+                            if breaker.record_failure():
+                                self._thread_safe_log(
+                                    f"🚫 SMTP 서버 {breaker.name} 연결 실패가 이어져 발송을 멈춥니다 "
+                                    f"({breaker.probe_interval:.0f}초 후 시험 발송)", 'WARNING')
+                        elif result['status'] == 'quota':
+                            breaker.cancel_probe()
+                        elif breaker.record_success():
+                            self._thread_safe_log(
+                                f"✅ SMTP 서버 {breaker.name} 복구됨 - 발송을 다시 시작합니다", 'SUCCESS')
+                        if concurrency.record(result, job['message_size']):
+                            self._thread_safe_log(
+                                f"   ⚙️ 동시 발송 수 조정: {concurrency.current}", is_debug=True)
+                            self.root.after(0, self.set_concurrency_status,
+                                            concurrency.current, concurrency.max_limit)
+
+                        if self._apply_send_result(job, account, result, rejected_emails):
+                            stats['success'] += 1
+                            success_count += 1
+                            progress.complete(job['message_size'], True)
+                            continue
+
+                        stats['fail'] += 1
+                        delay = None
+                        if job['pending'] and result['retryable']:
+                            delay = scheduler.reschedule(job)
+                        if delay is not None:
+                            self._thread_safe_log(
+                                f"   🔄 [{company_name}] {delay:.1f}초 후 재시도합니다 "
+                                f"({job['attempt'] + 1}/{scheduler.max_attempts}차, 수신자 {len(job['pending'])}명)", 'WARNING')
+                            continue
+
                         fail_count += 1
-                        
-                except Exception as e:
-                    self._thread_safe_log(f"❌ [{company_name}] 오류: {e}", 'ERROR')
-                    fail_count += 1
-            
+                        failed_jobs.append(job)
+                        progress.complete(job['message_size'], False)
+                        if result['status'] == 'unknown':
+                            self._thread_safe_log(
+                                f"   ⚠ [{company_name}] 서버가 메일을 받았는지 알 수 없어 다시 보내지 않습니다 - "
+                                f"받는 쪽에 확인하세요 (파일은 그대로 둡니다)", 'WARNING')
+                        elif job['accepted']:
+                            self._thread_safe_log(
+                                f"   ⚠ [{company_name}] 일부만 발송됨 ({len(job['accepted'])}/{len(job['to_emails'])}명) - "
+                                f"파일은 그대로 둡니다", 'WARNING')
+                        else:
+                            self._thread_safe_log(f"   ✗ [{company_name}] 실패", 'ERROR')
+
+                    if finished:
+                        _, remaining = self._estimate_send_schedule(
+                            scheduler, running, concurrency.current, phase_timings)
+                        progress.set_eta(remaining)
+
+                    # 감시: 제한 시간을 넘긴 발송만 끊음 (다른 발송은 그대로 진행)
+                    # 업로드 중이었으면 다시 보내고, 본문을 다 보낸 뒤였으면 수신 여부 불명으로 처리
+                    now = time.monotonic()
+                    for job, account, connection, watch in running.values():
+                        if watch['started'] is None or watch['timed_out']:
+                            continue
+                        if now - watch['started'] > watch['limit']:
+                            watch['timed_out'] = True
+                            self._thread_safe_log(
+                                f"   ⏱️ [{job['company']}] {watch['limit']:.0f}초 안에 끝나지 않아 중단합니다",
+                                'WARNING')
+                            watch['abort'].set()
+                            abort_connection(connection)
+
+                    if control.cancelled:
+                        # 중지: 대기 중인 작업은 보내지 않고, 진행 중인 발송이 멈추기를 기다림
+                        for _, _, _, watch in running.values():
+                            watch['abort'].set()
+                        cancelled_jobs.extend(scheduler.drain())
+                        if not running:
+                            break
+                    elif control.paused:
+                        # 일시정지: 새 발송은 시작하지 않고, 진행 중이던 메일이 끝나면 재개를 기다림
+                        if not running:
+                            if not pause_reported:
+                                pause_reported = True
+                                self._thread_safe_log("⏸️ 발송 일시정지됨 (진행 중이던 메일은 모두 끝남)", 'INFO')
+                                self.root.after(0, self._on_send_paused)
+                            control.resume_event.wait(0.5)
+                            continue
+                    elif pause_reported:
+                        pause_reported = False
+                        self._thread_safe_log("▶️ 발송 재개", 'INFO')
+
+                    # 동시 발송 수와 계정 연결에 여유가 있으면 다음 작업 시작
+                    # (연결이 모두 사용 중일 때 작업을 꺼냈다 다시 넣기를 반복하지 않도록 먼저 확인)
+                    while len(running) < concurrency.current and not control.paused \
+                            and not control.cancelled and account_pool.has_free_session():
+                        job = scheduler.pop_ready()
+                        if job is None:
+                            break
+                        company_name = job['company']
+
+                        try:
+                            company_info = companies[company_name]
+                            if job['pending'] is None:
+                                job['to_emails'] = list(company_info['emails'])
+                                job['pending'] = list(company_info['emails'])
+
+                            # 미리 만들지 못한 이메일 내용은 첫 시도에서 한 번만 생성
+                            if 'subject' not in job:
+                                job['subject'], job['body'] = self._build_company_email(
+                                    company_name, job['pdf_paths'], company_info, templates,
+                                    render_context)
+                                job['message_size'] = estimate_message_size(job['body'], job['pdf_paths'])
+                        except Exception as e:
+                            job['attempt'] += 1
+                            self._thread_safe_log(f"❌ [{company_name}] 오류: {e}", 'ERROR')
+                            job['history'].append({'attempt': job['attempt'], 'success': False,
+                                                   'status': 'permanent', 'error': str(e)})
+                            attempt_stats.setdefault(job['attempt'], {'success': 0, 'fail': 0})['fail'] += 1
+                            fail_count += 1
+                            failed_jobs.append(job)
+                            progress.complete(job['message_size'], False)
+                            continue
+
+                        # 발신 계정 선택 (회사에 고정된 계정이 있으면 그 계정만)
+                        pinned = company_info.get('account')
+                        account, state = account_pool.select(
+                            len(job['pending']), job['message_size'], pinned)
+                        if state == 'busy':
+                            # 고정된 계정의 연결이 모두 사용 중 - 잠시 후 다시 (시도 횟수는 그대로)
+                            scheduler.push(job, 0.2)
+                            continue
+                        if state == 'blocked':
+                            # 서버 장애로 차단기가 열림 - 시험 발송 시각까지 미룸 (시도 횟수는 그대로)
+                            blocked_breakers = account_pool.blocked_breakers(
+                                len(job['pending']), job['message_size'], pinned)
+                            if not blocked_breakers:
+                                # 그 사이 차단기가 시험 발송 시각이 됨 - 바로 다시 선택
+                                scheduler.push(job, 0.2)
+                                continue
+                            if min(b.outage_duration() for b in blocked_breakers) < give_up_after:
+                                scheduler.push(job, max(0.2, min(b.retry_in() for b in blocked_breakers)))
+                                continue
+
+                        job['attempt'] += 1
+                        if account is None:
+                            if state == 'blocked':
+                                outage_text = f"{give_up_after // 60}분" if give_up_after >= 60 else f"{give_up_after}초"
+                                error = f"SMTP 서버 장애 ({outage_text} 넘게 연결 불가)"
+                            elif pinned and account_pool.get(pinned) is None:
+                                error = f"고정된 발신 계정({pinned})이 설정에 없거나 사용 중지됨"
+                            else:
+                                error = f"일일 발송 한도 초과 (수신자 {len(job['pending'])}명, 남은 한도가 있는 계정 없음)"
+                            self._thread_safe_log(f"⛔ [{company_name}] {error}로 건너뜀", 'WARNING')
+                            job['history'].append({'attempt': job['attempt'], 'success': False,
+                                                   'status': 'quota', 'error': error})
+                            attempt_stats.setdefault(job['attempt'], {'success': 0, 'fail': 0})['fail'] += 1
+                            fail_count += 1
+                            failed_jobs.append(job)
+                            progress.complete(job['message_size'], False)
+                            continue
+
+                        if account['breaker'].start_call():
+                            self._thread_safe_log(
+                                f"🔎 SMTP 서버 {account['breaker'].name} 시험 발송: [{company_name}]", 'INFO')
+                        connection = account_pool.checkout(account)
+                        rates = phase_timings.rate_summary()
+                        watch = {'abort': threading.Event(), 'started': None, 'timed_out': False,
+                                 'limit': message_deadline(job['message_size'], rates[1] if rates else None,
+                                                           deadline_base, deadline_min_rate)}
+                        future = executor.submit(self._run_send_job, job, account, connection,
+                                                 scheduler.max_attempts, multi_account, control, watch)
+                        running[future] = (job, account, connection, watch)
+
+                    if not running:
+                        wait = scheduler.next_ready_in()
+                        if wait is None:
+                            break  # 대기열이 비었고 발송 중인 작업도 없음
+                        time.sleep(min(wait, 0.5))
+                    else:
+                        # 발송 하나가 끝나거나 재시도 시각이 될 때까지 대기
+                        wait = scheduler.next_ready_in()
+                        timeout = 0.5 if wait is None else min(max(wait, 0.05), 0.5)
+                        wait_futures(list(running), timeout=timeout, return_when=FIRST_COMPLETED)
+            finally:
+                executor.shutdown(wait=True)
+                progress.finish()
+
             # 결과 요약
             self._thread_safe_log("\n" + "="*60, 'INFO')
-            self._thread_safe_log(f"📊 발송 완료: 성공 {success_count}건, 실패 {fail_count}건", 'INFO')
+            if cancelled_jobs:
+                self._thread_safe_log(
+                    f"⏹ 발송 중지됨: 성공 {success_count}건, 실패 {fail_count}건, 미발송 {len(cancelled_jobs)}건", 'WARNING')
+            else:
+                self._thread_safe_log(f"📊 발송 완료: 성공 {success_count}건, 실패 {fail_count}건", 'INFO')
+            for attempt in sorted(attempt_stats):
+                stats = attempt_stats[attempt]
+                self._thread_safe_log(
+                    f"   {attempt}차 시도: 성공 {stats['success']}건, 실패 {stats['fail']}건", 'INFO')
+            for job in failed_jobs:
+                last_error = job['history'][-1]['error'] if job['history'] else ''
+                self._thread_safe_log(
+                    f"   ✗ [{job['company']}] {job['attempt']}회 시도 후 실패: {last_error}", 'ERROR')
+                if job['accepted']:
+                    self._thread_safe_log(
+                        f"      수신 완료: {', '.join(job['accepted'])}", 'INFO')
+                pending_label = "수신 여부 불명" if job['history'] and \
+                    job['history'][-1]['status'] == 'unknown' else "미발송"
+                for email in job['pending'] or []:
+                    self._thread_safe_log(f"      {pending_label}: {email}", 'WARNING')
+                for email, (code, reply) in job['rejected'].items():
+                    self._thread_safe_log(f"      영구 거부: {email} [{code}] {reply}", 'ERROR')
+            for job in cancelled_jobs:
+                partial = f" (수신 완료: {', '.join(job['accepted'])})" if job['accepted'] else ""
+                self._thread_safe_log(f"   ⏹ [{job['company']}] 미발송{partial}", 'WARNING')
+            if multi_account:
+                for account in account_pool.accounts:
+                    latency = f", 평균 {account['latency']:.1f}초" if account['latency'] is not None else ""
+                    self._thread_safe_log(
+                        f"   📨 {account['sender_email']}: {account['sent']}건{latency}", 'INFO')
+            timing_lines = phase_timings.report_lines()
+            if timing_lines:
+                self._thread_safe_log("   ⏱️ 단계별 소요 시간 (p50 / p95)", 'INFO')
+                for line in timing_lines:
+                    self._thread_safe_log(f"      {line}", 'INFO')
             self._thread_safe_log("="*60 + "\n", 'INFO')
+
+            # 발송 기록: 회사별 최종 결과와 전체 요약
+            failed_ids = {id(job) for job in failed_jobs}
+            cancelled_ids = {id(job) for job in cancelled_jobs}
+            for job in jobs:
+                outcome = 'failed' if id(job) in failed_ids else \
+                    'cancelled' if id(job) in cancelled_ids else 'sent'
+                self.run_log.write(
+                    'company', {'sent': 'INFO', 'failed': 'ERROR', 'cancelled': 'WARNING'}[outcome],
+                    run=run_id, company=job['company'], outcome=outcome, attempts=job['attempt'],
+                    recipients=job.get('to_emails') or [], accepted=job['accepted'],
+                    rejected={email: code for email, (code, _) in job['rejected'].items()},
+                    pending=job['pending'] or [], bytes=job['message_size'],
+                    files=[pdf.name for pdf in job['pdf_paths']],
+                    error=job['history'][-1]['error'] if outcome == 'failed' and job['history'] else None)
+            self.run_log.write('run_end', run=run_id, success=success_count, failed=fail_count,
+                               cancelled=len(cancelled_jobs),
+                               elapsed=round(time.monotonic() - run_started, 1))
+
+            # 발송용으로 연 연결 종료 (기본 계정의 메인 연결은 계속 유지)
+            account_pool.close_connections(keep=self.connection_state)
+
+            # 영구 거부된 주소는 설정에 기록 (다음 PDF 분석 때 경고)
+            if rejected_emails:
+                self.root.after(0, self._record_rejected_emails, rejected_emails)
             
             # UI 업데이트는 메인 스레드에서 실행
-            self.root.after(0, self._send_emails_completed, success_count, fail_count)
+            self.root.after(0, self._send_emails_completed, success_count, fail_count,
+                            len(cancelled_jobs))
             
         except Exception as e:
             self._thread_safe_log(f"❌ 발송 스레드 오류: {e}", 'ERROR')
             import traceback
             self._thread_safe_log(f"🔍 상세 오류: {traceback.format_exc()}", 'ERROR')
+            self.run_log.write('run_error', 'ERROR', run=run_id, error=str(e),
+                               elapsed=round(time.monotonic() - run_started, 1))
             self.root.after(0, self._send_emails_error, str(e))
     
-    def _send_emails_completed(self, success_count, fail_count):
+    def _estimate_send_schedule(self, scheduler, running, concurrency, phase_timings):
+        """대기열과 발송 중인 작업의 예상 완료 시간 계산 (이번 발송에서 측정한 속도 사용)
+
+        Returns: ([(작업, 지금부터 완료까지 예상 초)], 전체 남은 예상 초)
+        """
+        rates = phase_timings.rate_summary()
+        upload_rate = rates[1] if rates else None
+        command_times = [phase_timings.p50(phase) for phase in ('mail_rcpt', 'final')]
+        overhead = sum(command_times) if None not in command_times else None
+
+        now = time.monotonic()
+        busy = []
+        for job, _, _, watch in running.values():
+            expected = (ETA_DEFAULT_OVERHEAD if overhead is None else overhead) + \
+                job['message_size'] / (upload_rate or ETA_DEFAULT_RATE)
+            elapsed = now - watch['started'] if watch['started'] is not None else 0.0
+            busy.append(max(0.0, expected - elapsed))
+        return estimate_schedule(scheduler.pending_jobs(), concurrency,
+                                 upload_rate, overhead, busy)
+
+    def _run_send_job(self, job, account, connection, max_attempts, show_account, control, watch):
+        """발송 작업 1건 실행 (발송 스레드 풀에서 실행)
+
+        watch: 감시 정보 {'abort': 중단 Event, 'started': 전송 시작 시각, ...} - 발송 스레드가 제한 시간을 확인
+        """
+        company_name = job['company']
+        pending = job['pending']
+        to_emails = job['to_emails']
+        limiter = account['rate_limiter']
+
+        # 발송 한도 확인 (필요하면 대기) - 아직 받지 못한 수신자만 계산
+        if not limiter.acquire(len(pending), job['message_size'],
+                               log_func=self._thread_safe_log, stop_event=control.cancel_event):
+            if control.cancelled:
+                return {'success': False, 'status': 'cancelled', 'retryable': False,
+                        'error': "사용자가 발송을 중지함", 'accepted': [],
+                        'transient_refused': {}, 'permanent_refused': {}}
+            error = (f"일일 발송 한도 초과 (수신자 {len(pending)}명, "
+                     f"남은 한도 {limiter.remaining_recipients_today()}명)")
+            self._thread_safe_log(f"⛔ [{company_name}] {error}로 건너뜀", 'WARNING')
+            return {'success': False, 'status': 'quota', 'retryable': False,
+                    'error': error, 'accepted': [],
+                    'transient_refused': {}, 'permanent_refused': {}}
+
+        # 제한 시간은 발송 한도 대기가 끝난 뒤부터 계산
+        watch['started'] = time.monotonic()
+
+        attempt_text = f" ({job['attempt']}/{max_attempts}차 시도)" if job['attempt'] > 1 else ""
+        if len(pending) < len(to_emails):
+            attempt_text += f" - 남은 수신자 {len(pending)}/{len(to_emails)}명"
+        if show_account:
+            attempt_text += f" [발신: {account['sender_email']}]"
+        self._thread_safe_log(f"📤 [{company_name}] 발송 중...{attempt_text}", 'INFO')
+
+        timings = {}
+        progress = self.send_progress
+        progress.start_message(job['index'], company_name, job['message_size'])
+        try:
+            result = self.send_email_smtp(pending, job['subject'], job['body'], job['pdf_paths'],
+                                          account['smtp_server'], account['smtp_port'],
+                                          account['sender_email'], account['sender_password'],
+                                          display_to=to_emails, connection_state=connection,
+                                          timings=timings, cancel_event=watch['abort'],
+                                          progress=lambda sent, size: progress.update(job['index'], sent, size))
+            # 받은 수신자를 기록한 뒤에 차지했던 한도를 돌려줌 (그 사이 한도가 비어 보이지 않도록)
+            if result['accepted']:
+                limiter.record_sent(len(result['accepted']), job['message_size'])
+        finally:
+            limiter.release(len(pending))
+            progress.end_message(job['index'])
+        result['timings'] = timings
+        return result
+
+    def _apply_send_result(self, job, account, result, rejected_emails):
+        """발송 결과를 작업에 반영. 모든 수신자가 받았으면 파일을 옮기고 True 반환"""
+        job['history'].append({'attempt': job['attempt'],
+                               'success': result['success'],
+                               'status': result['status'],
+                               'error': result['error']})
+
+        # 수신자별 결과 반영
+        if result['accepted']:
+            job['accepted'].extend(result['accepted'])
+        if result['permanent_refused']:
+            job['rejected'].update(result['permanent_refused'])
+            rejected_emails.update(result['permanent_refused'])
+        if result['status'] in ('sent', 'partial') or result['transient_refused'] \
+                or result['permanent_refused']:
+            # 서버가 수신자별로 응답한 경우: 일시적으로 거부된 주소만 다시 보냄
+            job['pending'] = list(result['transient_refused'])
+
+        if result['success'] or (not job['pending'] and not job['rejected']):
+            self._thread_safe_log(
+                f"   ✓ [{job['company']}] 성공: {', '.join(job['accepted'])}", 'INFO')
+            # 모든 수신자가 받았을 때만 발송 완료 폴더로 이동
+            self.move_pdfs_to_completed(job['pdf_paths'])
+            return True
+        return False
+
+    def _build_company_email(self, company_name, pdf_paths, company_info, templates,
+                             context=None):
+        """회사별 이메일 제목/본문 생성 (양식 변수 치환)
+
+        context: 발송 시작 때 만든 RenderContext (없으면 설정으로 새로 만듦)
+        """
+        template = templates.get(company_info['template'], {})
+        if context is None:
+            context = RenderContext.from_config(self.config_manager)
+
+        values = context.values(company_name, pdf_paths, company_info.get('variables'))
+        subject = compile_template(template.get('subject', '')).render(values)
+        body = compile_template(with_default_file_list(template.get('body', ''))).render(values)
+        return subject, body
+
+    def _prerender_jobs(self, jobs, companies, templates, context):
+        """발송 전에 모든 메일의 제목/본문을 양식별로 모아 한 번에 렌더링
+
+        회사 정보나 양식이 없는 작업은 건너뜁니다 (발송 단계에서 오류로 처리).
+        메일을 만들다 오류가 난 회사(분석 뒤 PDF가 옮겨지거나 지워진 경우 등)도 그대로 두어
+        발송 단계에서 그 회사만 실패로 처리하고, 나머지 회사는 계속 렌더링합니다.
+        """
+        groups = {}  # {(제목 양식, 본문 양식): [작업]}
+        for job in jobs:
+            company_info = companies.get(job['company'])
+            if not company_info or 'template' not in company_info:
+                continue
+            template = templates.get(company_info['template'], {})
+            key = (template.get('subject', ''), template.get('body', ''))
+            groups.setdefault(key, []).append(job)
+
+        started = time.monotonic()
+        rendered_count = 0
+        for (subject_text, body_text), group in groups.items():
+            rows = [(job['company'], job['pdf_paths'], companies[job['company']].get('variables'))
+                    for job in group]
+            body_template = with_default_file_list(body_text)
+            try:
+                rendered = render_batch(subject_text, body_template, context, rows)
+                sizes = [estimate_message_size(body, job['pdf_paths'])
+                         for job, (_, body) in zip(group, rendered)]
+            except TemplateSyntaxError as e:
+                # 발송 단계에서 회사마다 오류로 처리됨
+                self._thread_safe_log(f"⚠️ 양식 오류 ({len(group)}개 회사): {e}", 'WARNING')
+                continue
+            except Exception:
+                # 어느 회사에서 난 오류인지 모르므로 이 양식은 회사별로 다시 렌더링
+                for job, row in zip(group, rows):
+                    try:
+                        ((subject, body),) = render_batch(subject_text, body_template, context, [row])
+                        size = estimate_message_size(body, job['pdf_paths'])
+                    except Exception as e:
+                        self._thread_safe_log(f"⚠️ [{job['company']}] 메일을 만들지 못했습니다: {e}", 'WARNING')
+                        continue
+                    job['subject'], job['body'], job['message_size'] = subject, body, size
+                    rendered_count += 1
+                continue
+            for job, (subject, body), size in zip(group, rendered, sizes):
+                job['subject'] = subject
+                job['body'] = body
+                job['message_size'] = size
+            rendered_count += len(group)
+        self._thread_safe_log(
+            f"📝 메일 {rendered_count}건 렌더링 완료 (양식 {len(groups)}개, "
+            f"{time.monotonic() - started:.2f}초)", is_debug=True)
+
+    def _record_rejected_emails(self, rejected):
+        """영구 거부된 수신자 주소를 설정에 기록 (메인 스레드)"""
+        stored = dict(self.config_manager.get('rejected_emails', {}))
+        today = datetime.now().strftime('%Y-%m-%d')
+        for email, (code, reply) in rejected.items():
+            stored[email] = {'code': code, 'message': reply, 'date': today}
+        self.config_manager.set('rejected_emails', stored)
+        self.log(f"⛔ 영구 거부된 주소 {len(rejected)}개를 기록했습니다. 회사 정보의 이메일을 확인하세요.", 'WARNING')
+
+    def _send_emails_completed(self, success_count, fail_count, cancelled_count=0):
         """이메일 발송 완료 후 UI 업데이트"""
-        # 타이머 정리
-        if hasattr(self, 'thread_check_timer'):
-            self.root.after_cancel(self.thread_check_timer)
+        self.sending = False
+        self._stop_progress_display()
+        self.set_concurrency_status()
+        self.set_eta_status()
         
         # 연결 모니터링 재시작
-        if self.get_connection_state():
-            self.start_connection_monitor()
+        self.start_connection_monitor()
+        self._reconnect_if_deferred()
+        if self.connection_state['connected']:
             total = success_count + fail_count
-            if fail_count == 0:
+            if cancelled_count:
+                self.log(f"⏹ 이메일 발송 중지: 성공 {success_count}건, 실패 {fail_count}건, 미발송 {cancelled_count}건", 'WARNING')
+            elif fail_count == 0:
                 self.log(f"✅ 이메일 발송 완료: {total}건 모두 성공", 'INFO')
             else:
                 self.log(f"⚠️ 이메일 발송 완료: 성공 {success_count}건, 실패 {fail_count}건 (총 {total}건)", 'WARNING')
         
-        # 버튼 상태 복원
-        self.send_button.config(state='normal', text="이메일 발송하기")
-        self.scan_button.config(state='normal')
+        # 버튼 상태 복원 (발송 스레드가 끝난 뒤에만)
+        self.set_send_state('idle')
+        self.set_status("발송 중지됨 ⏹" if cancelled_count else "발송 완료 ✅",
+                        'orange' if cancelled_count else 'green')
         
     
+    def _reconnect_if_deferred(self):
+        """발송 중에 바뀐 이메일 설정으로 다시 연결 (발송이 끝난 뒤 메인 스레드에서)"""
+        if not self.reconnect_after_send:
+            return
+        self.reconnect_after_send = False
+        self.log("📧 발송 중에 바뀐 이메일 설정으로 다시 연결합니다", 'INFO')
+        self.disconnect_smtp()
+        self.check_and_connect_email()
+
     def _send_emails_error(self, error_msg):
         """이메일 발송 오류 시 UI 업데이트"""
         self.log(f"🔧 UI 복원 시작: {error_msg}", 'INFO')
         
-        # 타이머 정리
-        if hasattr(self, 'thread_check_timer'):
-            self.root.after_cancel(self.thread_check_timer)
+        self.sending = False
+        self.send_progress.finish()
+        self._stop_progress_display()
+        self.set_concurrency_status()
+        self.set_eta_status()
         
         # 연결 모니터링 재시작
-        if self.get_connection_state():
-            self.start_connection_monitor()
+        self.start_connection_monitor()
+        self._reconnect_if_deferred()
+        if self.connection_state['connected']:
             self.log("▶️ 이메일 발송 오류 후 연결 모니터링을 재시작합니다", 'INFO')
         
-        # 버튼 상태 복원
-        self.send_button.config(state='normal', text="이메일 발송하기")
-        self.scan_button.config(state='normal')
+        # 버튼 상태 복원 (발송 스레드가 끝난 뒤에만 호출됨)
+        self.set_send_state('idle')
+        self.set_status("발송 오류 ❌", 'red')
         
         self.log("✅ 버튼 상태 복원 완료", 'INFO')
         
         # 오류 메시지 표시
         self._show_custom_message("발송 오류", f"이메일 발송 중 오류가 발생했습니다.\n\n{error_msg}", "error")
     
-    def _check_thread_status(self):
-        """스레드 상태 확인 (타임아웃 체크)"""
-        if hasattr(self, 'send_thread') and self.send_thread.is_alive():
-            timeout_seconds = self.config_manager.get('email_send_timeout', 180)
-            self.log(f"⚠️ 스레드가 {timeout_seconds}초 이상 실행 중입니다. 응답이 없을 수 있습니다.", 'WARNING')
-            # UI 복원
-            self.send_button.config(state='normal', text="이메일 발송하기")
-            self.scan_button.config(state='normal')
-            self._show_custom_message("타임아웃", f"이메일 발송이 {timeout_seconds}초 이상 실행 중입니다.\n설정에서 대기 시간을 조정하거나 프로그램을 재시작해 주세요.", "error")
-    
-    def _start_time_display(self, start_time):
-        """실시간 시간 표시 시작"""
-        self.time_display_start = start_time
-        self._update_time_display()
-    
-    def _update_time_display(self):
-        """실시간 시간 표시 업데이트"""
-        if self.time_display_start is None:
-            return
-        
-        import time
-        elapsed_time = time.time() - self.time_display_start
-        
-        # 초 단위로 표시 (소수점 1자리)
-        elapsed_seconds = elapsed_time
-        
-        # 로그에 실시간 시간 표시 (기존 로그 마지막 줄 업데이트)
-        self._thread_safe_log(f"   이메일 발송 중...⏱️ ({elapsed_seconds:.1f}초)", 'INFO', replace_last=True)
-        
-        # 0.5초마다 업데이트
-        self.time_display_timer = self.root.after(500, self._update_time_display)
-    
-    def _stop_time_display(self):
-        """실시간 시간 표시 정지"""
-        if self.time_display_timer:
-            self.root.after_cancel(self.time_display_timer)
-            self.time_display_timer = None
-        self.time_display_start = None
-    
-    def send_email_smtp(self, to_emails, subject, body, pdf_paths, smtp_server, smtp_port, sender_email, sender_password, retry_count=0):
-        """SMTP를 통한 이메일 발송 (연결 재사용, 재시도 포함)"""
-        self._thread_safe_log(f"   [DEBUG] send_email_smtp 시작", is_debug=True)
-        self._thread_safe_log(f"   [DEBUG] 수신자: {to_emails}", is_debug=True)
+    def send_email_smtp(self, to_emails, subject, body, pdf_paths, smtp_server, smtp_port, sender_email, sender_password,
+                        display_to=None, connection_state=None, timings=None, cancel_event=None,
+                        progress=None):
+        """SMTP를 통한 이메일 발송 (연결 재사용)
+
+        재시도는 호출하는 쪽의 RetryScheduler가 담당합니다.
+        to_emails는 실제로 보낼 수신자(봉투), display_to는 받는 사람 헤더에 표시할 전체 수신자입니다.
+        connection_state를 주지 않으면 기본 계정의 연결(self.connection_state)을 사용합니다.
+        timings(dict)를 주면 연결·전송 단계별 소요 시간을 기록합니다 (SMTP_PHASES 참고).
+        cancel_event가 설정되면 업로드 중이라도 멈추고 'cancelled' 상태를 반환합니다
+        (중지 요청이나 제한 시간 초과 시 발송 스레드가 설정).
+        progress는 업로드 진행 콜백 progress(보낸 바이트, 전체 바이트)입니다.
+
+        Returns:
+            dict: {'success': 모든 수신자 수락 여부,
+                   'status': 'sent', 'partial', 'transient', 'permanent', 'auth', 'cancelled',
+                             'unknown'(본문을 보낸 뒤 응답을 받지 못해 수신 여부를 모름) 중 하나,
+                   'retryable': 재시도 가치 여부, 'error': 오류 메시지, 'code': 응답 코드,
+                   'accepted': 수락된 주소 목록,
+                   'transient_refused' / 'permanent_refused': {주소: (응답 코드, 응답 메시지)},
+                   'duration': 전송 시간(초),
+                   'connection_error': 연결 자체가 실패했는지 (실패한 경우에만 있음)}
+        """
+        if connection_state is None:
+            connection_state = self.connection_state
+        if timings is None:
+            timings = {}
+        self._thread_safe_log(f"   [DEBUG] send_email_smtp 시작", is_debug=True, category='smtp')
+        self._thread_safe_log(f"   [DEBUG] 수신자: {to_emails}", is_debug=True, category='smtp')
         
-        # 파일 크기 체크 (Gmail 25MB 제한)
+        # 파일 크기 (최대 크기는 서버가 EHLO SIZE로 알린 값으로 전송 직전에 확인)
         total_size = sum(pdf_path.stat().st_size for pdf_path in pdf_paths)
-        max_size = 24 * 1024 * 1024  # 24MB (여유 있게)
-        
-        self._thread_safe_log(f"   [DEBUG] 첨부 파일 크기: {total_size / (1024*1024):.2f}MB", is_debug=True)
-        
-        if total_size > max_size:
-            size_mb = total_size / (1024 * 1024)
-            self._thread_safe_log(f"   ⚠ 첨부 파일 크기 초과: {size_mb:.1f}MB (제한: 25MB)", 'WARNING')
-            return False
+        self._thread_safe_log(f"   [DEBUG] 첨부 파일 크기: {total_size / (1024*1024):.2f}MB", is_debug=True, category='smtp')
         
         # 이메일 메시지 생성
-        self._thread_safe_log(f"   [DEBUG] 이메일 메시지 생성 중...", is_debug=True)
+        self._thread_safe_log(f"   [DEBUG] 이메일 메시지 생성 중...", is_debug=True, category='smtp')
         msg = MIMEMultipart()
         msg['From'] = sender_email
-        msg['To'] = ', '.join(to_emails)
+        msg['To'] = ', '.join(display_to or to_emails)
         msg['Subject'] = subject
         
         # 본문 첨부
         msg.attach(MIMEText(body, 'plain', 'utf-8'))
-        self._thread_safe_log(f"   [DEBUG] 본문 첨부 완료", is_debug=True)
+        self._thread_safe_log(f"   [DEBUG] 본문 첨부 완료", is_debug=True, category='smtp')
         
         # PDF 파일들 첨부
         for pdf_path in pdf_paths:
@@ -4055,147 +7814,179 @@ Q. 파일이 인식이 안 돼요?
                 pdf.add_header('Content-Disposition', 'attachment', 
                              filename=('utf-8', '', pdf_path.name))
                 msg.attach(pdf)
-            self._thread_safe_log(f"   [DEBUG] PDF 첨부: {pdf_path.name}", is_debug=True)
+            self._thread_safe_log(f"   [DEBUG] PDF 첨부: {pdf_path.name}", is_debug=True, category='smtp')
         
         # 발송 정보 로그
-        self._thread_safe_log(f"\n\n", is_debug=True)
-        self._thread_safe_log(f"   📤 메일 발송 중...")
-        self._thread_safe_log(f"   [DEBUG] ===== 발송 정보 =====", is_debug=True)
-        self._thread_safe_log(f"   [DEBUG] 발신: {sender_email}", is_debug=True)
-        self._thread_safe_log(f"   [DEBUG] 수신: {to_emails}", is_debug=True)
-        self._thread_safe_log(f"   [DEBUG] 제목: {subject}", is_debug=True)
-        self._thread_safe_log(f"   [DEBUG] 본문 미리보기: {body[:100]}...", is_debug=True)
-        self._thread_safe_log(f"   [DEBUG] 첨부 파일: {[p.name for p in pdf_paths]}", is_debug=True)
-        self._thread_safe_log(f"   [DEBUG] SMTP 서버: {smtp_server}:{smtp_port}", is_debug=True)
-        self._thread_safe_log(f"   [DEBUG] 메시지 크기: {len(msg.as_string())} bytes", is_debug=True)
-        self._thread_safe_log(f"   [DEBUG] ========================", is_debug=True)
+        self._thread_safe_log(f"\n\n", is_debug=True, category='smtp')
+        self._thread_safe_log(f"   📤 메일 발송 중...", category='smtp')
+        # 디버그 로그가 꺼져 있으면 메시지 전체 직렬화(as_string) 같은 준비 작업도 건너뜀
+        if self.logger.enabled('DEBUG', 'smtp'):
+            self._thread_safe_log(f"   [DEBUG] ===== 발송 정보 =====", is_debug=True, category='smtp')
+            self._thread_safe_log(f"   [DEBUG] 발신: {sender_email}", is_debug=True, category='smtp')
+            self._thread_safe_log(f"   [DEBUG] 수신: {to_emails}", is_debug=True, category='smtp')
+            self._thread_safe_log(f"   [DEBUG] 제목: {subject}", is_debug=True, category='smtp')
+            self._thread_safe_log(f"   [DEBUG] 본문 미리보기: {body[:100]}...", is_debug=True, category='smtp')
+            self._thread_safe_log(f"   [DEBUG] 첨부 파일: {[p.name for p in pdf_paths]}", is_debug=True, category='smtp')
+            self._thread_safe_log(f"   [DEBUG] SMTP 서버: {smtp_server}:{smtp_port}", is_debug=True, category='smtp')
+            self._thread_safe_log(f"   [DEBUG] 메시지 크기: {len(msg.as_string())} bytes", is_debug=True, category='smtp')
+            self._thread_safe_log(f"   [DEBUG] ========================", is_debug=True, category='smtp')
         
         # 메일 전송 시간 측정 시작
         import time
         start_time = time.time()
         
-        # 실시간 시간 표시를 위한 타이머 시작
-        self._start_time_display(start_time)
-        
         try:
             # 기존 연결 재사용 또는 새 연결 생성
-            if self.get_connection_state():
-                # 기존 연결 재사용
-                self._thread_safe_log(f"   [DEBUG] 기존 SMTP 연결 재사용...", is_debug=True)
-                server = self.connection_state['server_conn']
-            else:
-                # 새 연결 생성
-                self._thread_safe_log(f"   [DEBUG] 새 SMTP 연결 생성...", is_debug=True)
-                
-                # 포트에 따라 SSL/TLS 선택
-                if smtp_port == 465:
-                    # SSL 연결
-                    server = smtplib.SMTP_SSL(smtp_server, smtp_port, timeout=300)
+            # 재사용한 연결이 그사이 끊어져 있었다면 한 번만 다시 연결해서 보냄 (재시도 횟수에 포함 안 됨)
+            server_key = f"{smtp_server}:{smtp_port}"
+            refresh_after = self.idle_store.refresh_after(server_key)
+            for _ in range(2):
+                idle = connection_idle_time(connection_state)
+                if idle is not None and refresh_after is not None and idle >= refresh_after:
+                    # 서버 유휴 제한에 가까운 연결은 확인하지 않고 바로 교체
+                    self._thread_safe_log(
+                        f"   [DEBUG] {idle:.0f}초 쉰 연결은 곧 끊기므로 새로 연결합니다", is_debug=True, category='smtp')
+                    self.mark_connection_dead(connection_state)
+                    idle = None
+                reused = self.get_connection_state(connection_state)
+                if idle is not None and not reused:
+                    self.idle_store.record_drop(server_key, idle)
+                if reused:
+                    # 기존 연결 재사용 (이미 암호화·인증된 연결)
+                    self._thread_safe_log(f"   [DEBUG] 기존 SMTP 연결 재사용...", is_debug=True, category='smtp')
+                    server = connection_state['server_conn']
                 else:
-                    # TLS 연결
-                    server = smtplib.SMTP(smtp_server, smtp_port, timeout=300)
-            server.starttls()
+                    # 새 연결 생성
+                    self._thread_safe_log(f"   [DEBUG] 새 SMTP 연결 생성...", is_debug=True, category='smtp')
+                    server = open_smtp_connection(smtp_server, smtp_port, sender_email,
+                                                  sender_password, timeout=300, connect_timeout=30,
+                                                  timings=timings)
+                    self._thread_safe_log(f"   [DEBUG] SMTP 연결 성공", is_debug=True, category='smtp')
                 
-            server.login(sender_email, sender_password)
-            self._thread_safe_log(f"   [DEBUG] SMTP 연결 성공", is_debug=True)
-            
-            # 연결 정보 저장
-            self.connection_state['server_conn'] = server
-            self.connection_state['connected'] = True
-            self.connection_state['last_activity'] = time.time()
-            
-            # 메일 전송 실행
-            self._thread_safe_log(f"   [DEBUG] 메일을 보내는 중...", is_debug=True)
-            server.send_message(msg)
+                # 연결 정보 저장
+                connection_state['server_conn'] = server
+                connection_state['connected'] = True
+                connection_state['last_activity'] = time.time()
+                
+                # 메일 전송 실행 (일부 수신자만 거부되면 거부 목록이 반환됨)
+                self._thread_safe_log(f"   [DEBUG] 메일을 보내는 중...", is_debug=True, category='smtp')
+                try:
+                    refused = send_message_timed(server, msg, to_emails, timings, cancel_event, progress)
+                    if reused:
+                        self.idle_store.record_alive(server_key, idle)
+                    break
+                except Exception as e:
+                    if not (reused and is_connection_error(e)) or \
+                            (cancel_event is not None and cancel_event.is_set()):
+                        raise
+                    self.idle_store.record_drop(server_key, idle)
+                    self._thread_safe_log(
+                        f"   [DEBUG] 재사용한 연결이 끊어져 있어 다시 연결합니다: {e}", is_debug=True, category='smtp')
+                    self.mark_connection_dead(connection_state)
             
             # 전송 시간 계산 (초)
             end_time = time.time()
             send_duration_seconds = end_time - start_time
-            self._thread_safe_log(f"   [DEBUG] 메일 전송 성공 ({send_duration_seconds:.1f}초)", is_debug=True)
-            
-            # 실시간 시간 표시 타이머 정지
-            self._stop_time_display()
+            self._thread_safe_log(f"   [DEBUG] 메일 전송 성공 ({send_duration_seconds:.1f}초)", is_debug=True, category='smtp')
             
             # 마지막 활동 시간 업데이트
-            self.connection_state['last_activity'] = time.time()
+            connection_state['last_activity'] = time.time()
             
-            self._thread_safe_log(f"   ✅ 발송 완료! (전송시간: {send_duration_seconds:.1f}초)")
-            self._thread_safe_log(f"\n\n", is_debug=True)
-            return True
+            transient_refused, permanent_refused = split_refused_recipients(refused)
+            accepted = [email for email in to_emails if email not in refused]
             
-        except smtplib.SMTPAuthenticationError as e:
+            if refused:
+                self._thread_safe_log(
+                    f"   ⚠ 일부 수신자 거부: {len(accepted)}/{len(to_emails)}명 수신 "
+                    f"(전송시간: {send_duration_seconds:.1f}초)", 'WARNING', category='smtp')
+                self._log_refused_recipients(transient_refused, permanent_refused)
+                self._thread_safe_log(f"\n\n", is_debug=True, category='smtp')
+                return {'success': False, 'status': 'partial',
+                        'retryable': bool(transient_refused),
+                        'error': f"일부 수신자 거부 ({len(refused)}명)", 'code': None,
+                        'accepted': accepted,
+                        'transient_refused': transient_refused,
+                        'permanent_refused': permanent_refused,
+                        'duration': send_duration_seconds}
+            
+            self._thread_safe_log(f"   ✅ 발송 완료! (전송시간: {send_duration_seconds:.1f}초)", category='smtp')
+            self._thread_safe_log(f"\n\n", is_debug=True, category='smtp')
+            return {'success': True, 'status': 'sent', 'retryable': False,
+                    'error': None, 'code': None, 'accepted': accepted,
+                    'transient_refused': {}, 'permanent_refused': {},
+                    'duration': send_duration_seconds}
+            
+        except Exception as e:
             # 전송 시간 계산 (실패 시에도)
             end_time = time.time()
             send_duration_seconds = end_time - start_time
-            self._thread_safe_log(f"   ✗ 인증 실패: {e} (실패시간: {send_duration_seconds:.1f}초)", 'ERROR')
-            self._thread_safe_log(f"   💡 이메일 주소와 앱 비밀번호를 확인하세요.", 'ERROR')
-            self._thread_safe_log(f"\n\n", is_debug=True)
             
-            # 실시간 시간 표시 타이머 정지
-            self._stop_time_display()
+            if isinstance(e, DeliveryUnknownError):
+                # 서버가 이미 받았을 수 있으므로 다시 보내지 않음 (감시자가 응답 대기 중에 끊은 경우 포함)
+                self._thread_safe_log(
+                    f"   ⚠ 수신 여부 불명: {e} (전송시간: {send_duration_seconds:.1f}초)", 'WARNING', category='smtp')
+                self.mark_connection_dead(connection_state)
+                return {'success': False, 'status': 'unknown', 'retryable': False,
+                        'error': "메일을 보낸 뒤 서버 응답을 받지 못함 (수신 여부 불명)", 'code': None,
+                        'accepted': [], 'transient_refused': {}, 'permanent_refused': {},
+                        'duration': send_duration_seconds}
             
-            # 연결 실패 시 상태 업데이트
-            self.connection_state['connected'] = False
-            self.connection_state['server_conn'] = None
-            return False
+            if isinstance(e, SendCancelledError) or (cancel_event is not None and cancel_event.is_set()):
+                # 업로드 도중 멈춘(또는 감시자가 끊은) 연결은 다시 쓸 수 없음
+                self._thread_safe_log(f"   ⏹ 발송 중지됨 ({send_duration_seconds:.1f}초)", 'WARNING', category='smtp')
+                self.mark_connection_dead(connection_state)
+                return {'success': False, 'status': 'cancelled', 'retryable': False,
+                        'error': "사용자가 발송을 중지함", 'code': None, 'accepted': [],
+                        'transient_refused': {}, 'permanent_refused': {},
+                        'duration': send_duration_seconds}
             
-        except smtplib.SMTPException as e:
-            # SMTP 오류 시 재시도 (1번만)
-            if retry_count < 1:
-                retry_count += 1
-                self._thread_safe_log(f"   ✗ SMTP 오류 (시도 {retry_count}/2): {e}", 'ERROR')
-                self._thread_safe_log(f"   🔄 2초 후 재시도합니다...", 'WARNING')
-                self._thread_safe_log(f"\n\n", is_debug=True)
-                
-                # 2초 대기 후 재시도
-                import time
-                time.sleep(2)
-                return self.send_email_smtp(to_emails, subject, body, pdf_paths, smtp_server, smtp_port, sender_email, sender_password, retry_count)
-            else:
-                # 전송 시간 계산 (실패 시에도)
-                end_time = time.time()
-                send_duration_seconds = end_time - start_time
-                self._thread_safe_log(f"   ✗ SMTP 최종 실패: {e} (실패시간: {send_duration_seconds:.1f}초)", 'ERROR')
-                self._thread_safe_log(f"   [DEBUG] SMTPException 타입: {type(e).__name__}", is_debug=True)
-                self._thread_safe_log(f"\n\n", is_debug=True)
-                
-                # 실시간 시간 표시 타이머 정지
-                self._stop_time_display()
-                
-                # 연결 오류 시 상태 업데이트
-                self.connection_state['connected'] = False
-                self.connection_state['server_conn'] = None
-            return False
+            category, code = classify_smtp_error(e)
+            result = {'success': False, 'status': category,
+                      'retryable': category == 'transient', 'code': code,
+                      'accepted': [], 'transient_refused': {}, 'permanent_refused': {},
+                      'duration': send_duration_seconds,
+                      'connection_error': is_connection_error(e)}
             
-        except Exception as e:
-            # 일반 오류 시 재시도 (1번만)
-            if retry_count < 1:
-                retry_count += 1
-                self._thread_safe_log(f"   ✗ 발송 실패 (시도 {retry_count}/2): {e}", 'ERROR')
-                self._thread_safe_log(f"   🔄 2초 후 재시도합니다...", 'WARNING')
-                self._thread_safe_log(f"\n\n", is_debug=True)
-                
-                # 2초 대기 후 재시도
-                import time
-                time.sleep(2)
-                return self.send_email_smtp(to_emails, subject, body, pdf_paths, smtp_server, smtp_port, sender_email, sender_password, retry_count)
+            if isinstance(e, smtplib.SMTPRecipientsRefused):
+                # 모든 수신자가 거부됨 - 일시적으로 거부된 주소만 재시도 대상
+                transient_refused, permanent_refused = split_refused_recipients(e.recipients)
+                self._thread_safe_log(f"   ✗ 모든 수신자 거부 (실패시간: {send_duration_seconds:.1f}초)", 'ERROR', category='smtp')
+                self._log_refused_recipients(transient_refused, permanent_refused)
+                result['transient_refused'] = transient_refused
+                result['permanent_refused'] = permanent_refused
+                result['error'] = f"모든 수신자 거부 ({len(e.recipients)}명)"
+            elif isinstance(e, MessageTooLargeError):
+                size_mb = e.size / (1024 * 1024)
+                limit_mb = e.limit / (1024 * 1024)
+                self._thread_safe_log(f"   ⚠ 메시지 크기 초과: {size_mb:.1f}MB (서버 제한: {limit_mb:.1f}MB)", 'WARNING', category='smtp')
+                result['error'] = f"메시지 크기 초과 ({size_mb:.1f}MB, 서버 제한 {limit_mb:.1f}MB)"
+            elif category == 'auth':
+                self._thread_safe_log(f"   ✗ 인증 실패: {e} (실패시간: {send_duration_seconds:.1f}초)", 'ERROR', category='smtp')
+                self._thread_safe_log(f"   💡 이메일 주소와 앱 비밀번호를 확인하세요.", 'ERROR', category='smtp')
+                result['error'] = f"인증 실패: {e}"
             else:
-                # 전송 시간 계산 (실패 시에도)
-                end_time = time.time()
-                send_duration_seconds = end_time - start_time
-                self._thread_safe_log(f"   ✗ 발송 최종 실패: {e} (실패시간: {send_duration_seconds:.1f}초)", 'ERROR')
-                self._thread_safe_log(f"   [DEBUG] Exception 타입: {type(e).__name__}", is_debug=True)
-            import traceback
-            self._thread_safe_log(traceback.format_exc(), is_debug=True)
-            self._thread_safe_log(f"\n\n", is_debug=True)
-            
-            # 실시간 시간 표시 타이머 정지
-            self._stop_time_display()
+                kind = "일시적 오류" if category == 'transient' else "영구 오류"
+                code_text = f" [{code}]" if code else ""
+                self._thread_safe_log(f"   ✗ 발송 실패 ({kind}{code_text}): {e} (실패시간: {send_duration_seconds:.1f}초)", 'ERROR', category='smtp')
+                self._thread_safe_log(f"   [DEBUG] Exception 타입: {type(e).__name__}", is_debug=True, category='smtp')
+                if not isinstance(e, smtplib.SMTPException) and self.logger.enabled('DEBUG', 'smtp'):
+                    import traceback
+                    self._thread_safe_log(traceback.format_exc(), is_debug=True, category='smtp')
+                result['error'] = f"{kind}{code_text}: {e}"
+            self._thread_safe_log(f"\n\n", is_debug=True, category='smtp')
             
-            # 연결 오류 시 상태 업데이트
-            self.connection_state['connected'] = False
-            self.connection_state['server_conn'] = None
-            return False
+            # 연결이 끊겼거나 인증에 실패했을 때만 연결 폐기
+            # (응답 코드 오류는 같은 연결로 다음 메일을 계속 보낼 수 있음)
+            if category == 'auth' or is_connection_error(e):
+                self.mark_connection_dead(connection_state)
+            return result
+    
+    def _log_refused_recipients(self, transient_refused, permanent_refused):
+        """거부된 수신자 목록 로그 (작업 스레드용)"""
+        for email, (code, reply) in transient_refused.items():
+            self._thread_safe_log(f"      ⏸ {email}: 일시적 거부 [{code}] {reply}", 'WARNING', category='smtp')
+        for email, (code, reply) in permanent_refused.items():
+            self._thread_safe_log(f"      ⛔ {email}: 영구 거부 [{code}] {reply}", 'ERROR', category='smtp')
     
     def move_pdfs_to_completed(self, pdf_paths):
         """PDF 파일들을 전송완료 폴더로 이동"""
@@ -4214,64 +8005,128 @@ Q. 파일이 인식이 안 돼요?
                 # 파일 이동
                 import shutil
                 shutil.move(str(pdf_path), str(dest_path))
-                self._thread_safe_log(f"   → {dest_path.name} 이동 완료", is_debug=True)
+                self._thread_safe_log(f"   → {dest_path.name} 이동 완료", is_debug=True, category='fs')
                 
         except Exception as e:
-            self._thread_safe_log(f"   ⚠ 파일 이동 실패: {e}", 'WARNING')
+            self._thread_safe_log(f"   ⚠ 파일 이동 실패: {e}", 'WARNING', category='fs')
         
-    def log(self, message, level='INFO', is_debug=False):
+    def log(self, message, level='INFO', is_debug=False, category=None):
         """로그 추가
         
         Args:
             message: 로그 메시지
             level: 로그 레벨 (INFO, WARNING, ERROR 등)
-            is_debug: True이면 디버그 모드일 때만 표시
+            is_debug: True이면 디버그 레벨 (해당 카테고리가 DEBUG일 때만 표시)
+            category: 로그 분류 (LOG_CATEGORIES의 키, 없으면 일반 로그)
         """
-        # 디버그 로그는 디버그 모드가 켜져있을 때만 표시
-        if is_debug:
-            debug_mode = self.config_manager.get('debug_mode', False)
-            if not debug_mode:
-                return
-        
-        timestamp = datetime.now().strftime('%H:%M:%S')
-        self.log_text.insert(tk.END, f"[{timestamp}] {message}\n")
-        self.log_text.see(tk.END)
-        self.root.update()
+        self.logger.emit(message, level, category, is_debug)
     
-    def _thread_safe_log(self, message, level='INFO', is_debug=False, replace_last=False):
+    def _thread_safe_log(self, message, level='INFO', is_debug=False, category=None):
         """스레드 안전한 로그 추가 (별도 스레드에서 호출 가능)"""
-        # 디버그 로그는 디버그 모드가 켜져있을 때만 표시
-        if is_debug:
-            debug_mode = self.config_manager.get('debug_mode', False)
-            if not debug_mode:
-                return
-        
-        # 메인 스레드에서 실행되도록 스케줄링
-        self.root.after(0, self._add_log_to_gui, message, level, replace_last)
-    
-    def _add_log_to_gui(self, message, level, replace_last=False):
-        """GUI에 로그 추가 (메인 스레드에서만 호출)"""
-        timestamp = datetime.now().strftime('%H:%M:%S')
-        
-        if replace_last:
-            # 마지막 줄을 교체 (더 안전한 방법)
-            try:
-                # 마지막 줄이 "이메일 발송 중"으로 시작하는지 확인
-                last_line = self.log_text.get('end-2l', 'end-1l')
-                if '이메일 발송 중' in last_line:
-                    # 마지막 줄 삭제
-                    self.log_text.delete('end-2l', 'end-1l')
-                # 새 줄 추가
-                self.log_text.insert(tk.END, f"[{timestamp}] {message}\n")
-            except:
-                # 오류 시 그냥 새 줄 추가
-                self.log_text.insert(tk.END, f"[{timestamp}] {message}\n")
-        else:
-            # 새 줄 추가
-            self.log_text.insert(tk.END, f"[{timestamp}] {message}\n")
-        
+        # 화면 반영은 메인 스레드의 주기적인 flush_logs()에서
+        self.logger.emit(message, level, category, is_debug)
+
+    def _drain_log_queue(self):
+        """로그 대기열을 주기적으로 화면에 반영 (메인 스레드)"""
+        self.flush_logs()
+        self.root.after(LOG_FLUSH_INTERVAL_MS, self._drain_log_queue)
+
+    def flush_logs(self):
+        """대기 중인 로그를 화면에 한꺼번에 추가 (메인 스레드에서만 호출)
+
+        이어지는 줄은 한 번에 insert하고, 스크롤(see)은 한 번만 합니다.
+        한 번에 LOG_FLUSH_MAX_LINES줄까지만 반영하며, 반영한 줄 수를 반환합니다.
+        """
+        entries = []
+        try:
+            while len(entries) < LOG_FLUSH_MAX_LINES:
+                entries.append(self.log_queue.get_nowait())
+        except queue.Empty:
+            pass
+        if not entries:
+            return 0
+
+        text = ''.join(f"[{timestamp}] {message}\n" for timestamp, message, level in entries)
+        self.log_text.insert(tk.END, text)
+
+        # 최대 줄 수를 일정 이상 넘으면 오래된 줄을 한꺼번에 삭제 (매번 조금씩 지우지 않도록)
+        max_lines = max(LOG_MAX_LINES_MIN, int(self.config_manager.get('log_max_lines', 5000)))
+        line_count = int(self.log_text.index('end-1c').split('.')[0])
+        if line_count > max_lines + max_lines // 10:
+            self.log_text.delete('1.0', f'{line_count - max_lines + 1}.0')
+
         self.log_text.see(tk.END)
-        self.root.update()
+        if hasattr(self, 'log_history'):
+            self.log_history.append(text)
+        return len(entries)
+
+    def open_log_folder(self):
+        """로그 기록 폴더 열기"""
+        try:
+            folder = self.log_history.folder
+            folder.mkdir(parents=True, exist_ok=True)
+            open_folder_in_explorer(folder)
+        except Exception as e:
+            self._show_custom_message("오류", f"로그 폴더를 열 수 없습니다:\n{e}", "error")
+
+    def show_log_history(self):
+        """로그 검색 창 - 화면에서 지워진 줄을 포함한 전체 기록에서 검색"""
+        search_window = tk.Toplevel(self.root)
+        search_window.title("🔍 로그 검색")
+        search_window.geometry("760x500")
+        search_window.resizable(True, True)
+        search_window.transient(self.root)
+        center_window(search_window, self.root, 760, 500)
+
+        main_frame = ttk.Frame(search_window, padding="15")
+        main_frame.pack(fill=tk.BOTH, expand=True)
+
+        search_frame = ttk.Frame(main_frame)
+        search_frame.pack(fill=tk.X, pady=(0, 10))
+        ttk.Label(search_frame, text="검색어:").pack(side=tk.LEFT)
+        keyword_var = tk.StringVar()
+        keyword_entry = ttk.Entry(search_frame, textvariable=keyword_var, width=40)
+        keyword_entry.pack(side=tk.LEFT, padx=5, fill=tk.X, expand=True)
+        search_button = ttk.Button(search_frame, text="검색")
+        search_button.pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Button(search_frame, text="📂 로그 폴더", command=self.open_log_folder).pack(side=tk.LEFT)
+
+        info_label = ttk.Label(main_frame, foreground='gray',
+                               text=f"보관 기간: 최근 {self.log_history.keep_days}일 (최근 기록부터 표시)")
+        info_label.pack(anchor=tk.W, pady=(0, 5))
+
+        result_text = scrolledtext.ScrolledText(
+            main_frame, wrap=tk.WORD, font=('Consolas', 9), state='disabled')
+        result_text.pack(fill=tk.BOTH, expand=True)
+
+        def show_results(keyword, results, truncated):
+            if not search_window.winfo_exists():
+                return
+            search_button.config(state='normal')
+            result_text.config(state='normal')
+            result_text.delete('1.0', tk.END)
+            result_text.insert('1.0', ''.join(f"{day} {line}\n" for day, line in results))
+            result_text.config(state='disabled')
+            more = f" (최근 {LOG_SEARCH_MAX_RESULTS}건만 표시)" if truncated else ""
+            info_label.config(text=f"'{keyword}' 검색 결과: {len(results)}건{more}")
+
+        def search(event=None):
+            keyword = keyword_var.get().strip()
+            if not keyword:
+                return
+            self.flush_logs()  # 아직 파일에 쓰지 않은 로그까지 포함
+            search_button.config(state='disabled')
+            info_label.config(text="검색 중...")
+
+            # 기록 파일이 클 수 있으므로 별도 스레드에서 읽음
+            def worker():
+                results, truncated = self.log_history.search(keyword)
+                self.root.after(0, show_results, keyword, results, truncated)
+            threading.Thread(target=worker, daemon=True).start()
+
+        search_button.config(command=search)
+        keyword_entry.bind('<Return>', search)
+        keyword_entry.focus_set()
     
     def set_status(self, message, color='blue'):
         """상태 업데이트"""
@@ -4280,78 +8135,135 @@ Q. 파일이 인식이 안 돼요?
     def set_email_status(self, message, color='blue'):
         """이메일 연결 상태 업데이트"""
         self.email_status_label.config(text=message, foreground=color)
+
+    def set_concurrency_status(self, level=None, max_level=None):
+        """동시 발송 수 표시 업데이트 (level이 None이면 발송 중 아님)"""
+        if level is None:
+            self.concurrency_label.config(text="-", foreground='gray')
+        else:
+            self.concurrency_label.config(text=f"{level}/{max_level}", foreground='blue')
+
+    def set_eta_status(self, seconds=None):
+        """남은 예상 시간 표시 업데이트 (seconds가 None이면 발송 중 아님)"""
+        if seconds is None:
+            self.eta_label.config(text="-", foreground='gray')
+        else:
+            self.eta_label.config(text=format_duration(seconds), foreground='blue')
+
+    def _start_progress_display(self):
+        """발송 진행 표시 시작 (메인 스레드)"""
+        self._stop_progress_display()
+        self.progress_rate_samples.clear()
+        self.progress_frame.grid()
+        self._refresh_progress()
+
+    def _refresh_progress(self):
+        """카운터 스냅샷으로 진행 표시를 다시 그림 (PROGRESS_FRAME_MS마다)"""
+        self._draw_progress(self.send_progress.snapshot())
+        self.progress_timer = self.root.after(PROGRESS_FRAME_MS, self._refresh_progress)
+
+    def _stop_progress_display(self):
+        """주기적인 갱신을 멈추고 마지막 상태를 그림 (패널은 다음 발송 전까지 남김)"""
+        if self.progress_timer is not None:
+            self.root.after_cancel(self.progress_timer)
+            self.progress_timer = None
+            self._draw_progress(self.send_progress.snapshot())
+
+    def _draw_progress(self, snap):
+        """진행 표시 갱신 (전체 진행률, 업로드 속도, 남은 시간, 업로드 중인 메일)"""
+        # 업로드 속도: 최근 PROGRESS_RATE_WINDOW초 동안 올린 바이트
+        samples = self.progress_rate_samples
+        samples.append((snap['now'], snap['uploaded']))
+        while len(samples) > 2 and snap['now'] - samples[1][0] >= PROGRESS_RATE_WINDOW:
+            samples.popleft()
+        span = samples[-1][0] - samples[0][0]
+        rate = (samples[-1][1] - samples[0][1]) / span if span > 0 else 0.0
+
+        active = snap['active']
+        in_flight = sum(min(entry['sent'], entry['size']) for entry in active)
+        if snap['total_bytes']:
+            fraction = min(1.0, (snap['done_bytes'] + in_flight) / snap['total_bytes'])
+        else:
+            fraction = 1.0 if snap['finished'] else 0.0
+        self.batch_progress_bar['value'] = fraction * 1000
+
+        done = snap['sent'] + snap['failed']
+        parts = [f"메일 {done}/{snap['total']}건"]
+        if snap['failed']:
+            parts[0] += f" (실패 {snap['failed']}건)"
+        if snap['finished'] and done < snap['total']:
+            parts.append(f"미발송 {snap['total'] - done}건")
+        parts.append(f"{format_file_size(snap['done_bytes'] + in_flight)} / {format_file_size(snap['total_bytes'])}")
+        if not snap['finished']:
+            parts.append(f"{format_file_size(rate)}/s")
+            if snap['eta'] is not None:
+                parts.append(f"남은 시간 {format_duration(snap['eta'])}")
+        parts.append(f"경과 {format_duration(snap['elapsed']).replace('약 ', '')}")
+        self.batch_progress_label.config(text="  ·  ".join(parts))
+        self.set_eta_status(None if snap['finished'] else snap['eta'])
+
+        # 업로드 중인 메일별 진행
+        rows = self.message_progress_rows
+        while len(rows) < len(active):
+            row = len(rows)
+            name_label = ttk.Label(self.message_progress_frame, width=20)
+            bar = ttk.Progressbar(self.message_progress_frame, mode='determinate', maximum=1000)
+            info_label = ttk.Label(self.message_progress_frame, foreground='gray')
+            name_label.grid(row=row, column=0, sticky=tk.W, pady=(5, 0))
+            bar.grid(row=row, column=1, sticky=(tk.W, tk.E), padx=5, pady=(5, 0))
+            info_label.grid(row=row, column=2, sticky=tk.W, pady=(5, 0))
+            rows.append((name_label, bar, info_label))
+        for index, (name_label, bar, info_label) in enumerate(rows):
+            if index >= len(active):
+                for widget in (name_label, bar, info_label):
+                    widget.grid_remove()
+                continue
+            entry = active[index]
+            sent = min(entry['sent'], entry['size'])
+            name_label.config(text=entry['company'])
+            bar['value'] = sent / entry['size'] * 1000 if entry['size'] else 0
+            info_label.config(
+                text=f"{format_file_size(sent)} / {format_file_size(entry['size'])}  "
+                     f"{snap['now'] - entry['started']:.1f}초")
+            for widget in (name_label, bar, info_label):
+                widget.grid()
     
-    def get_connection_state(self):
-        """연결 상태 확인"""
-        if not self.connection_state['connected'] or not self.connection_state['server_conn']:
-            return False
-        
-        try:
-            # 연결 상태 테스트
-            self.connection_state['server_conn'].noop()
-            return True
-        except:
-            # 연결이 끊어진 경우 상태 초기화
-            self.connection_state['connected'] = False
-            self.connection_state['server_conn'] = None
-            self.connection_state['last_activity'] = None
-            return False
+    def get_connection_state(self, state=None):
+        """연결 상태 확인 (state를 주지 않으면 기본 계정 연결)
+
+        최근에 사용한 연결은 NOOP 없이 정상으로 봅니다.
+        그사이 끊어졌다면 발송할 때 오류로 알게 되고, 그때 다시 연결합니다.
+        네트워크를 기다릴 수 있으므로 발송 스레드에서만 호출합니다.
+        """
+        if state is None:
+            state = self.connection_state
+        return is_connection_alive(
+            state, self.config_manager.get('connection_trust_window', 30))
+
+    def mark_connection_dead(self, state):
+        """끊어진 연결 정리 (상태 초기화)"""
+        close_connection_state(state)
     
     def update_connection_status(self):
-        """연결 상태 업데이트"""
-        if self.get_connection_state():
+        """연결 상태 업데이트 (마지막으로 알려진 상태 표시)"""
+        if self.connection_state['connected']:
             self.set_email_status("연결됨", 'green')
         else:
             self.set_email_status("연결 안됨", 'red')
     
     def disconnect_smtp(self):
-        """SMTP 연결 종료"""
-        if self.connection_state['server_conn']:
-            try:
-                self.connection_state['server_conn'].quit()
-            except:
-                pass
-        
-        # 상태 초기화
-        self.connection_state['server_conn'] = None
-        self.connection_state['connected'] = False
-        self.connection_state['last_activity'] = None
-        
-        # 타이머 정지
-        if self.connection_state['check_timer']:
-            self.root.after_cancel(self.connection_state['check_timer'])
-            self.connection_state['check_timer'] = None
-        
-        self.update_connection_status()
+        """SMTP 연결 종료 (백그라운드에서 처리)"""
+        self.connection_manager.disconnect()
     
     def start_connection_monitor(self):
-        """연결 상태 모니터링 시작 (1분마다 확인)"""
-        if self.connection_state['check_timer']:
-            self.root.after_cancel(self.connection_state['check_timer'])
-        
-        self.connection_state['check_timer'] = self.root.after(60000, self.check_connection_status)  # 60초 = 1분
+        """연결 상태 모니터링 시작 (1분마다 확인, 발송 중에는 발송이 끝난 뒤)"""
+        if self.sending:
+            return
+        self.connection_manager.resume()
     
     def stop_connection_monitor(self):
         """연결 상태 모니터링 중지"""
-        if self.connection_state['check_timer']:
-            self.root.after_cancel(self.connection_state['check_timer'])
-            self.connection_state['check_timer'] = None
-    
-    def check_connection_status(self):
-        """연결 상태 확인"""
-        if self.get_connection_state():
-            self.log("🔍 연결 상태 확인: 정상", is_debug=True)
-            # 다음 확인 예약
-            self.start_connection_monitor()
-        else:
-            # 연결이 끊어진 경우
-            self.log("⚠️ 연결이 끊어짐을 감지했습니다. 재연결을 시도합니다.", 'WARNING')
-            self.update_connection_status()
-            self.set_status("연결 끊어짐 ⚠️", 'orange')
-            # 모니터링 중지 (재연결 시도 중)
-            self.stop_connection_monitor()
-            # 재연결 시도
-            self.check_and_connect_email()
+        self.connection_manager.pause()
     
     def reset_email_settings(self):
         """이메일 설정 초기화"""
@@ -4414,13 +8326,13 @@ Q. 파일이 인식이 안 돼요?
         self.config_manager.set('pattern', '^([가-힣A-Za-z0-9\\s]+?)(?:___|\.pdf$)')
         self.config_manager.set('auto_select_timeout', 10)
         self.config_manager.set('auto_send_timeout', 10)
-        self.config_manager.set('email_send_timeout', 180)
+        self.config_manager.set('message_deadline_base', 60)
         
         # UI 업데이트
         self.pattern_var.set('^([가-힣A-Za-z0-9\\s]+?)(?:___|\.pdf$)')
         self.auto_select_var.set('10')
         self.auto_send_var.set('10')
-        self.email_send_timeout_var.set('180')
+        self.message_deadline_base_var.set('60')
         
         self._show_custom_message("초기화 완료", "고급 설정이 초기화되었습니다.", "success")
 
@@ -4473,6 +8385,9 @@ def main():
 
 
 if __name__ == "__main__":
+    # 실행 파일로 패키징했을 때 렌더링용 하위 프로세스가 GUI를 다시 띄우지 않도록
+    multiprocessing.freeze_support()
+
     # 배치 파일에서 호출될 때만 실행
     if len(sys.argv) > 1 and sys.argv[1] == "--get-main-name":
         print(get_main_name())
@@ -0,0 +1,70 @@
+"""CircuitBreaker 상태 전환 테스트 (closed -> open -> half-open -> closed/open)"""
+import sys
+import time
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pdf_email_sender_gui as app  # noqa: E402
+
+
+class CircuitBreakerTest(unittest.TestCase):
+
+    def _open_breaker(self, **kwargs):
+        breaker = app.CircuitBreaker('smtp.example.com', failure_threshold=2, **kwargs)
+        self.assertFalse(breaker.record_failure())
+        self.assertTrue(breaker.record_failure())
+        return breaker
+
+    def _probe_now(self, breaker):
+        breaker.next_probe = time.monotonic()  # 시험 발송 시각이 됨
+
+    def test_opens_after_consecutive_failures(self):
+        breaker = self._open_breaker(probe_interval=30)
+        self.assertEqual(breaker.state, breaker.OPEN)
+        self.assertFalse(breaker.available())
+        self.assertGreater(breaker.retry_in(), 25)
+        self.assertGreaterEqual(breaker.outage_duration(), 0.0)
+
+    def test_success_resets_failure_count(self):
+        breaker = app.CircuitBreaker('smtp.example.com', failure_threshold=2)
+        breaker.record_failure()
+        self.assertFalse(breaker.record_success())  # 닫힌 상태였으므로 '복구'가 아님
+        self.assertFalse(breaker.record_failure())
+        self.assertEqual(breaker.state, breaker.CLOSED)
+
+    def test_half_open_probe_success_closes(self):
+        breaker = self._open_breaker()
+        self._probe_now(breaker)
+        self.assertTrue(breaker.available())
+        self.assertTrue(breaker.start_call())   # 이번 발송이 시험 발송
+        self.assertEqual(breaker.state, breaker.HALF_OPEN)
+        self.assertFalse(breaker.available())   # 시험 발송 중에는 다른 발송을 보내지 않음
+        self.assertEqual(breaker.retry_in(), 1.0)
+
+        self.assertTrue(breaker.record_success())
+        self.assertEqual(breaker.state, breaker.CLOSED)
+        self.assertEqual(breaker.outage_duration(), 0.0)
+        self.assertFalse(breaker.start_call())
+
+    def test_half_open_probe_failure_doubles_interval(self):
+        breaker = self._open_breaker(probe_interval=10, probe_max=25)
+        for expected in (20, 25, 25):
+            self._probe_now(breaker)
+            breaker.start_call()
+            self.assertTrue(breaker.record_failure())
+            self.assertEqual(breaker.state, breaker.OPEN)
+            self.assertEqual(breaker.probe_interval, expected)
+
+    def test_cancelled_probe_reopens_immediately(self):
+        breaker = self._open_breaker(probe_interval=60)
+        self._probe_now(breaker)
+        breaker.start_call()
+        breaker.cancel_probe()  # 서버에 닿지 못함 (발송 한도 초과 등)
+        self.assertEqual(breaker.state, breaker.OPEN)
+        self.assertTrue(breaker.available())
+
+
+if __name__ == '__main__':
+    unittest.main()
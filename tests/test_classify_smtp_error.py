@@ -0,0 +1,55 @@
+"""classify_smtp_error / is_connection_error 테스트"""
+import smtplib
+import socket
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pdf_email_sender_gui as app  # noqa: E402
+
+
+class ClassifySmtpErrorTest(unittest.TestCase):
+
+    def test_authentication_error(self):
+        error = smtplib.SMTPAuthenticationError(535, b"bad credentials")
+        self.assertEqual(app.classify_smtp_error(error), ('auth', 535))
+
+    def test_connection_errors_are_transient(self):
+        self.assertEqual(app.classify_smtp_error(smtplib.SMTPServerDisconnected("closed")),
+                         ('transient', None))
+        self.assertEqual(app.classify_smtp_error(socket.timeout("timed out")), ('transient', None))
+        self.assertEqual(app.classify_smtp_error(ConnectionResetError()), ('transient', None))
+        self.assertEqual(app.classify_smtp_error(smtplib.SMTPDataError(421, b"closing")),
+                         ('transient', 421))
+
+    def test_reply_codes(self):
+        self.assertEqual(app.classify_smtp_error(smtplib.SMTPDataError(451, b"try later")),
+                         ('transient', 451))
+        self.assertEqual(app.classify_smtp_error(smtplib.SMTPDataError(554, b"rejected")),
+                         ('permanent', 554))
+        self.assertEqual(app.classify_smtp_error(smtplib.SMTPSenderRefused(553, b"no", 'me@x')),
+                         ('permanent', 553))
+
+    def test_recipients_refused(self):
+        mixed = smtplib.SMTPRecipientsRefused({'a@x': (450, b"busy"), 'b@x': (550, b"unknown")})
+        self.assertEqual(app.classify_smtp_error(mixed)[0], 'transient')
+        permanent = smtplib.SMTPRecipientsRefused({'b@x': (550, b"unknown")})
+        self.assertEqual(app.classify_smtp_error(permanent), ('permanent', 550))
+
+    def test_other_errors_are_permanent(self):
+        self.assertEqual(app.classify_smtp_error(smtplib.SMTPNotSupportedError()), ('permanent', None))
+        self.assertEqual(app.classify_smtp_error(ValueError("bad")), ('permanent', None))
+        self.assertEqual(app.classify_smtp_error(app.MessageTooLargeError(2048, 1024)),
+                         ('permanent', 552))
+
+    def test_split_refused_recipients(self):
+        transient, permanent = app.split_refused_recipients(
+            {'a@x': (452, b"full"), 'b@x': (550, b"unknown")})
+        self.assertEqual(transient, {'a@x': (452, "full")})
+        self.assertEqual(permanent, {'b@x': (550, "unknown")})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+"""ConnectionManager 연결 상태 확인 테스트
+
+유휴 시간 학습(IdleTimeoutStore)은 NOOP으로 실제 확인한 결과만 반영해야 합니다.
+"""
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pdf_email_sender_gui as app  # noqa: E402
+
+
+class _Config:
+    def __init__(self, values):
+        self.values = values
+
+    def get(self, key, default=None):
+        return self.values.get(key, default)
+
+
+class ConnectionManagerCheckTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.idle_store = app.IdleTimeoutStore(Path(self.tmp.name) / 'idle.json')
+        # 서버 유휴 제한이 40초라고 이미 학습함
+        self.idle_store.record_drop('smtp.example.com:587', 40)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _manager(self, trust_window, idle):
+        server = mock.Mock()
+        state = {'server_conn': server, 'connected': True,
+                 'last_activity': time.time() - idle}
+        config = _Config({'email.smtp_server': 'smtp.example.com', 'email.smtp_port': 587,
+                          'connection_trust_window': trust_window})
+        return app.ConnectionManager(config, state, self.idle_store), server
+
+    def test_trusted_connection_is_not_learned(self):
+        # 신뢰 구간(60초) 안이라 NOOP을 보내지 않음 - 45초를 버텼다고 기록하면 안 됨
+        manager, server = self._manager(trust_window=60, idle=45)
+
+        manager._check()
+
+        server.noop.assert_not_called()
+        self.assertEqual(self.idle_store.state['smtp.example.com:587'],
+                         {'survived': 0, 'dropped': 40})
+
+    def test_noop_checked_connection_is_learned(self):
+        manager, server = self._manager(trust_window=0, idle=45)
+
+        manager._check()
+
+        server.noop.assert_called_once()
+        entry = self.idle_store.state['smtp.example.com:587']
+        self.assertEqual(entry['survived'], 45)
+        self.assertIsNone(entry['dropped'])
+
+
+if __name__ == '__main__':
+    unittest.main()
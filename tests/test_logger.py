@@ -0,0 +1,49 @@
+"""Logger 카테고리별 레벨 필터 테스트"""
+import queue
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pdf_email_sender_gui as app  # noqa: E402
+
+
+class _Config:
+    def __init__(self, values):
+        self.values = values
+
+    def get(self, key, default=None):
+        return self.values.get(key, default)
+
+
+class LoggerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.sink = queue.Queue()
+        self.logger = app.Logger(self.sink)
+        self.logger.configure(_Config({'debug_mode': False, 'log_level_smtp': 'DEBUG',
+                                       'log_level_fs': 'WARNING'}))
+
+    def _messages(self):
+        messages = []
+        while not self.sink.empty():
+            messages.append(self.sink.get_nowait()[1])
+        return messages
+
+    def test_emit_applies_category_level(self):
+        self.assertTrue(self.logger.emit("smtp debug", 'INFO', 'smtp', is_debug=True))
+        self.assertFalse(self.logger.emit("fs info", 'INFO', 'fs'))
+        self.assertTrue(self.logger.emit("fs warning", 'WARNING', 'fs'))
+        self.assertFalse(self.logger.emit("general debug", 'INFO', is_debug=True))
+        self.assertTrue(self.logger.emit("general info", 'INFO'))
+
+        self.assertEqual(self._messages(), ["smtp debug", "fs warning", "general info"])
+
+    def test_unset_category_follows_debug_mode(self):
+        self.logger.configure(_Config({'debug_mode': True}))
+        self.assertTrue(self.logger.emit("scan debug", 'INFO', 'scan', is_debug=True))
+
+
+if __name__ == '__main__':
+    unittest.main()
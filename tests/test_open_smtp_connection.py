@@ -0,0 +1,81 @@
+"""open_smtp_connection STARTTLS 회귀 테스트
+
+로컬 SMTP 스텁이 STARTTLS를 광고하면, TLS로 감쌀 때 서버 이름이 전달되는지 확인합니다.
+(호스트 없이 만든 smtplib.SMTP는 서버 이름을 몰라 check_hostname 컨텍스트에서 ValueError)
+연결 단계별 시간(DNS 조회, TCP 연결, 서버 인사)이 기록되는지도 함께 확인합니다.
+"""
+import socket
+import ssl
+import sys
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pdf_email_sender_gui as app  # noqa: E402
+
+
+class _StopHandshake(Exception):
+    """TLS handshake 직전에 테스트를 끝내기 위한 예외"""
+
+
+class _RecordingContext:
+    """wrap_socket에 넘어온 server_hostname을 기록하는 SSLContext 대리 객체"""
+
+    def __init__(self):
+        self.real = ssl.create_default_context()  # check_hostname=True
+        self.server_hostname = None
+
+    def wrap_socket(self, sock, server_hostname=None, **kwargs):
+        self.server_hostname = server_hostname
+        if self.real.check_hostname and not server_hostname:
+            raise ValueError("check_hostname requires server_hostname")
+        raise _StopHandshake()
+
+
+def _serve_starttls(listener):
+    """인사, EHLO(STARTTLS 광고), STARTTLS 수락까지만 응답하는 SMTP 스텁"""
+    conn, _ = listener.accept()
+    with conn, conn.makefile('rb') as reader:
+        conn.sendall(b"220 stub ESMTP\r\n")
+        for line in reader:
+            command = line.strip().upper()
+            if command.startswith(b"EHLO"):
+                conn.sendall(b"250-stub\r\n250 STARTTLS\r\n")
+            elif command == b"STARTTLS":
+                conn.sendall(b"220 ready to start TLS\r\n")
+                return
+            else:
+                conn.sendall(b"502 not implemented\r\n")
+
+
+class OpenSmtpConnectionStartTLSTest(unittest.TestCase):
+
+    def test_starttls_passes_server_hostname(self):
+        listener = socket.socket()
+        listener.bind(('127.0.0.1', 0))
+        listener.listen(1)
+        port = listener.getsockname()[1]
+        thread = threading.Thread(target=_serve_starttls, args=(listener,), daemon=True)
+        thread.start()
+
+        context = _RecordingContext()
+        timings = {}
+        try:
+            with mock.patch.object(app, 'get_ssl_context', return_value=context):
+                with self.assertRaises(_StopHandshake):
+                    app.open_smtp_connection('127.0.0.1', port, 'me@example.com', 'pw',
+                                             timeout=5, timings=timings)
+        finally:
+            thread.join(5)
+            listener.close()
+
+        self.assertEqual(context.server_hostname, '127.0.0.1')
+        for phase in ('resolve', 'connect', 'greeting', 'ehlo'):
+            self.assertIn(phase, timings)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+"""RetryScheduler 테스트 (지수 백오프, 실행 가능한 작업의 순서)"""
+import sys
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pdf_email_sender_gui as app  # noqa: E402
+
+
+def _job(name, index=0, attempt=0, size=0):
+    return {'company': name, 'index': index, 'attempt': attempt, 'message_size': size}
+
+
+class RetrySchedulerBackoffTest(unittest.TestCase):
+
+    def test_backoff_doubles_up_to_max(self):
+        scheduler = app.RetryScheduler(backoff_base=2.0, backoff_max=10.0)
+        # 지터는 절반~전체 범위 - 상한값(uniform의 b)만 확인
+        with mock.patch.object(app.random, 'uniform', side_effect=lambda a, b: b):
+            self.assertEqual([scheduler.backoff_delay(n) for n in range(1, 6)],
+                             [2.0, 4.0, 8.0, 10.0, 10.0])
+        with mock.patch.object(app.random, 'uniform', side_effect=lambda a, b: a):
+            self.assertEqual(scheduler.backoff_delay(3), 4.0)
+
+    def test_reschedule_stops_at_max_attempts(self):
+        scheduler = app.RetryScheduler(max_attempts=3, backoff_base=0.0)
+        self.assertEqual(scheduler.reschedule(_job('A', attempt=2)), 0.0)
+        self.assertIsNone(scheduler.reschedule(_job('B', attempt=3)))
+        self.assertEqual(len(scheduler), 1)
+
+
+class RetrySchedulerOrderTest(unittest.TestCase):
+
+    def test_ready_jobs_follow_order_key(self):
+        scheduler = app.RetryScheduler(order_key=lambda job: (job['message_size'], job['index']))
+        for index, size in enumerate([300, 100, 200]):
+            scheduler.push(_job(f"회사{index}", index, size=size))
+
+        popped = [scheduler.pop_ready()['message_size'] for _ in range(3)]
+        self.assertEqual(popped, [100, 200, 300])
+        self.assertIsNone(scheduler.pop_ready())
+
+    def test_insertion_order_without_order_key(self):
+        scheduler = app.RetryScheduler()
+        for name in ('A', 'B', 'C'):
+            scheduler.push(_job(name))
+        self.assertEqual([scheduler.pop_ready()['company'] for _ in range(3)], ['A', 'B', 'C'])
+
+    def test_delayed_job_waits_until_due(self):
+        scheduler = app.RetryScheduler(order_key=lambda job: job['index'])
+        scheduler.push(_job('늦음', index=0), delay=0.2)
+        scheduler.push(_job('바로', index=1))
+
+        # 순서 키가 앞서도 아직 실행 시각이 안 된 작업은 꺼내지 않음
+        self.assertEqual(scheduler.pop_ready()['company'], '바로')
+        self.assertIsNone(scheduler.pop_ready())
+        self.assertGreater(scheduler.next_ready_in(), 0.0)
+        time.sleep(0.25)
+        self.assertEqual(scheduler.next_ready_in(), 0.0)
+        self.assertEqual(scheduler.pop_ready()['company'], '늦음')
+        self.assertIsNone(scheduler.next_ready_in())
+
+    def test_pending_jobs_and_drain_list_ready_first(self):
+        scheduler = app.RetryScheduler(order_key=lambda job: job['index'])
+        scheduler.push(_job('재시도', index=0), delay=60)
+        scheduler.push(_job('B', index=2))
+        scheduler.push(_job('A', index=1))
+
+        self.assertEqual([job['company'] for job in scheduler.pending_jobs()], ['A', 'B', '재시도'])
+        self.assertEqual([job['company'] for job in scheduler.drain()], ['A', 'B', '재시도'])
+        self.assertEqual(len(scheduler), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
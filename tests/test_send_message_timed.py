@@ -0,0 +1,175 @@
+"""send_message_timed 테스트
+
+로컬 SMTP 스텁 서버를 상대로 실제 smtplib.SMTP 연결을 사용합니다.
+"""
+import smtplib
+import socket
+import sys
+import threading
+import unittest
+from email.mime.text import MIMEText
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pdf_email_sender_gui as app  # noqa: E402
+
+
+class _StubSMTPServer:
+    """한 연결만 받아 응답하는 SMTP 스텁
+
+    extensions: EHLO에 알릴 확장 목록 (예: ['SIZE 1000', 'PIPELINING'])
+    after_data: 본문('.')을 받은 뒤 동작 - 'ok'(250 응답) 또는 'drop'(응답 없이 연결 종료)
+    refuse: 550으로 거부할 수신자 주소
+    commands: 받은 명령 목록
+    PIPELINING을 알리면 MAIL/RCPT 응답을 DATA를 받을 때까지 미뤘다가 한꺼번에 보냅니다
+    (클라이언트가 응답을 기다리며 명령을 하나씩 보내면 시간 초과로 실패).
+    """
+
+    def __init__(self, extensions=(), after_data='ok', refuse=()):
+        self.extensions = list(extensions)
+        self.after_data = after_data
+        self.refuse = set(refuse)
+        self.commands = []
+        self.message = None
+        self.listener = socket.socket()
+        self.listener.bind(('127.0.0.1', 0))
+        self.listener.listen(1)
+        self.port = self.listener.getsockname()[1]
+        self.thread = threading.Thread(target=self._serve, daemon=True)
+        self.thread.start()
+
+    def close(self):
+        self.thread.join(5)
+        self.listener.close()
+
+    def _serve(self):
+        conn, _ = self.listener.accept()
+        with conn, conn.makefile('rb') as reader:
+            conn.sendall(b"220 stub ESMTP\r\n")
+            pipelining = 'PIPELINING' in self.extensions
+            held = []  # 파이프라이닝으로 미룬 응답
+            for line in reader:
+                command = line.strip().decode('ascii')
+                self.commands.append(command)
+                verb = command.split(' ', 1)[0].upper()
+                if verb == 'EHLO':
+                    lines = ['stub'] + self.extensions
+                    reply = ''.join(f"250{'-' if i < len(lines) - 1 else ' '}{text}\r\n"
+                                    for i, text in enumerate(lines))
+                    conn.sendall(reply.encode('ascii'))
+                elif verb in ('MAIL', 'RCPT'):
+                    address = command.split(':', 1)[1].split(' ')[0].strip('<>')
+                    reply = b"550 no such user\r\n" if address in self.refuse else b"250 ok\r\n"
+                    if pipelining:
+                        held.append(reply)
+                    else:
+                        conn.sendall(reply)
+                elif verb == 'DATA':
+                    conn.sendall(b''.join(held) + b"354 go ahead\r\n")
+                    held.clear()
+                    body = []
+                    for data_line in reader:
+                        if data_line == b".\r\n":
+                            break
+                        body.append(data_line)
+                    else:
+                        return  # '.' 없이 연결이 끊김 - 메일로 받지 않음
+                    self.message = b''.join(body)
+                    if self.after_data == 'drop':
+                        return
+                    conn.sendall(b"250 queued\r\n")
+                elif verb == 'QUIT':
+                    conn.sendall(b"221 bye\r\n")
+                    return
+                else:
+                    conn.sendall(b"250 ok\r\n")
+
+
+def _message(body='hello'):
+    msg = MIMEText(body, 'plain', 'utf-8')
+    msg['From'] = 'me@example.com'
+    msg['To'] = 'you@example.com'
+    msg['Subject'] = 'test'
+    return msg
+
+
+class SendMessageTimedTest(unittest.TestCase):
+
+    def _connect(self, stub):
+        self.addCleanup(stub.close)
+        server = smtplib.SMTP('127.0.0.1', stub.port, timeout=5)
+        self.addCleanup(server.close)
+        return server
+
+    def test_sends_message_and_records_timings(self):
+        stub = _StubSMTPServer()
+        server = self._connect(stub)
+        timings = {}
+
+        refused = app.send_message_timed(server, _message(), ['you@example.com'], timings)
+
+        self.assertEqual(refused, {})
+        self.assertTrue(timings['data_done'])
+        self.assertIn('final', timings)
+        self.assertIn(b'Subject: test', stub.message)
+
+    def test_lost_final_reply_is_delivery_unknown(self):
+        # '.'까지 보낸 뒤 연결이 끊기면 서버가 받았을 수 있음 - 연결 오류(재시도 대상)로 보면 안 됨
+        stub = _StubSMTPServer(after_data='drop')
+        server = self._connect(stub)
+        timings = {}
+
+        with self.assertRaises(app.DeliveryUnknownError) as caught:
+            app.send_message_timed(server, _message(), ['you@example.com'], timings)
+
+        self.assertTrue(timings['data_done'])
+        self.assertFalse(app.is_connection_error(caught.exception))
+
+    def test_message_over_advertised_size_is_not_uploaded(self):
+        stub = _StubSMTPServer(extensions=['SIZE 100'])
+        server = self._connect(stub)
+
+        with self.assertRaises(app.MessageTooLargeError) as caught:
+            app.send_message_timed(server, _message('x' * 500), ['you@example.com'])
+
+        self.assertEqual(caught.exception.limit, 100)
+        self.assertFalse(any(command.upper().startswith('MAIL') for command in stub.commands))
+
+    def test_size_parameter_is_declared(self):
+        stub = _StubSMTPServer(extensions=['SIZE 1000000'])
+        server = self._connect(stub)
+
+        app.send_message_timed(server, _message(), ['you@example.com'])
+
+        mail = next(command for command in stub.commands if command.upper().startswith('MAIL'))
+        self.assertRegex(mail, r'(?i)size=\d+$')
+
+    def test_pipelining_sends_envelope_in_one_batch(self):
+        stub = _StubSMTPServer(extensions=['PIPELINING'], refuse=['bad@example.com'])
+        self.addCleanup(stub.close)
+        # 응답을 기다리며 하나씩 보내면 스텁이 응답하지 않아 2초 뒤 실패
+        server = smtplib.SMTP('127.0.0.1', stub.port, timeout=2)
+        self.addCleanup(server.close)
+
+        refused = app.send_message_timed(
+            server, _message(), ['you@example.com', 'bad@example.com', 'other@example.com'])
+
+        self.assertEqual(list(refused), ['bad@example.com'])
+        self.assertEqual(refused['bad@example.com'][0], 550)
+        self.assertIsNotNone(stub.message)
+
+    def test_pipelining_all_refused_drops_accepted_data(self):
+        # 모든 수신자가 거부됐는데 DATA가 354로 수락됨 - 빈 메일이 가지 않도록 연결을 버림
+        stub = _StubSMTPServer(extensions=['PIPELINING'], refuse=['bad@example.com'])
+        server = self._connect(stub)
+
+        with self.assertRaises(smtplib.SMTPRecipientsRefused):
+            app.send_message_timed(server, _message(), ['bad@example.com'])
+
+        self.assertIsNone(server.sock)
+        self.assertIsNone(stub.message)
+
+
+if __name__ == '__main__':
+    unittest.main()
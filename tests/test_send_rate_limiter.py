@@ -0,0 +1,96 @@
+"""TokenBucket / SendRateLimiter 테스트 (분당 메시지 버킷, 일일 수신자 한도 차지·반환)"""
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pdf_email_sender_gui as app  # noqa: E402
+
+
+class TokenBucketTest(unittest.TestCase):
+
+    def test_wait_time_and_refill(self):
+        bucket = app.TokenBucket(2, 1.0)  # 2개까지, 초당 1개
+        now = bucket.updated
+        self.assertEqual(bucket.wait_time(2, now), 0.0)
+        bucket.consume(2, now)
+        self.assertAlmostEqual(bucket.wait_time(1, now), 1.0)
+        self.assertAlmostEqual(bucket.wait_time(1, now + 0.5), 0.5)
+        self.assertEqual(bucket.wait_time(1, now + 1.0), 0.0)
+
+    def test_request_larger_than_capacity_waits_for_full_bucket(self):
+        bucket = app.TokenBucket(10, 5.0)
+        now = bucket.updated
+        bucket.consume(10, now)
+        # 버킷보다 큰 요청은 가득 찼을 때(2초 뒤) 허용 - 영원히 기다리지 않음
+        self.assertAlmostEqual(bucket.wait_time(100, now), 2.0)
+
+
+class SendRateLimiterTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = app.SendQuotaStore(Path(self.tmp.name) / 'quota.json')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _limiter(self, **profile):
+        return app.SendRateLimiter('me@example.com', profile, self.store)
+
+    def test_reserve_holds_quota_until_release(self):
+        limiter = self._limiter(recipients_per_day=10)
+        self.assertEqual(limiter.reserve(6, 0), 0.0)
+        self.assertEqual(limiter.remaining_recipients_today(), 4)
+        # 차지한 만큼 빼고 계산하므로 남은 4명을 넘는 요청은 거부
+        self.assertIsNone(limiter.reserve(5, 0))
+
+        limiter.record_sent(6, 0)
+        limiter.release(6)
+        self.assertEqual(limiter.remaining_recipients_today(), 4)
+        self.assertEqual(limiter.reserved, 0)
+
+    def test_failed_send_returns_reserved_quota(self):
+        limiter = self._limiter(recipients_per_day=10)
+        limiter.reserve(8, 0)
+        limiter.release(8)  # 보내지 못함 - record_sent 없이 반환
+        self.assertEqual(limiter.remaining_recipients_today(), 10)
+
+    def test_concurrent_reserves_do_not_exceed_daily_limit(self):
+        limiter = self._limiter(recipients_per_day=10)
+        results = []
+        barrier = threading.Barrier(8)
+
+        def worker():
+            barrier.wait()
+            results.append(limiter.reserve(3, 0))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results.count(0.0), 3)
+        self.assertEqual(results.count(None), 5)
+        self.assertEqual(limiter.reserved, 9)
+
+    def test_message_bucket_delays_without_reserving(self):
+        limiter = self._limiter(recipients_per_day=10, messages_per_minute=60, burst=1)
+        self.assertEqual(limiter.reserve(1, 0), 0.0)
+        wait = limiter.reserve(1, 0)
+        self.assertGreater(wait, 0.0)
+        # 기다려야 하는 경우에는 한도를 차지하지 않음
+        self.assertEqual(limiter.reserved, 1)
+
+    def test_acquire_fails_when_daily_limit_is_used_up(self):
+        limiter = self._limiter(recipients_per_day=5)
+        self.store.add('me@example.com', 5, 0)
+        self.assertFalse(limiter.acquire(1, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+"""SenderAccountPool 계정 선택 테스트
+
+한도가 바닥난 계정과 서버 차단기가 열린 계정이 섞여 있을 때
+'blocked' 판정과 포기 시점 계산이 차단기가 열린 계정만 보고 이루어지는지 확인합니다.
+"""
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pdf_email_sender_gui as app  # noqa: E402
+
+
+class SenderAccountPoolBlockedTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.quota_store = app.SendQuotaStore(Path(self.tmp.name) / 'quota.json')
+        self.pool = app.SenderAccountPool()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _add(self, email, breaker, daily_limit=10):
+        profile = {'recipients_per_day': daily_limit, 'max_connections': 1}
+        limiter = app.SendRateLimiter(email, profile, self.quota_store)
+        account = self.pool.add({'sender_email': email}, limiter)
+        account['breaker'] = breaker
+        return account
+
+    def test_exhausted_account_does_not_mask_open_circuit(self):
+        # a: 한도 바닥 (차단기는 닫혀 있음), b: 한도는 남았지만 서버 장애로 차단기가 열림
+        closed = app.CircuitBreaker('smtp.a', failure_threshold=1)
+        opened = app.CircuitBreaker('smtp.b', failure_threshold=1, probe_interval=60)
+        self._add('a@example.com', closed)
+        self._add('b@example.com', opened)
+        self.quota_store.add('a@example.com', 10, 0)
+        opened.record_failure()
+        opened.opened_at = time.monotonic() - 700  # 장애가 포기 시간(600초)보다 오래 이어짐
+
+        account, state = self.pool.select(1, 1000)
+        self.assertIsNone(account)
+        self.assertEqual(state, 'blocked')
+
+        breakers = self.pool.blocked_breakers(1, 1000)
+        self.assertEqual(breakers, [opened])
+        self.assertGreaterEqual(min(b.outage_duration() for b in breakers), 600)
+        self.assertGreater(min(b.retry_in() for b in breakers), 0)
+
+    def test_pinned_account_only(self):
+        opened = app.CircuitBreaker('smtp.b', failure_threshold=1)
+        self._add('a@example.com', app.CircuitBreaker('smtp.a'))
+        self._add('b@example.com', opened)
+        opened.record_failure()
+
+        self.assertEqual(self.pool.blocked_breakers(1, 1000, pinned='a@example.com'), [])
+        self.assertEqual(self.pool.blocked_breakers(1, 1000, pinned='b@example.com'), [opened])
+
+
+if __name__ == '__main__':
+    unittest.main()
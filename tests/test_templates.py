@@ -0,0 +1,131 @@
+"""양식 분석·렌더링 테스트 (parse_template, CompiledTemplate, RenderContext, render_batch)"""
+import sys
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pdf_email_sender_gui as app  # noqa: E402
+
+NOW = datetime(2024, 1, 15, 9, 30, 0)
+
+
+class ParseTemplateTest(unittest.TestCase):
+
+    def test_nodes(self):
+        nodes = app.parse_template("안녕 {회사명}{#반복 파일}- {파일명}{/반복}{#만약 !여러파일}1개{#아니면}여러 개{/만약}")
+        self.assertEqual(nodes, [
+            "안녕 ", ('var', '회사명'),
+            ['loop', '파일', ["- ", ('var', '파일명')]],
+            ['if', '여러파일', True, ["1개"], ["여러 개"]],
+        ])
+
+    def test_syntax_errors(self):
+        for text in ("{#반복 파일}열고 닫지 않음",
+                     "{/반복}",
+                     "{#반복 파일}{/만약}",
+                     "{#만약 조건}a{#아니면}b{#아니면}c{/만약}",
+                     "{#아니면}",
+                     "{#반복}"):
+            with self.subTest(text=text):
+                with self.assertRaises(app.TemplateSyntaxError):
+                    app.parse_template(text)
+
+    def test_compile_template_is_cached(self):
+        self.assertIs(app.compile_template("{회사명} 캐시"), app.compile_template("{회사명} 캐시"))
+
+
+class CompiledTemplateTest(unittest.TestCase):
+
+    def test_unknown_variable_is_left_as_is(self):
+        self.assertEqual(app.CompiledTemplate("{회사명} {없음}").render({'회사명': 'A사'}),
+                         "A사 {없음}")
+
+    def test_values_are_inserted_literally(self):
+        # 한 번만 훑으므로 값 안의 {이름}은 다시 치환하지 않음 (예전 str.replace 연쇄와 다름)
+        values = {'인사': "{회사명} 귀중", '회사명': 'A사'}
+        self.assertEqual(app.CompiledTemplate("{인사}").render(values), "{회사명} 귀중")
+
+    def test_conditions_and_loops(self):
+        template = app.CompiledTemplate("{#만약 메모}메모: {메모}{#아니면}메모 없음{/만약}"
+                                        "{#반복 목록}[{번호}:{회사명}]{/반복}")
+        self.assertEqual(template.render({'메모': '', '목록': [], '회사명': 'A사'}), "메모 없음")
+        self.assertEqual(template.render({'메모': '0'}), "메모 없음")
+        # 반복 항목에 없는 이름은 바깥 값을 씀
+        self.assertEqual(template.render({'메모': '급함', '회사명': 'A사',
+                                          '목록': [{'번호': '1'}, {'번호': '2', '회사명': 'B사'}]}),
+                         "메모: 급함[1:A사][2:B사]")
+
+    def test_bind_fills_constants_and_folds_conditions(self):
+        template = app.CompiledTemplate("{날짜} {#만약 사내}내부용{#아니면}{회사명}{/만약}")
+        bound = template.bind({'날짜': '2024-01-15', '사내': ''})
+        self.assertEqual(bound.variables, {'회사명'})
+        self.assertEqual(bound.render({'회사명': 'A사'}), "2024-01-15 A사")
+        self.assertIs(template.bind({'없는변수': 1}), template)
+
+    def test_render_context_does_not_expand_variables_in_values(self):
+        context = app.RenderContext(NOW, {'서명': "{날짜} 발송팀"})
+        self.assertEqual(context.render("{서명} / {날짜}", 'A사'), "{날짜} 발송팀 / 2024-01-15")
+
+
+class RenderContextTest(unittest.TestCase):
+
+    def test_custom_variables_cannot_shadow_file_list(self):
+        # 같은 이름의 커스텀·회사 변수가 있어도 {#반복 파일}과 기본 파일 목록은 실제 첨부 파일로
+        context = app.RenderContext(NOW, {'파일': '계약서', '여러파일': ''})
+        pdfs = [Path('a.pdf'), Path('b.pdf')]
+        values = context.values('A사', pdfs, {'파일수': '9'}, file_sizes=[1024, 2048])
+
+        self.assertEqual(app.CompiledTemplate("{#반복 파일}{파일명} {/반복}{파일수}").render(values),
+                         "a.pdf b.pdf 2")
+        body = app.compile_template(app.with_default_file_list("본문")).render(values)
+        self.assertEqual(body, "본문\n\n[첨부 파일]\n- a.pdf\n- b.pdf")
+
+    def test_company_variables_override_custom_ones(self):
+        context = app.RenderContext(NOW, {'호칭': '담당자님'})
+        self.assertEqual(context.render("{호칭}", 'A사', company_vars={'호칭': '김부장님'}), "김부장님")
+        self.assertEqual(context.render("{호칭}", 'B사'), "담당자님")
+
+
+class RenderBatchTest(unittest.TestCase):
+
+    SUBJECT = "[{회사명}] {날짜} 자료"
+    BODY = app.with_default_file_list("{호칭} 안녕하세요. {서명}")
+
+    def _rows(self):
+        return [('A사', [Path('a.pdf')], {'호칭': '김부장님'}),
+                ('B사', [Path('b1.pdf'), Path('b2.pdf')], None)]
+
+    def _expected(self, context):
+        return [(context.render(self.SUBJECT, name, pdfs, company_vars),
+                 context.render(self.BODY, name, pdfs, company_vars))
+                for name, pdfs, company_vars in self._rows()]
+
+    def test_matches_rendering_each_company(self):
+        context = app.RenderContext(NOW, {'호칭': '담당자님', '서명': '발송팀'})
+        rendered = app.render_batch(self.SUBJECT, self.BODY, context, self._rows())
+
+        self.assertEqual(rendered, self._expected(context))
+        self.assertEqual(rendered[0], ("[A사] 2024-01-15 자료", "김부장님 안녕하세요. 발송팀"))
+        self.assertEqual(rendered[1][1],
+                         "담당자님 안녕하세요. 발송팀\n\n[첨부 파일]\n- b1.pdf\n- b2.pdf")
+
+    def test_process_pool_gives_same_result(self):
+        context = app.RenderContext(NOW, {'호칭': '담당자님', '서명': '발송팀'})
+        # CPU가 1개인 환경에서도 여러 프로세스 경로를 타도록
+        with mock.patch.object(app.os, 'cpu_count', return_value=2), \
+                mock.patch.object(app.logging, 'warning') as warning:
+            rendered = app.render_batch(self.SUBJECT, self.BODY, context, self._rows(), process_min=1)
+        warning.assert_not_called()  # 한 프로세스로 되돌아가지 않음
+        self.assertEqual(rendered, self._expected(context))
+
+    def test_syntax_error_is_raised(self):
+        context = app.RenderContext(NOW)
+        with self.assertRaises(app.TemplateSyntaxError):
+            app.render_batch("{#반복 파일}", "본문", context, self._rows())
+
+
+if __name__ == '__main__':
+    unittest.main()